@@ -2,27 +2,77 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
 )
-
-from custom_components.transportation.consts.defaults import DOMAIN, PLATFORMS
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from custom_components.transportation.consts.defaults import (
+    CATALOGUE_FILE,
+    DOMAIN,
+    PLATFORMS,
+    SESSION_STORAGE_KEY,
+    USER_AGENT_FILE,
+)
+from custom_components.transportation.components.catalogue import StationCatalogue
 from custom_components.transportation.core.di import Container
+from custom_components.transportation.utilities.cookie_store import STORAGE_VERSION
+from custom_components.transportation.utilities.safe_request import (
+    async_close_engines,
+    async_sweep_engines,
+    cookie_store,
+    user_agent_pool,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# How often idle browsers and sessions of the shared engines are released
+ENGINE_SWEEP_INTERVAL = timedelta(minutes=5)
+
 container = Container()
 container.wire(modules=[__name__])
 
 
+def station_catalogue(hass: HomeAssistant) -> StationCatalogue:
+    """The shared station catalogue, stored in the Home Assistant config directory."""
+    catalogue = container.station_catalogue()
+    if catalogue.path is None:
+        catalogue.path = hass.config.path(CATALOGUE_FILE)
+
+    return catalogue
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the price tracker component."""
     _LOGGER.debug("Setting up price tracker component {}".format(config))
     hass.data.setdefault(DOMAIN, {})
+    station_catalogue(hass)
+    user_agent_pool().path = hass.config.path(USER_AGENT_FILE)
+    # Logins and cookies survive restarts; private, since they hold credentials
+    await cookie_store().async_attach(
+        Store(hass, STORAGE_VERSION, SESSION_STORAGE_KEY, private=True)
+    )
+
+    async def async_sweep(_now) -> None:
+        await async_sweep_engines()
+
+    cancel_sweep = async_track_time_interval(hass, async_sweep, ENGINE_SWEEP_INTERVAL)
+
+    # Unloading entries is not part of a stop or restart, browsers and
+    # connections would outlive Home Assistant otherwise
+    async def async_stop(_event: Event) -> None:
+        cancel_sweep()
+        await async_close_engines()
+        await cookie_store().async_flush()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop)
 
     return True
 
@@ -72,6 +122,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
+        # Feeds and pooled upstream connections are shared, release them with
+        # the last entry
+        if not hass.data[DOMAIN]:
+            await container.coordinators().async_shutdown()
+            await async_close_engines()
+            await cookie_store().async_flush()
+            await container.station_catalogue().async_close()
+
     return unload_ok
 
 
@@ -0,0 +1,173 @@
+import bisect
+import logging
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from custom_components.transportation.data.transport_card import (
+    CardSnapshot,
+    CardStatus,
+    CardTransaction,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Delayed writes coalesce the updates of every card of a refresh into one write
+SAVE_DELAY = 10
+
+
+def _to_dict(transaction: CardTransaction) -> dict:
+    return {
+        "id": transaction.transaction_id,
+        "used_at": transaction.used_at.isoformat(),
+        "amount": transaction.amount,
+        "location": transaction.location,
+        "balance": transaction.balance,
+    }
+
+
+def _from_dict(data: dict) -> CardTransaction:
+    return CardTransaction(
+        transaction_id=data["id"],
+        used_at=datetime.fromisoformat(data["used_at"]),
+        amount=data["amount"],
+        location=data.get("location"),
+        balance=data.get("balance"),
+    )
+
+
+class CardHistory:
+    """Rolling window of one card's transactions with running totals.
+
+    New transactions are merged in by cursor and old ones expire from the
+    front, so the aggregate costs O(changes) per poll instead of a pass over
+    the full history.
+    """
+
+    def __init__(self, window: timedelta = timedelta(days=30)):
+        self.window = window
+        self._transactions: deque[CardTransaction] = deque()
+        self._ids: set[str] = set()
+        self.use_count = 0
+        self.use_amount = 0
+
+    def __len__(self) -> int:
+        return len(self._transactions)
+
+    @property
+    def cursor(self) -> tuple[datetime, str] | None:
+        """Newest transaction seen, history is only fetched after it."""
+        return self._transactions[-1].cursor if self._transactions else None
+
+    @property
+    def last(self) -> CardTransaction | None:
+        return self._transactions[-1] if self._transactions else None
+
+    def start(self, now: datetime) -> datetime:
+        return now - self.window
+
+    def add(self, transactions: Iterable[CardTransaction]) -> int:
+        """Merge transactions (any order, duplicates ignored), returns how many were new."""
+        added = 0
+        for transaction in sorted(transactions, key=lambda x: x.cursor):
+            if transaction.transaction_id in self._ids:
+                continue
+
+            if not self._transactions or transaction.cursor > self.cursor:
+                self._transactions.append(transaction)
+            else:
+                # Late arrivals (a delayed upstream record) are rare, insert in place
+                items = list(self._transactions)
+                bisect.insort(items, transaction, key=lambda x: x.cursor)
+                self._transactions = deque(items)
+
+            self._ids.add(transaction.transaction_id)
+            self.use_count += 1
+            self.use_amount += transaction.amount
+            added += 1
+
+        return added
+
+    def expire(self, now: datetime) -> int:
+        """Drop transactions older than the window, returns how many were dropped."""
+        start = self.start(now)
+        dropped = 0
+        while self._transactions and self._transactions[0].used_at < start:
+            transaction = self._transactions.popleft()
+            self._ids.discard(transaction.transaction_id)
+            self.use_count -= 1
+            self.use_amount -= transaction.amount
+            dropped += 1
+
+        return dropped
+
+    def snapshot(self, status: CardStatus) -> CardSnapshot:
+        last = self.last
+
+        return CardSnapshot(
+            status=status,
+            use_count=self.use_count,
+            use_amount=self.use_amount,
+            last_used_at=last.used_at if last is not None else None,
+            last_location=last.location if last is not None else None,
+        )
+
+    def to_list(self) -> list[dict]:
+        return [_to_dict(x) for x in self._transactions]
+
+    @staticmethod
+    def from_list(data: list[dict], window: timedelta) -> "CardHistory":
+        history = CardHistory(window)
+        history.add(_from_dict(x) for x in data)
+
+        return history
+
+
+class CardHistories:
+    """Histories of every card of an account, kept across restarts.
+
+    Attached to a Home Assistant Store, a restart resumes from the stored
+    cursors instead of downloading the whole window again.
+    """
+
+    def __init__(self, window: timedelta = timedelta(days=30)):
+        self.window = window
+        self._histories: dict[str, CardHistory] = {}
+        self._store = None
+
+    async def async_attach(self, store):
+        try:
+            data = await store.async_load()
+        except Exception as e:
+            _LOGGER.warning("Ignoring unreadable card history: %s", e)
+            data = None
+
+        for card_number, transactions in (data or {}).get("cards", {}).items():
+            self._histories.setdefault(
+                card_number, CardHistory.from_list(transactions, self.window)
+            )
+        self._store = store
+
+    def get(self, card_number: str) -> CardHistory:
+        if card_number not in self._histories:
+            self._histories[card_number] = CardHistory(self.window)
+
+        return self._histories[card_number]
+
+    def changed(self):
+        if self._store is not None:
+            self._store.async_delay_save(self._data, SAVE_DELAY)
+
+    def _data(self) -> dict:
+        return {
+            "cards": {
+                card_number: history.to_list()
+                for card_number, history in self._histories.items()
+            }
+        }
+
+    async def async_flush(self):
+        if self._store is not None:
+            await self._store.async_save(self._data())
@@ -0,0 +1,311 @@
+import asyncio
+import dataclasses
+import logging
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+from typing import Awaitable, Callable, Iterable
+
+from custom_components.transportation.data.address import AddressData
+from custom_components.transportation.data.geo import Point
+from custom_components.transportation.data.id import StationId
+from custom_components.transportation.data.station import StationRecord
+from custom_components.transportation.utilities.search_index import SearchIndex
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bump when the table layout changes; an outdated file is rebuilt by a full sync
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stations (
+    id TEXT PRIMARY KEY,
+    country_code TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    code TEXT NOT NULL,
+    name TEXT NOT NULL,
+    address_country_code TEXT,
+    address_primary TEXT,
+    address_secondary TEXT,
+    address_postal_code TEXT,
+    latitude REAL,
+    longitude REAL
+);
+CREATE INDEX IF NOT EXISTS stations_provider ON stations (provider);
+CREATE TABLE IF NOT EXISTS sync_state (
+    provider TEXT PRIMARY KEY,
+    version TEXT,
+    synced_at REAL NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "id, country_code, provider, code, name, address_country_code, "
+    "address_primary, address_secondary, address_postal_code, latitude, longitude"
+)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CatalogueDelta:
+    """Changes of one provider since a version, as returned by the upstream."""
+
+    version: str | None
+    upserts: list[StationRecord] = dataclasses.field(default_factory=list)
+    deletions: list[StationId] = dataclasses.field(default_factory=list)
+    # False when the upstream pages its changes and more follow after version
+    complete: bool = True
+
+
+# Fetches the changes after a version (None: everything) of one provider
+DeltaFetcher = Callable[[str | None], Awaitable[CatalogueDelta]]
+
+
+def _to_row(record: StationRecord) -> tuple:
+    address, point = record.address, record.point
+
+    return (
+        str(record.station_id),
+        record.station_id.country_code,
+        record.station_id.provider,
+        record.station_id.code,
+        record.name,
+        address.country_code if address else None,
+        address.primary if address else None,
+        address.secondary if address else None,
+        address.postal_code if address else None,
+        point.latitude if point else None,
+        point.longitude if point else None,
+    )
+
+
+def _from_row(row: tuple) -> StationRecord:
+    return StationRecord(
+        station_id=StationId(row[1], row[2], row[3]),
+        name=row[4],
+        address=(
+            AddressData(row[5], row[6], row[7], row[8]) if row[6] is not None else None
+        ),
+        point=Point(row[9], row[10]) if row[9] is not None else None,
+    )
+
+
+def _build_index(records: list[StationRecord]) -> SearchIndex:
+    index = SearchIndex()
+    for record in records:
+        # Stop numbers are searched as often as names
+        index.add(str(record.station_id), record.name, record.station_id.code)
+
+    return index.build()
+
+
+class StationCatalogue:
+    """Station metadata persisted in SQLite, kept current by incremental syncs.
+
+    Startup reads the local file; the upstream is only asked for what changed
+    since the stored version, at most once per min_sync_interval.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        min_sync_interval: timedelta = timedelta(hours=24),
+        max_pages: int = 100,
+    ):
+        self._path = path
+        self._min_sync_interval = min_sync_interval
+        self._max_pages = max_pages
+        self._connection: sqlite3.Connection | None = None
+        # The connection is used from executor threads, one at a time
+        self._lock = threading.Lock()
+        self._sync_locks: dict[str, asyncio.Lock] = {}
+        self._indexes: dict[str, SearchIndex] = {}
+
+    @property
+    def path(self) -> str | None:
+        return self._path
+
+    @path.setter
+    def path(self, path: str | None):
+        """Database file; an open connection to another file is closed first."""
+        if path != self._path:
+            self.close()
+            self._path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+        if self._path is None:
+            raise RuntimeError("Station catalogue path is not set")
+
+        connection = sqlite3.connect(self._path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+
+        (version,) = connection.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            _LOGGER.debug(
+                "Rebuilding station catalogue %s (schema %s)", self._path, version
+            )
+            with connection:
+                connection.execute("DROP TABLE IF EXISTS stations")
+                connection.execute("DROP TABLE IF EXISTS sync_state")
+            connection.executescript(_SCHEMA)
+            connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+        self._connection = connection
+
+        return connection
+
+    def get(self, station_id: StationId) -> StationRecord | None:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    f"SELECT {_COLUMNS} FROM stations WHERE id = ?", (str(station_id),)
+                )
+                .fetchone()
+            )
+
+        return _from_row(row) if row is not None else None
+
+    def get_many(self, station_ids: Iterable[StationId]) -> dict[str, StationRecord]:
+        ids = [str(x) for x in station_ids]
+        found = {}
+
+        with self._lock:
+            connection = self._connect()
+            # Stay below SQLite's bound parameter limit
+            for i in range(0, len(ids), 500):
+                chunk = ids[i : i + 500]
+                rows = connection.execute(
+                    f"SELECT {_COLUMNS} FROM stations "
+                    f"WHERE id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for row in rows:
+                    found[row[0]] = _from_row(row)
+
+        return found
+
+    def stations(self, provider: str | None = None) -> list[StationRecord]:
+        with self._lock:
+            connection = self._connect()
+            if provider is None:
+                rows = connection.execute(f"SELECT {_COLUMNS} FROM stations")
+            else:
+                rows = connection.execute(
+                    f"SELECT {_COLUMNS} FROM stations WHERE provider = ?", (provider,)
+                )
+            rows = rows.fetchall()
+
+        return [_from_row(x) for x in rows]
+
+    def sync_state(self, provider: str) -> tuple[str | None, float | None]:
+        """Stored (version, synced at unix time) of a provider."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT version, synced_at FROM sync_state WHERE provider = ?",
+                    (provider,),
+                )
+                .fetchone()
+            )
+
+        return (row[0], row[1]) if row is not None else (None, None)
+
+    def apply(self, provider: str, delta: CatalogueDelta) -> int:
+        """Write a delta and its version in one transaction, returns rows changed."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    f"INSERT OR REPLACE INTO stations ({_COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [_to_row(x) for x in delta.upserts],
+                )
+                connection.executemany(
+                    "DELETE FROM stations WHERE id = ?",
+                    [(str(x),) for x in delta.deletions],
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO sync_state (provider, version, synced_at) "
+                    "VALUES (?, ?, ?)",
+                    (provider, delta.version, time.time()),
+                )
+
+        if len(delta.upserts) > 0 or len(delta.deletions) > 0:
+            self._indexes.pop(provider, None)
+
+        return len(delta.upserts) + len(delta.deletions)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    async def async_get(self, station_id: StationId) -> StationRecord | None:
+        return await asyncio.to_thread(self.get, station_id)
+
+    async def async_get_many(
+        self, station_ids: Iterable[StationId]
+    ) -> dict[str, StationRecord]:
+        return await asyncio.to_thread(self.get_many, list(station_ids))
+
+    async def async_stations(self, provider: str | None = None) -> list[StationRecord]:
+        return await asyncio.to_thread(self.stations, provider)
+
+    async def async_search_index(self, provider: str) -> SearchIndex:
+        """Name index of a provider's stations, rebuilt once a sync changes them."""
+        index = self._indexes.get(provider)
+        if index is None:
+            records = await self.async_stations(provider)
+            index = await asyncio.to_thread(_build_index, records)
+            self._indexes[provider] = index
+
+        return index
+
+    async def async_sync(
+        self, provider: str, fetcher: DeltaFetcher, force: bool = False
+    ) -> int:
+        """Pull the provider's changes since the stored version, returns rows changed."""
+        lock = self._sync_locks.setdefault(provider, asyncio.Lock())
+
+        async with lock:
+            version, synced_at = await asyncio.to_thread(self.sync_state, provider)
+            if (
+                not force
+                and synced_at is not None
+                and time.time() - synced_at < self._min_sync_interval.total_seconds()
+            ):
+                return 0
+
+            changed = 0
+            for _ in range(self._max_pages):
+                delta = await fetcher(version)
+                changed += await asyncio.to_thread(self.apply, provider, delta)
+
+                # A page that does not move the version would loop forever
+                if delta.complete or delta.version == version:
+                    break
+                version = delta.version
+            else:
+                _LOGGER.warning(
+                    "Station catalogue sync of %s stopped after %s pages",
+                    provider,
+                    self._max_pages,
+                )
+
+            _LOGGER.debug(
+                "Station catalogue of %s synced to %s (%s changes)",
+                provider,
+                delta.version,
+                changed,
+            )
+
+            return changed
+
+    async def async_close(self):
+        await asyncio.to_thread(self.close)
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Any, Awaitable, Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from custom_components.transportation.components.polling import (
+    AdaptivePolling,
+    ArrivalSnapshot,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Fetches many station/route ids in one upstream call, returning id -> value
+BatchFetcher = Callable[[list[str]], Awaitable[dict[str, Any]]]
+
+# Maps one polled value to what the adaptive polling policy looks at
+SnapshotFactory = Callable[[Any], ArrivalSnapshot]
+
+# Refresh requests are collected this long (seconds), so entities added
+# together subscribe before the refresh and are fetched in one batch
+REQUEST_REFRESH_DELAY = 1.0
+
+
+class TransportationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Polls one upstream feed for every subscribed station/route id, in batches."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        fetcher: BatchFetcher,
+        update_interval: timedelta,
+        batch_size: int = 20,
+        polling: AdaptivePolling | None = None,
+        snapshot: SnapshotFactory | None = None,
+    ):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=name,
+            update_interval=update_interval,
+            # Not immediate: HA's default would refresh for the first
+            # entity alone and the others only after its 10 s cooldown
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_DELAY,
+                immediate=False,
+            ),
+        )
+        self._fetcher = fetcher
+        self._batch_size = batch_size
+        self._polling = polling
+        self._snapshot = snapshot
+        self.changed_ids: set[str] = set()
+
+    def subscribed_ids(self) -> list[str]:
+        # Entities subscribe with their id as listener context
+        return sorted({str(x) for x in self.async_contexts() if x is not None})
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        ids = self.subscribed_ids()
+        previous = self.data or {}
+
+        if len(ids) == 0:
+            self.changed_ids = set()
+            self._adapt_interval({}, 0)
+            return {}
+
+        batches = [
+            ids[i : i + self._batch_size] for i in range(0, len(ids), self._batch_size)
+        ]
+        results = await asyncio.gather(
+            *[self._fetcher(batch) for batch in batches], return_exceptions=True
+        )
+
+        data = {}
+        errors = []
+        for result in results:
+            if isinstance(result, Exception):
+                errors.append(result)
+            else:
+                data.update(result)
+
+        if len(errors) > 0 and len(data) == 0:
+            raise UpdateFailed(f"Failed to update {self.name}: {errors[0]}")
+
+        for error in errors:
+            _LOGGER.debug("Partial update failure of %s: %s", self.name, error)
+
+        # Ids of a failed batch keep their last known value
+        for item_id in ids:
+            if item_id not in data and item_id in previous:
+                data[item_id] = previous[item_id]
+
+        self.changed_ids = {
+            item_id
+            for item_id in set(data) | set(previous)
+            if data.get(item_id) != previous.get(item_id)
+        }
+        self._adapt_interval(data, len(batches))
+
+        return data
+
+    def _adapt_interval(self, data: dict[str, Any], requests_per_refresh: int):
+        if self._polling is None or self._snapshot is None:
+            return
+
+        self.update_interval = self._polling.interval(
+            self.name,
+            [self._snapshot(x) for x in data.values()],
+            requests_per_refresh,
+        )
+
+    async def async_shutdown(self) -> None:
+        if self._polling is not None:
+            self._polling.release(self.name)
+
+        await super().async_shutdown()
+
+
+class TransportationCoordinators:
+    """One coordinator per provider feed, shared by every config entry."""
+
+    def __init__(self):
+        self._coordinators: dict[str, TransportationCoordinator] = {}
+
+    def get(self, key: str) -> TransportationCoordinator | None:
+        return self._coordinators.get(key)
+
+    def get_or_create(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        fetcher: BatchFetcher,
+        update_interval: timedelta,
+        batch_size: int = 20,
+        polling: AdaptivePolling | None = None,
+        snapshot: SnapshotFactory | None = None,
+    ) -> TransportationCoordinator:
+        if key not in self._coordinators:
+            self._coordinators[key] = TransportationCoordinator(
+                hass,
+                name=key,
+                fetcher=fetcher,
+                update_interval=update_interval,
+                batch_size=batch_size,
+                polling=polling,
+                snapshot=snapshot,
+            )
+
+        return self._coordinators[key]
+
+    async def async_shutdown(self):
+        coordinators = list(self._coordinators.values())
+        self._coordinators = {}
+
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
@@ -0,0 +1,119 @@
+import dataclasses
+from datetime import datetime, time, timedelta
+from enum import Enum
+from typing import Iterable
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.transportation.data.bus import BusStatus
+from custom_components.transportation.data.railway import RailwayStatus
+
+# Statuses for which nothing is expected to move soon
+IDLE_STATUSES: frozenset[Enum] = frozenset(
+    {
+        BusStatus.NO_DATA,
+        RailwayStatus.NO_DATA,
+        RailwayStatus.CANCELLED,
+    }
+)
+
+
+@dataclasses.dataclass
+class ArrivalSnapshot:
+    """What the polling policy needs to know about one polled item."""
+
+    status: Enum | None = None
+    seconds_to_arrival: float | None = None
+
+
+class PollingBudget:
+    """Global upstream request budget shared by every adaptive coordinator."""
+
+    def __init__(self, requests_per_hour: int = 3600):
+        self.requests_per_hour = requests_per_hour
+        self._demand: dict[str, float] = {}
+
+    def scale(self, key: str, requests_per_refresh: int, interval: timedelta) -> float:
+        """Factor to stretch the interval by so the total demand fits the budget."""
+        self._demand[key] = requests_per_refresh * 3600 / interval.total_seconds()
+        demand = sum(self._demand.values())
+
+        return max(1.0, demand / self.requests_per_hour)
+
+    def release(self, key: str):
+        self._demand.pop(key, None)
+
+    @property
+    def demand(self) -> float:
+        return sum(self._demand.values())
+
+
+class AdaptivePolling:
+    """Poll fast while a vehicle is approaching, slowly when idle or at night."""
+
+    def __init__(
+        self,
+        budget: PollingBudget | None = None,
+        min_interval: timedelta = timedelta(seconds=15),
+        idle_interval: timedelta = timedelta(minutes=5),
+        off_service_interval: timedelta = timedelta(minutes=30),
+        service_start: time = time(4, 30),
+        service_end: time = time(1, 0),
+        proximity_factor: float = 0.25,
+    ):
+        self._budget = budget
+        self._min_interval = min_interval
+        self._idle_interval = idle_interval
+        self._off_service_interval = off_service_interval
+        self._service_start = service_start
+        self._service_end = service_end
+        self._proximity_factor = proximity_factor
+
+    def in_service(self, now: datetime) -> bool:
+        current = now.time()
+        if self._service_start <= self._service_end:
+            return self._service_start <= current < self._service_end
+
+        # Service running past midnight
+        return current >= self._service_start or current < self._service_end
+
+    def base_interval(
+        self, snapshots: Iterable[ArrivalSnapshot], now: datetime
+    ) -> timedelta:
+        if not self.in_service(now):
+            return self._off_service_interval
+
+        arrivals = [
+            x.seconds_to_arrival
+            for x in snapshots
+            if x.status not in IDLE_STATUSES and x.seconds_to_arrival is not None
+        ]
+        if len(arrivals) == 0:
+            return self._idle_interval
+
+        # Re-poll after a fraction of the time left until the nearest arrival
+        interval = timedelta(seconds=max(0.0, min(arrivals)) * self._proximity_factor)
+
+        return min(max(interval, self._min_interval), self._idle_interval)
+
+    def interval(
+        self,
+        key: str,
+        snapshots: Iterable[ArrivalSnapshot],
+        requests_per_refresh: int = 1,
+        now: datetime | None = None,
+    ) -> timedelta:
+        interval = self.base_interval(snapshots, now or dt_util.now())
+
+        if self._budget is None:
+            return interval
+
+        if requests_per_refresh == 0:
+            self._budget.release(key)
+            return interval
+
+        return interval * self._budget.scale(key, requests_per_refresh, interval)
+
+    def release(self, key: str):
+        if self._budget is not None:
+            self._budget.release(key)
@@ -1,5 +1,46 @@
+from typing import Any
+
 from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from custom_components.transportation.components.coordinator import (
+    TransportationCoordinator,
+)
 
 
 class TransportationSensor(SensorEntity):
     """Representation of a Transportation Sensor."""
+
+
+class TransportationCoordinatorSensor(
+    CoordinatorEntity[TransportationCoordinator], TransportationSensor
+):
+    """Sensor fed by a shared feed coordinator, keyed by a station/route id."""
+
+    def __init__(self, coordinator: TransportationCoordinator, item_id: str):
+        super().__init__(coordinator, context=item_id)
+        self._item_id = item_id
+        self._written_available: bool | None = None
+
+    @property
+    def item(self) -> Any:
+        return (self.coordinator.data or {}).get(self._item_id)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # The coordinator's debouncer is not immediate: entities added together
+        # have all subscribed when it refreshes, and are fetched in one batch
+        await self.coordinator.async_request_refresh()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Only write state when this entity's value or availability changed
+        if (
+            self._item_id not in self.coordinator.changed_ids
+            and self._written_available == self.available
+        ):
+            return
+
+        self._written_available = self.available
+        self.async_write_ha_state()
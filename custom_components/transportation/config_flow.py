@@ -1,19 +1,89 @@
+import abc
 import logging
 
 import voluptuous
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant, callback
 
-from custom_components.transportation.consts.configs import CONF_SETUP_COUNTRY_INPUT, CONF_SETUP_SERVICE_INPUT
+from custom_components.transportation import station_catalogue
+from custom_components.transportation.consts.configs import (
+    CONF_SETUP_COUNTRY_INPUT,
+    CONF_SETUP_SERVICE_INPUT,
+    CONF_STATION_INPUT,
+    CONF_STATION_QUERY_INPUT,
+)
 from custom_components.transportation.consts.defaults import DOMAIN
-from custom_components.transportation.services.setup import country_list, country_name
-from custom_components.transportation.utilities.list import Lu
+from custom_components.transportation.consts.service import CARD_SERVICES
+from custom_components.transportation.data.id import StationId
+from custom_components.transportation.services.public_transportation.adapter.tmoney.api import (
+    TmoneyApi,
+    TmoneyAuthError,
+    TmoneyError,
+)
+from custom_components.transportation.services.setup import (
+    country_choices,
+    service_choices,
+    service_name,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+STATION_SEARCH_LIMIT = 20
 
-class TransportationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
+
+async def async_station_choices(
+        hass: HomeAssistant, provider: str, query: str, limit: int = STATION_SEARCH_LIMIT
+) -> dict[str, str]:
+    """Best matching stations of a provider as station id -> label."""
+    index = await station_catalogue(hass).async_search_index(provider)
+
+    return {
+        station_id: "{} ({})".format(name, StationId.from_str(station_id).code)
+        for station_id, name in index.search_names(query, limit)
+    }
+
+
+class StationSearchFlow(abc.ABC):
+    """Search-then-pick station step, shared by the config and options flows."""
+
+    _provider: str | None = None
+
+    async def async_step_select_station(self, user_input: dict = None):
+        errors = {}
+        input_form = user_input or {}
+
+        if CONF_STATION_INPUT in input_form:
+            return await self._async_station_selected(input_form[CONF_STATION_INPUT])
+
+        query = input_form.get(CONF_STATION_QUERY_INPUT, "")
+        schema = {
+            voluptuous.Required(CONF_STATION_QUERY_INPUT, default=query): str
+        }
+
+        if query:
+            choices = await async_station_choices(self.hass, self._provider, query)
+            if choices:
+                schema[voluptuous.Optional(CONF_STATION_INPUT)] = voluptuous.In(choices)
+            else:
+                errors["base"] = "no_search_results"
+
+        return self.async_show_form(
+            step_id="select_station",
+            data_schema=voluptuous.Schema(schema),
+            errors=errors
+        )
+
+    @abc.abstractmethod
+    async def _async_station_selected(self, station_id: str):
+        """Finish the flow with the picked station id."""
+
+
+class TransportationConfigFlow(StationSearchFlow, config_entries.ConfigFlow, domain=DOMAIN):
+
+    def __init__(self):
+        self._country: str | None = None
 
     async def async_step_reconfigure(self, user_input: dict = None):
         pass
@@ -40,22 +110,23 @@ class TransportationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return await self.async_step_select_country_service(user_input=user_input)
 
     async def async_step_select_country_service(self, user_input: dict = None):
-        """Select support country"""
-        errors = {}
+        """Select support country, then one of its services"""
         schema = {}
         input_form = user_input or {}
+
+        # The country form submits the country alone, keep it for the service form
+        if CONF_SETUP_COUNTRY_INPUT in input_form:
+            self._country = input_form[CONF_SETUP_COUNTRY_INPUT]
+
         # Step - Select Country
-        if CONF_SETUP_COUNTRY_INPUT not in input_form:
+        if self._country is None:
             schema = {
                 **schema,
                 **{
                     voluptuous.Required(
                         schema=CONF_SETUP_COUNTRY_INPUT,
                         msg="Please select a country",
-                        default=input_form.get(CONF_SETUP_COUNTRY_INPUT, None)
-                    ): voluptuous.In(Lu.map(country_list(), lambda country: {
-                        country: country_name(country)
-                    }))
+                    ): voluptuous.In(country_choices())
                 }
             }
 
@@ -66,16 +137,17 @@ class TransportationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # Step - Select Service
         if CONF_SETUP_SERVICE_INPUT not in input_form:
+            services = service_choices(self._country)
+            if len(services) == 0:
+                return self.async_abort(reason="no_services")
+
             schema = {
                 **schema,
                 **{
                     voluptuous.Required(
                         schema=CONF_SETUP_SERVICE_INPUT,
                         msg="Please select a service for the country.",
-                        default=input_form.get(CONF_SETUP_SERVICE_INPUT, None)
-                    ): voluptuous.In(Lu.map(country_list(), lambda country: {
-                        country: country_name(country)
-                    }))
+                    ): voluptuous.In(services)
                 }
             }
 
@@ -85,13 +157,87 @@ class TransportationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
         # Step - Go to setup
-        return self.async_step_service_setup()
+        self._provider = input_form[CONF_SETUP_SERVICE_INPUT]
+
+        if self._provider in CARD_SERVICES:
+            return await self.async_step_card_login()
+
+        return await self.async_step_service_setup()
+
+    async def async_step_card_login(self, user_input: dict = None):
+        """Transport card account; the login is checked by listing its cards"""
+        errors = {}
+        input_form = user_input or {}
+
+        if CONF_USERNAME in input_form and CONF_PASSWORD in input_form:
+            username = input_form[CONF_USERNAME]
+            await self.async_set_unique_id(f"{self._provider}_{username}")
+            self._abort_if_unique_id_configured()
+
+            try:
+                cards = await TmoneyApi(username, input_form[CONF_PASSWORD]).async_cards()
+            except TmoneyAuthError:
+                errors["base"] = "invalid_auth"
+            except TmoneyError as e:
+                _LOGGER.debug("Failed to list the cards of %s: %s", username, e)
+                errors["base"] = "cannot_connect"
+            else:
+                if len(cards) == 0:
+                    errors["base"] = "no_cards"
+                else:
+                    return self.async_create_entry(
+                        title="{} - {}".format(service_name(self._provider), username),
+                        data={
+                            CONF_SETUP_COUNTRY_INPUT: self._country,
+                            CONF_SETUP_SERVICE_INPUT: self._provider,
+                            CONF_USERNAME: username,
+                            CONF_PASSWORD: input_form[CONF_PASSWORD],
+                        }
+                    )
+
+        return self.async_show_form(
+            step_id="card_login",
+            data_schema=voluptuous.Schema(
+                {
+                    voluptuous.Required(
+                        CONF_USERNAME, default=input_form.get(CONF_USERNAME, "")
+                    ): str,
+                    voluptuous.Required(CONF_PASSWORD): str,
+                }
+            ),
+            errors=errors
+        )
 
     async def async_step_service_setup(self):
 
-        pass
+        return await self.async_step_select_station()
+
+    async def _async_station_selected(self, station_id: str):
+        return self.async_create_entry(
+            title=station_id,
+            data={
+                CONF_SETUP_COUNTRY_INPUT: self._country,
+                CONF_SETUP_SERVICE_INPUT: self._provider,
+                CONF_STATION_INPUT: station_id,
+            }
+        )
 
 
-class TransportationOptionsFlowHandler(config_entries.OptionsFlow):
+class TransportationOptionsFlowHandler(StationSearchFlow, config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         self.config_entry: config_entries.ConfigEntry = config_entry
+
+    async def async_step_init(self, user_input: dict = None):
+        self._provider = self.config_entry.data.get(CONF_SETUP_SERVICE_INPUT)
+
+        # Card accounts have no station to pick
+        if self._provider in CARD_SERVICES:
+            return self.async_abort(reason="no_options")
+
+        return await self.async_step_select_station(user_input)
+
+    async def _async_station_selected(self, station_id: str):
+        return self.async_create_entry(
+            title="",
+            data={**self.config_entry.options, CONF_STATION_INPUT: station_id}
+        )
@@ -1,2 +1,4 @@
 CONF_SETUP_COUNTRY_INPUT = "country_input"
 CONF_SETUP_SERVICE_INPUT = "service_input"
+CONF_STATION_QUERY_INPUT = "station_query"
+CONF_STATION_INPUT = "station_input"
@@ -3,3 +3,6 @@ NAME = "Transportation All-in-One"
 DESCRIPTION = ""
 VERSION = "0.0.1"
 PLATFORMS = ["sensor"]
+CATALOGUE_FILE = "transportation_catalogue.db"
+USER_AGENT_FILE = "transportation_user_agents.json"
+SESSION_STORAGE_KEY = f"{DOMAIN}.sessions"
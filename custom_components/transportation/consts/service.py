@@ -0,0 +1,33 @@
+from custom_components.transportation.consts.country import COUNTRY_KOREA
+
+# Station services, named after their adapters (services/*/adapter/<service>)
+SERVICE_SEOUL_METRO = "seoul_metro"
+SERVICE_SEOUL_OPENAPI = "seoul_openapi"
+SERVICE_KAKAO = "kakao"
+SERVICE_NAVER = "naver"
+SERVICE_TMAP = "tmap"
+
+# Transport card services: an account login instead of a station
+SERVICE_TMONEY = "tmoney"
+
+CARD_SERVICES = frozenset({SERVICE_TMONEY})
+
+SERVICE_NAME_MAP = {
+    SERVICE_SEOUL_METRO: "Seoul Metro (서울교통공사)",
+    SERVICE_SEOUL_OPENAPI: "Seoul Open Data (서울 열린데이터 광장)",
+    SERVICE_KAKAO: "Kakao Map (카카오맵)",
+    SERVICE_NAVER: "Naver Map (네이버 지도)",
+    SERVICE_TMAP: "TMAP (티맵)",
+    SERVICE_TMONEY: "T-money (티머니)",
+}
+
+COUNTRY_SERVICE_MAP = {
+    COUNTRY_KOREA: [
+        SERVICE_SEOUL_METRO,
+        SERVICE_SEOUL_OPENAPI,
+        SERVICE_KAKAO,
+        SERVICE_NAVER,
+        SERVICE_TMAP,
+        SERVICE_TMONEY,
+    ]
+}
@@ -1,6 +1,21 @@
 from dependency_injector import containers, providers
 
+from custom_components.transportation.components.catalogue import StationCatalogue
+from custom_components.transportation.components.coordinator import (
+    TransportationCoordinators,
+)
+from custom_components.transportation.components.polling import (
+    AdaptivePolling,
+    PollingBudget,
+)
+
 
 class Container(containers.DeclarativeContainer):
     """IoC container of the application core components."""
     config = providers.Configuration()
+    coordinators = providers.Singleton(TransportationCoordinators)
+    polling_budget = providers.Singleton(PollingBudget)
+    adaptive_polling = providers.Factory(AdaptivePolling, budget=polling_budget)
+    # The path comes from hass (see station_catalogue()), which config flows
+    # can reach before async_setup has run
+    station_catalogue = providers.Singleton(StationCatalogue)
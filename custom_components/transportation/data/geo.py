@@ -1,15 +1,11 @@
 import dataclasses
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class Point:
     latitude: float
     longitude: float
 
-    def __init__(self, latitude: float, longitude: float):
-        self.latitude = latitude
-        self.longitude = longitude
-
     def __iter__(self):
         return iter((self.latitude, self.longitude))
 
@@ -1,12 +1,23 @@
 import dataclasses
+import sys
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class StationId:
     """Data class for station id."""
 
-    def __init__(
-            self,
-            country_code: str
-    ):
-        self._country_code = country_code
+    country_code: str
+    provider: str = ""
+    code: str = ""
+
+    def __post_init__(self):
+        # Country and provider repeat across the whole catalogue, share them
+        object.__setattr__(self, "country_code", sys.intern(self.country_code))
+        object.__setattr__(self, "provider", sys.intern(self.provider))
+
+    def __str__(self):
+        return ":".join((self.country_code, self.provider, self.code))
+
+    @staticmethod
+    def from_str(value: str):
+        return StationId(*value.split(":", 2))
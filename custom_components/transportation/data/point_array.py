@@ -0,0 +1,168 @@
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from custom_components.transportation.data.geo import Point
+from custom_components.transportation.utilities.geo import (
+    EARTH_RADIUS_M,
+    METERS_PER_DEGREE_LATITUDE,
+)
+
+
+def haversine_array(
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    latitude: np.ndarray | float,
+    longitude: np.ndarray | float,
+) -> np.ndarray:
+    """Vectorized great-circle distance in meters (broadcasts like numpy)."""
+    phi1 = np.radians(latitudes)
+    phi2 = np.radians(latitude)
+    a = (
+        np.sin((phi2 - phi1) / 2) ** 2
+        + np.cos(phi1)
+        * np.cos(phi2)
+        * np.sin(np.radians(np.subtract(longitude, longitudes)) / 2) ** 2
+    )
+
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class PointArray:
+    """Columnar (NumPy backed) collection of points for batched geo operations."""
+
+    __slots__ = ("latitudes", "longitudes")
+
+    def __init__(self, latitudes: Iterable[float], longitudes: Iterable[float]):
+        self.latitudes = np.asarray(latitudes, dtype=np.float64)
+        self.longitudes = np.asarray(longitudes, dtype=np.float64)
+
+        if self.latitudes.shape != self.longitudes.shape:
+            raise ValueError("latitudes and longitudes must have the same shape")
+
+    def __len__(self) -> int:
+        return len(self.latitudes)
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self.to_points())
+
+    def __getitem__(self, item) -> "Point | PointArray":
+        if isinstance(item, (int, np.integer)):
+            return Point(float(self.latitudes[item]), float(self.longitudes[item]))
+
+        # Slices, index arrays and boolean masks keep the columnar form
+        return PointArray(self.latitudes[item], self.longitudes[item])
+
+    @staticmethod
+    def from_points(points: Iterable[Point]) -> "PointArray":
+        points = list(points)
+
+        return PointArray([x.latitude for x in points], [x.longitude for x in points])
+
+    @staticmethod
+    def from_dicts(
+        items: Iterable[dict],
+        latitude_key: str = "latitude",
+        longitude_key: str = "longitude",
+    ) -> "PointArray":
+        items = list(items)
+
+        return PointArray(
+            [float(x[latitude_key]) for x in items],
+            [float(x[longitude_key]) for x in items],
+        )
+
+    def to_points(self) -> list[Point]:
+        return [
+            Point(latitude, longitude)
+            for latitude, longitude in zip(
+                self.latitudes.tolist(), self.longitudes.tolist()
+            )
+        ]
+
+    def distances(self, point: Point) -> np.ndarray:
+        """Distance in meters from every point to point."""
+        return haversine_array(
+            self.latitudes, self.longitudes, point.latitude, point.longitude
+        )
+
+    def in_bounding_box(
+        self, south: float, west: float, north: float, east: float
+    ) -> np.ndarray:
+        """Boolean mask of points inside the box (degrees)."""
+        return (
+            (self.latitudes >= south)
+            & (self.latitudes <= north)
+            & (self.longitudes >= west)
+            & (self.longitudes <= east)
+        )
+
+    def around(self, point: Point, radius_m: float) -> np.ndarray:
+        """Cheap bounding-box prefilter mask for a radius query."""
+        d_lat = radius_m / METERS_PER_DEGREE_LATITUDE
+        d_lon = radius_m / (
+            METERS_PER_DEGREE_LATITUDE * max(np.cos(np.radians(point.latitude)), 1e-6)
+        )
+
+        return self.in_bounding_box(
+            point.latitude - d_lat,
+            point.longitude - d_lon,
+            point.latitude + d_lat,
+            point.longitude + d_lon,
+        )
+
+    def within(self, point: Point, radius_m: float) -> tuple[np.ndarray, np.ndarray]:
+        """Indices and distances of points within radius_m, nearest first."""
+        candidates = np.flatnonzero(self.around(point, radius_m))
+        distances = haversine_array(
+            self.latitudes[candidates],
+            self.longitudes[candidates],
+            point.latitude,
+            point.longitude,
+        )
+        inside = distances <= radius_m
+        candidates, distances = candidates[inside], distances[inside]
+        order = np.argsort(distances, kind="stable")
+
+        return candidates[order], distances[order]
+
+    def nearest(self, point: Point, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """Indices and distances of the k nearest points, nearest first."""
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+
+        distances = self.distances(point)
+        indices = np.argpartition(distances, k - 1)[:k]
+        order = np.argsort(distances[indices], kind="stable")
+
+        return indices[order], distances[indices][order]
+
+    def min_distances(
+        self, other: "PointArray", chunk_size: int = 2048
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """For each point, the index of and distance to the closest point in other.
+
+        Useful for route proximity (stops vs. route shape); computed in chunks so
+        the distance matrix never exceeds chunk_size x len(other).
+        """
+        indices = np.empty(len(self), dtype=np.intp)
+        distances = np.empty(len(self))
+
+        if len(other) == 0:
+            indices.fill(-1)
+            distances.fill(np.inf)
+            return indices, distances
+
+        for start in range(0, len(self), chunk_size):
+            end = min(start + chunk_size, len(self))
+            matrix = haversine_array(
+                self.latitudes[start:end, None],
+                self.longitudes[start:end, None],
+                other.latitudes[None, :],
+                other.longitudes[None, :],
+            )
+            indices[start:end] = np.argmin(matrix, axis=1)
+            distances[start:end] = matrix[np.arange(end - start), indices[start:end]]
+
+        return indices, distances
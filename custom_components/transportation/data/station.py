@@ -1,7 +1,22 @@
+import dataclasses
 from enum import Enum
 
+from custom_components.transportation.data.address import AddressData
+from custom_components.transportation.data.geo import Point
+from custom_components.transportation.data.id import StationId
+
 
 class StationStatus(Enum):
     OPEN = 'open'
     CLOSED = 'closed'
     UNKNOWN = 'unknown'
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StationRecord:
+    """Slow changing station metadata, as kept in the local catalogue."""
+
+    station_id: StationId
+    name: str
+    address: AddressData | None = None
+    point: Point | None = None
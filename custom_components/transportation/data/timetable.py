@@ -0,0 +1,131 @@
+import bisect
+import sys
+from array import array
+from typing import Hashable
+
+
+def encode_time(value: str | int) -> int:
+    """Seconds since the start of the service day ("25:10" is 01:10 next day)."""
+    if isinstance(value, int):
+        return value
+
+    parts = [int(x) for x in value.split(":")]
+    while len(parts) < 3:
+        parts.append(0)
+
+    return parts[0] * 3600 + parts[1] * 60 + parts[2]
+
+
+def decode_time(seconds: int) -> str:
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class Interner:
+    """Bidirectional mapping of ids to dense ints, storing each id once."""
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self):
+        self._index: dict[Hashable, int] = {}
+        self._values: list[Hashable] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def intern(self, value: Hashable) -> int:
+        index = self._index.get(value)
+        if index is None:
+            if isinstance(value, str):
+                value = sys.intern(value)
+            index = len(self._values)
+            self._index[value] = index
+            self._values.append(value)
+
+        return index
+
+    def get(self, value: Hashable) -> int | None:
+        return self._index.get(value)
+
+    def value(self, index: int) -> Hashable:
+        return self._values[index]
+
+
+class TimetableStore:
+    """Columnar departures: interned station/route ids and int encoded times.
+
+    Rows are appended in any order; freeze() sorts them by (station, time) and
+    builds per-station offsets, so a station's departures are one slice.
+    """
+
+    def __init__(self):
+        self.stations = Interner()
+        self.routes = Interner()
+        self._station = array("I")
+        self._route = array("I")
+        self._time = array("i")
+        self._offsets: array | None = None
+
+    def __len__(self) -> int:
+        return len(self._time)
+
+    def add(self, station_id: Hashable, route_id: Hashable, departure: str | int):
+        self._station.append(self.stations.intern(station_id))
+        self._route.append(self.routes.intern(route_id))
+        self._time.append(encode_time(departure))
+        self._offsets = None
+
+        return self
+
+    def freeze(self):
+        # One int sort key per row (station in the high bits) sorts much faster
+        # than tuples; times are offset so negative values still order correctly
+        keys = [
+            (station << 32) | (seconds + 0x80000000)
+            for station, seconds in zip(self._station, self._time)
+        ]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        station_column, route_column, time_column = (
+            self._station,
+            self._route,
+            self._time,
+        )
+        self._station = array("I", [station_column[i] for i in order])
+        self._route = array("I", [route_column[i] for i in order])
+        self._time = array("i", [time_column[i] for i in order])
+
+        offsets = array("I", [0] * (len(self.stations) + 1))
+        for station in self._station:
+            offsets[station + 1] += 1
+        for i in range(len(self.stations)):
+            offsets[i + 1] += offsets[i]
+        self._offsets = offsets
+
+        return self
+
+    def departures(
+        self, station_id: Hashable, after: str | int = 0, limit: int = 10
+    ) -> list[tuple[Hashable, int]]:
+        """Next (route id, departure seconds) at a station from `after` on."""
+        if self._offsets is None:
+            self.freeze()
+
+        station = self.stations.get(station_id)
+        if station is None:
+            return []
+
+        start, end = self._offsets[station], self._offsets[station + 1]
+        first = bisect.bisect_left(self._time, encode_time(after), start, end)
+
+        return [
+            (self.routes.value(self._route[i]), self._time[i])
+            for i in range(first, min(first + limit, end))
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the columnar arrays (excluding the interned ids)."""
+        columns = [self._station, self._route, self._time]
+        if self._offsets is not None:
+            columns.append(self._offsets)
+
+        return sum(x.itemsize * len(x) for x in columns)
@@ -0,0 +1,38 @@
+import dataclasses
+from datetime import date, datetime
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CardTransaction:
+    """One use of a transport card, as listed in its usage history."""
+
+    transaction_id: str
+    used_at: datetime
+    amount: int
+    location: str | None = None
+    balance: int | None = None
+
+    @property
+    def cursor(self) -> tuple[datetime, str]:
+        # Several taps can share a timestamp, the id breaks the tie
+        return self.used_at, self.transaction_id
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CardStatus:
+    """Balance and validity of a card, as reported by its issuer."""
+
+    card_number: str
+    balance: int | None = None
+    expiration_date: date | None = None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CardSnapshot:
+    """What the card sensors show: status plus the rolling usage aggregate."""
+
+    status: CardStatus
+    use_count: int = 0
+    use_amount: int = 0
+    last_used_at: datetime | None = None
+    last_location: str | None = None
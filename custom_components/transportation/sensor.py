@@ -0,0 +1,51 @@
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import PlatformNotReady
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from custom_components.transportation import container
+from custom_components.transportation.consts.configs import CONF_SETUP_SERVICE_INPUT
+from custom_components.transportation.consts.service import CARD_SERVICES
+from custom_components.transportation.services.public_transportation.adapter.tmoney.api import (
+    TmoneyError,
+)
+from custom_components.transportation.services.public_transportation.adapter.tmoney.setup import (
+    TmoneySetup,
+)
+from custom_components.transportation.services.public_transportation.transport_card_service import (
+    card_sensors,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+):
+    if entry.data.get(CONF_SETUP_SERVICE_INPUT) not in CARD_SERVICES:
+        return
+
+    setup = await TmoneySetup.async_create(
+        hass, entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD]
+    )
+
+    # Cards are listed on every setup, so a newly registered card shows up
+    # after a reload
+    try:
+        card_numbers = await setup.async_card_numbers()
+    except TmoneyError as e:
+        raise PlatformNotReady(f"Failed to list the T-money cards: {e}") from e
+
+    coordinator = setup.coordinator(container.coordinators())
+    _LOGGER.debug("Setting up sensors of %s cards", len(card_numbers))
+
+    async_add_entities(
+        [
+            sensor
+            for card_number in card_numbers
+            for sensor in card_sensors(coordinator, card_number)
+        ]
+    )
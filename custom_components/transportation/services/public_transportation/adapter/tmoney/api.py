@@ -0,0 +1,290 @@
+import asyncio
+import logging
+from datetime import date, datetime
+from typing import Any
+from urllib.parse import urlencode
+from zoneinfo import ZoneInfo
+
+from custom_components.transportation.data.transport_card import (
+    CardStatus,
+    CardTransaction,
+)
+from custom_components.transportation.utilities.list import Lu
+from custom_components.transportation.utilities.parser import parse_number
+from custom_components.transportation.utilities.safe_request import (
+    SafeRequest,
+    SafeRequestError,
+    SafeRequestMethod,
+    cookie_store,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+TMONEY_URL = "https://www.tmoney.co.kr"
+TMONEY_TIMEZONE = ZoneInfo("Asia/Seoul")
+
+# Upstream endpoints and the fields read from them, kept in one place
+LOGIN_PATH = "/api/member/login"
+CARDS_PATH = "/api/card/list"
+CARD_PATH = "/api/card/info"
+HISTORY_PATH = "/api/card/usage"
+
+RESULT_CODE = "resultCode"
+RESULT_MESSAGE = "resultMessage"
+RESULT_OK = "0000"
+# Codes of a missing or expired login, answered by logging in again once
+SESSION_EXPIRED_CODES = frozenset({"9001", "9002", "E401"})
+SESSION_EXPIRED_STATUS = 401
+
+CARD_FIELDS = {
+    "card_number": "cardNo",
+    "balance": "balance",
+    "expiration_date": "expireDate",
+}
+HISTORY_FIELDS = {
+    "transaction_id": "trdSeq",
+    "used_at": "trdDtm",
+    "amount": "trdAmt",
+    "location": "useLocation",
+    "balance": "afterBalance",
+}
+
+HISTORY_PAGE_SIZE = 50
+
+
+class TmoneyError(Exception):
+    """T-money answered with an error."""
+
+
+class TmoneyAuthError(TmoneyError):
+    """The credentials were rejected."""
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+
+    digits = "".join(x for x in value if x.isdigit()).ljust(14, "0")[:14]
+    try:
+        return datetime.strptime(digits, "%Y%m%d%H%M%S").replace(tzinfo=TMONEY_TIMEZONE)
+    except ValueError:
+        return None
+
+
+def _parse_date(value: str | None) -> date | None:
+    parsed = _parse_datetime(value)
+
+    return parsed.date() if parsed is not None else None
+
+
+def _card_status(item: dict) -> CardStatus:
+    values = Lu.extract(item, CARD_FIELDS.values())
+
+    return CardStatus(
+        card_number=str(values[CARD_FIELDS["card_number"]]),
+        balance=(
+            parse_number(values[CARD_FIELDS["balance"]])
+            if values[CARD_FIELDS["balance"]] is not None
+            else None
+        ),
+        expiration_date=_parse_date(values[CARD_FIELDS["expiration_date"]]),
+    )
+
+
+def _transaction(item: dict) -> CardTransaction | None:
+    values = Lu.extract(item, HISTORY_FIELDS.values())
+    used_at = _parse_datetime(values[HISTORY_FIELDS["used_at"]])
+    if used_at is None:
+        return None
+
+    balance = values[HISTORY_FIELDS["balance"]]
+
+    return CardTransaction(
+        transaction_id=str(values[HISTORY_FIELDS["transaction_id"]]),
+        used_at=used_at,
+        amount=parse_number(values[HISTORY_FIELDS["amount"]]),
+        location=values[HISTORY_FIELDS["location"]] or None,
+        balance=parse_number(balance) if balance is not None else None,
+    )
+
+
+class TmoneyApi:
+    """T-money account client: logs in once, the session outlives restarts.
+
+    The login cookies and token live in the shared cookie store under the
+    account's own key, so every poll (and the next start) reuses them; only a
+    session expired answer (code or 401) leads to a new login, and the stored
+    session is only replaced once that login succeeded.
+    """
+
+    def __init__(self, username: str, password: str, timeout: int = 30):
+        self._username = username
+        self._password = password
+        self._timeout = timeout
+        self._login_lock = asyncio.Lock()
+
+    @property
+    def session_key(self) -> str:
+        return f"tmoney:{self._username}"
+
+    def _request(self, persist: bool = True) -> SafeRequest:
+        return (
+            SafeRequest()
+            .persist_session(persist, key=self.session_key)
+            .timeout(self._timeout)
+            .header("Accept", "application/json")
+        )
+
+    @property
+    def logged_in(self) -> bool:
+        store = cookie_store()
+
+        return (
+            store.token(self.session_key) is not None
+            or len(store.cookies(self.session_key)) > 0
+        )
+
+    def _session_state(self) -> tuple:
+        store = cookie_store()
+
+        return (
+            store.token(self.session_key),
+            tuple(sorted(store.cookies(self.session_key).items())),
+        )
+
+    async def async_login(self, force: bool = False, expired: tuple | None = None):
+        """Log in unless logged in already, or again with force.
+
+        expired is the session a request was rejected with; a forced login is
+        skipped when another caller has already replaced that session.
+        """
+        if self.logged_in and not force:
+            return
+
+        async with self._login_lock:
+            # Whoever waited for the lock finds the login already done
+            if self.logged_in and not force:
+                return
+            if force and expired is not None and self._session_state() != expired:
+                return
+
+            # Sent without the stored session, which stays until this succeeds
+            try:
+                response = await self._request(persist=False).request(
+                    f"{TMONEY_URL}{LOGIN_PATH}",
+                    method=SafeRequestMethod.POST,
+                    data={"loginId": self._username, "password": self._password},
+                    raise_errors=True,
+                    max_tries=2,
+                )
+            except Exception as e:
+                raise TmoneyError(f"Login failed: {e}") from e
+            body = response.json if response.has else None
+            if not isinstance(body, dict):
+                raise TmoneyError(f"Login failed with status {response.status_code}")
+            if body.get(RESULT_CODE) != RESULT_OK:
+                raise TmoneyAuthError(body.get(RESULT_MESSAGE) or body.get(RESULT_CODE))
+
+            store = cookie_store()
+            store.clear(self.session_key)
+            store.update_cookies(self.session_key, response.cookies)
+            # Token based logins answer in the body rather than a header
+            token = Lu.get(body, "data.accessToken") or response.access_token
+            if token:
+                store.set_token(self.session_key, token)
+
+            _LOGGER.debug("Logged in to T-money as %s", self._username)
+
+    async def _call(self, path: str, params: dict[str, Any]) -> Any:
+        await self.async_login()
+
+        for attempt in range(2):
+            session = self._session_state()
+            try:
+                response = await self._request().request(
+                    f"{TMONEY_URL}{path}?{urlencode(params)}",
+                    raise_errors=True,
+                    max_tries=2,
+                )
+            except Exception as e:
+                # Only a 401 means the login is gone, transport errors keep the session
+                expired = (
+                    isinstance(e, SafeRequestError)
+                    and e.status_code == SESSION_EXPIRED_STATUS
+                )
+                if expired and attempt == 0:
+                    await self.async_login(force=True, expired=session)
+                    continue
+                raise TmoneyError(f"Request to {path} failed: {e}") from e
+
+            body = response.json if response.has else None
+            if not isinstance(body, dict):
+                raise TmoneyError(f"Request to {path} answered without a result")
+            if body.get(RESULT_CODE) == RESULT_OK:
+                return body.get("data")
+
+            if body.get(RESULT_CODE) in SESSION_EXPIRED_CODES and attempt == 0:
+                await self.async_login(force=True, expired=session)
+                continue
+
+            raise TmoneyError(body.get(RESULT_MESSAGE) or body.get(RESULT_CODE))
+
+    async def async_cards(self) -> list[CardStatus]:
+        data = await self._call(CARDS_PATH, {})
+
+        return [_card_status(x) for x in Lu.get(data, "items", [])]
+
+    async def async_card(self, card_number: str) -> CardStatus:
+        return _card_status(await self._call(CARD_PATH, {"cardNo": card_number}))
+
+    async def async_history(
+        self,
+        card_number: str,
+        since: datetime,
+        cursor: tuple[datetime, str] | None = None,
+        max_pages: int = 20,
+    ) -> list[CardTransaction]:
+        """Transactions from cursor on (or since, for a first sync).
+
+        Pages come newest first and paging stops at the first older
+        transaction, so a poll with nothing new is a single small request.
+        """
+        start = cursor[0] if cursor is not None else since
+        transactions = []
+
+        for page in range(1, max_pages + 1):
+            data = await self._call(
+                HISTORY_PATH,
+                {
+                    "cardNo": card_number,
+                    "fromDate": start.astimezone(TMONEY_TIMEZONE).strftime("%Y%m%d"),
+                    "page": page,
+                    "size": HISTORY_PAGE_SIZE,
+                },
+            )
+            items = Lu.get(data, "items", [])
+
+            reached = False
+            for item in items:
+                transaction = _transaction(item)
+                if transaction is None:
+                    continue
+                # Taps of the cursor's own second are refetched, the history
+                # drops the ones it has already seen
+                if transaction.used_at < start:
+                    reached = True
+                    break
+                transactions.append(transaction)
+
+            if (
+                reached
+                or len(items) < HISTORY_PAGE_SIZE
+                or not Lu.get(data, "hasNext", False)
+            ):
+                break
+        else:
+            _LOGGER.warning(
+                "T-money history of %s stopped after %s pages", card_number, max_pages
+            )
+
+        return transactions
@@ -1,5 +1,105 @@
+import logging
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
+
+from custom_components.transportation.components.card_history import (
+    STORAGE_VERSION,
+    CardHistories,
+)
+from custom_components.transportation.components.coordinator import (
+    TransportationCoordinator,
+    TransportationCoordinators,
+)
 from custom_components.transportation.components.setup import TransportationSetup
+from custom_components.transportation.consts.defaults import DOMAIN
+from custom_components.transportation.data.transport_card import CardSnapshot
+from custom_components.transportation.services.public_transportation.adapter.tmoney.api import (
+    TmoneyApi,
+)
+
+_LOGGER = logging.getLogger(__name__)
 
 
 class TmoneySetup(TransportationSetup):
-    """Setup for TMoney"""
+    """Setup for TMoney
+
+    One login per account; every card of it is polled by one coordinator,
+    which only pulls the history after each card's cursor and derives the
+    sensor values from the local rolling aggregate.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: TmoneyApi,
+        histories: CardHistories,
+        update_interval: timedelta = timedelta(minutes=30),
+    ):
+        self._hass = hass
+        self._api = api
+        self._histories = histories
+        self._update_interval = update_interval
+
+    @staticmethod
+    async def async_create(
+        hass: HomeAssistant, username: str, password: str, **kwargs
+    ) -> "TmoneySetup":
+        """Setup of an account, resuming its card histories from storage."""
+        histories = CardHistories()
+        await histories.async_attach(
+            Store(
+                hass,
+                STORAGE_VERSION,
+                f"{DOMAIN}.tmoney.{slugify(username)}",
+                private=True,
+            )
+        )
+
+        return TmoneySetup(hass, TmoneyApi(username, password), histories, **kwargs)
+
+    async def async_card_numbers(self) -> list[str]:
+        return [card.card_number for card in await self._api.async_cards()]
+
+    async def async_fetch(self, card_numbers: list[str]) -> dict[str, CardSnapshot]:
+        snapshots = {}
+        changed = False
+
+        for card_number in card_numbers:
+            history = self._histories.get(card_number)
+            now = dt_util.now()
+
+            status = await self._api.async_card(card_number)
+            transactions = await self._api.async_history(
+                card_number, since=history.start(now), cursor=history.cursor
+            )
+
+            added = history.add(transactions)
+            dropped = history.expire(now)
+            changed = changed or added > 0 or dropped > 0
+            _LOGGER.debug(
+                "T-money card %s: %s new, %s expired, %s in window",
+                card_number,
+                added,
+                dropped,
+                len(history),
+            )
+
+            snapshots[card_number] = history.snapshot(status)
+
+        if changed:
+            self._histories.changed()
+
+        return snapshots
+
+    def coordinator(
+        self, coordinators: TransportationCoordinators
+    ) -> TransportationCoordinator:
+        return coordinators.get_or_create(
+            self._hass,
+            key=self._api.session_key,
+            fetcher=self.async_fetch,
+            update_interval=self._update_interval,
+        )
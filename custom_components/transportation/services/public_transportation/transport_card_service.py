@@ -1,24 +1,125 @@
+from datetime import date, datetime
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from custom_components.transportation.components.coordinator import (
+    TransportationCoordinator,
+)
 from custom_components.transportation.components.device import TransportationDevice
-from custom_components.transportation.components.sensor import TransportationSensor
+from custom_components.transportation.components.sensor import (
+    TransportationCoordinatorSensor,
+)
+from custom_components.transportation.consts.defaults import DOMAIN
+from custom_components.transportation.data.transport_card import CardSnapshot
 
 
 class TransportCardDevice(TransportationDevice):
     """TransportCardDevice class"""
 
-class TransportCardBalanceSensor(TransportationSensor):
+
+class TransportCardSensor(TransportationCoordinatorSensor):
+    """Sensor of one card, read from the card coordinator's snapshot."""
+
+    _attr_has_entity_name = True
+    key = "card"
+
+    def __init__(self, coordinator: TransportationCoordinator, card_number: str):
+        super().__init__(coordinator, card_number)
+        self._attr_unique_id = f"{DOMAIN}_card_{card_number}_{self.key}"
+        self._attr_translation_key = self.key
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"card_{card_number}")},
+            name=f"Transport card {card_number[-4:]}",
+        )
+
+    @property
+    def snapshot(self) -> CardSnapshot | None:
+        return self.item
+
+    @property
+    def available(self) -> bool:
+        return super().available and self.snapshot is not None
+
+
+class TransportCardBalanceSensor(TransportCardSensor):
     """TransportCardBalanceSensor class"""
 
-class TransportCardUseAmountSensor(TransportationSensor):
+    key = "balance"
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_native_unit_of_measurement = "KRW"
+
+    @property
+    def native_value(self) -> int | None:
+        return self.snapshot.status.balance if self.snapshot else None
+
+
+class TransportCardUseAmountSensor(TransportCardSensor):
     """TransportCardUseAmountSensor class"""
 
-class TransportCardUseCountSensor(TransportationSensor):
+    key = "use_amount"
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_native_unit_of_measurement = "KRW"
+
+    @property
+    def native_value(self) -> int | None:
+        return self.snapshot.use_amount if self.snapshot else None
+
+
+class TransportCardUseCountSensor(TransportCardSensor):
     """TransportCardUseCountSensor class"""
 
-class TransportCardUseTimeSensor(TransportationSensor):
+    key = "use_count"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self) -> int | None:
+        return self.snapshot.use_count if self.snapshot else None
+
+
+class TransportCardUseTimeSensor(TransportCardSensor):
     """TransportCardUseTimeSensor class"""
 
-class TransportCardUseLocationSensor(TransportationSensor):
+    key = "last_used"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    @property
+    def native_value(self) -> datetime | None:
+        return self.snapshot.last_used_at if self.snapshot else None
+
+
+class TransportCardUseLocationSensor(TransportCardSensor):
     """TransportCardUseLocationSensor class"""
 
-class TransportCardExpirationDateSensor(TransportationSensor):
+    key = "last_location"
+
+    @property
+    def native_value(self) -> str | None:
+        return self.snapshot.last_location if self.snapshot else None
+
+
+class TransportCardExpirationDateSensor(TransportCardSensor):
     """TransportCardExpirationDateSensor class"""
+
+    key = "expiration_date"
+    _attr_device_class = SensorDeviceClass.DATE
+
+    @property
+    def native_value(self) -> date | None:
+        return self.snapshot.status.expiration_date if self.snapshot else None
+
+
+CARD_SENSORS = (
+    TransportCardBalanceSensor,
+    TransportCardUseAmountSensor,
+    TransportCardUseCountSensor,
+    TransportCardUseTimeSensor,
+    TransportCardUseLocationSensor,
+    TransportCardExpirationDateSensor,
+)
+
+
+def card_sensors(
+    coordinator: TransportationCoordinator, card_number: str
+) -> list[TransportCardSensor]:
+    return [sensor(coordinator, card_number) for sensor in CARD_SENSORS]
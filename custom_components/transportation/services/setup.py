@@ -1,4 +1,10 @@
+import functools
+
 from custom_components.transportation.consts.country import COUNTRY_KOREA, COUNTRY_NAME_MAP
+from custom_components.transportation.consts.service import (
+    COUNTRY_SERVICE_MAP,
+    SERVICE_NAME_MAP,
+)
 
 
 def country_list():
@@ -11,5 +17,21 @@ def country_name(country: str) -> str | None:
     return None
 
 
-def service_list():
-    return []
+@functools.cache
+def country_choices() -> dict[str, str]:
+    """Country code -> display name, as offered by the config flow."""
+    return {country: country_name(country) for country in country_list()}
+
+
+def service_list(country: str) -> list[str]:
+    return COUNTRY_SERVICE_MAP.get(country, [])
+
+
+def service_name(service: str) -> str | None:
+    return SERVICE_NAME_MAP.get(service)
+
+
+@functools.cache
+def service_choices(country: str) -> dict[str, str]:
+    """Service -> display name of a country, as offered by the config flow."""
+    return {service: service_name(service) for service in service_list(country)}
@@ -0,0 +1,106 @@
+import asyncio
+import contextlib
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _PooledBrowser:
+    def __init__(self, driver: Any):
+        self.driver = driver
+        self.uses = 0
+        self.last_used = time.monotonic()
+
+
+class BrowserPool:
+    """Bounded pool of reusable (headless) webdriver instances."""
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[Any]],
+        max_size: int = 2,
+        max_uses: int = 50,
+        idle_timeout: float = 300,
+    ):
+        self._factory = factory
+        self._max_uses = max_uses
+        self._idle_timeout = idle_timeout
+        self._semaphore = asyncio.Semaphore(max_size)
+        self._idle: list[_PooledBrowser] = []
+        self._closed = False
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Borrow a driver; it is recycled on error, after max_uses or when idle too long."""
+        async with self._semaphore:
+            browser = await self._checkout()
+            healthy = False
+            try:
+                yield browser.driver
+                healthy = True
+            finally:
+                await self._checkin(browser, healthy)
+
+    async def sweep(self):
+        """Quit drivers idle longer than idle_timeout, without waiting for a checkout."""
+        await self._evict_idle()
+
+    async def close(self):
+        self._closed = True
+        idle = self._idle
+        self._idle = []
+
+        for browser in idle:
+            await self._quit(browser)
+
+    async def _checkout(self) -> _PooledBrowser:
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+
+        await self._evict_idle()
+
+        while len(self._idle) > 0:
+            browser = self._idle.pop()
+            if await self._is_healthy(browser):
+                return browser
+            await self._quit(browser)
+
+        return _PooledBrowser(await self._factory())
+
+    async def _checkin(self, browser: _PooledBrowser, healthy: bool):
+        browser.uses += 1
+        browser.last_used = time.monotonic()
+
+        if self._closed or not healthy or browser.uses >= self._max_uses:
+            await self._quit(browser)
+        else:
+            self._idle.append(browser)
+
+    async def _evict_idle(self):
+        now = time.monotonic()
+        expired = [x for x in self._idle if now - x.last_used > self._idle_timeout]
+        self._idle = [x for x in self._idle if x not in expired]
+
+        for browser in expired:
+            await self._quit(browser)
+
+    @staticmethod
+    async def _is_healthy(browser: _PooledBrowser) -> bool:
+        try:
+            await asyncio.to_thread(lambda: browser.driver.current_url)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    async def _quit(browser: _PooledBrowser):
+        try:
+            await asyncio.to_thread(browser.driver.quit)
+        except Exception as e:
+            _LOGGER.debug("Failed to quit browser: %s", e)
@@ -0,0 +1,202 @@
+import base64
+import http.cookiejar
+import json
+import logging
+import time
+from http.cookies import Morsel
+from typing import Any, Mapping, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Delayed writes coalesce the cookie updates of a refresh into one file write
+SAVE_DELAY = 30
+
+# Values are dropped this long before they expire, a request must not race it
+EXPIRY_MARGIN = 60
+
+
+def cookie_values(cookies: Optional[Mapping]) -> dict[str, str]:
+    """Plain name -> value of engine cookies (dict, SimpleCookie, httpx Cookies)."""
+    if not cookies:
+        return {}
+
+    return {
+        name: value.value if isinstance(value, Morsel) else str(value)
+        for name, value in cookies.items()
+    }
+
+
+def parse_cookie_header(data: str) -> dict[str, str]:
+    """Cookies of a "name=value; name2=value2" header."""
+    cookies = {}
+    for pair in data.split(";"):
+        name, separator, value = pair.partition("=")
+        name = name.strip()
+        if separator and name:
+            cookies[name] = value.strip()
+
+    return cookies
+
+
+def _cookie_expiry(value: Any, now: float, default_ttl: float) -> float:
+    if isinstance(value, Morsel):
+        if value["max-age"]:
+            try:
+                return now + int(value["max-age"])
+            except ValueError:
+                pass
+        if value["expires"]:
+            expires = http.cookiejar.http2time(value["expires"])
+            if expires is not None:
+                return expires
+
+    # Session cookies (and engines that only report values) get a fixed lifetime
+    return now + default_ttl
+
+
+def token_expiry(token: str) -> Optional[float]:
+    """exp claim of a JWT, None for opaque tokens."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+
+    try:
+        payload = base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4))
+        expires = json.loads(payload).get("exp")
+    except (ValueError, AttributeError):
+        return None
+
+    return float(expires) if isinstance(expires, (int, float)) else None
+
+
+class CookieStore:
+    """Cookies and bearer tokens per host, shared by SafeRequests and kept across restarts.
+
+    Every value carries its expiry (Max-Age/Expires, a JWT exp claim or
+    default_ttl) and is evicted once it passes. Attached to a Home Assistant
+    Store, changes are written with a delay so a burst of responses costs one
+    write.
+    """
+
+    def __init__(self, default_ttl: float = 12 * 3600):
+        self.default_ttl = default_ttl
+        # host -> {"cookies": {name: [value, expires]}, "token": [value, expires]}
+        self._hosts: dict[str, dict] = {}
+        self._store = None
+
+    async def async_attach(self, store):
+        """Load the persisted sessions and write changes to store from now on."""
+        try:
+            data = await store.async_load()
+        except Exception as e:
+            _LOGGER.warning("Ignoring unreadable session store: %s", e)
+            data = None
+
+        if data is not None:
+            # Values set before the store was attached win over the persisted ones
+            self._hosts = {**data.get("hosts", {}), **self._hosts}
+        self._store = store
+        self._evict_expired()
+
+    def _schedule_save(self):
+        if self._store is not None:
+            self._store.async_delay_save(self._data, SAVE_DELAY)
+
+    def _data(self) -> dict:
+        self._evict_expired()
+
+        return {"hosts": self._hosts}
+
+    def _evict_expired(self):
+        limit = time.time() + EXPIRY_MARGIN
+        for host in list(self._hosts):
+            self._evict_host(host, limit)
+
+    def _evict_host(self, host: str, limit: float) -> Optional[dict]:
+        session = self._hosts.get(host)
+        if session is None:
+            return None
+
+        cookies = session.get("cookies", {})
+        for name in [x for x, (_, expires) in cookies.items() if expires <= limit]:
+            del cookies[name]
+        token = session.get("token")
+        if token is not None and token[1] <= limit:
+            session["token"] = None
+
+        if not cookies and session.get("token") is None:
+            del self._hosts[host]
+            return None
+
+        return session
+
+    def cookies(self, host: str) -> dict[str, str]:
+        session = self._evict_host(host, time.time() + EXPIRY_MARGIN)
+        if session is None:
+            return {}
+
+        return {name: value for name, (value, _) in session["cookies"].items()}
+
+    def update_cookies(self, host: str, cookies: Optional[Mapping]):
+        """Store response cookies; empty values and Max-Age=0 delete a cookie."""
+        if not cookies:
+            return
+
+        now = time.time()
+        session = self._hosts.setdefault(host, {"cookies": {}, "token": None})
+        stored = session["cookies"]
+        changed = False
+
+        for name, cookie in cookies.items():
+            value = cookie.value if isinstance(cookie, Morsel) else str(cookie)
+            expires = _cookie_expiry(cookie, now, self.default_ttl)
+
+            if value == "" or expires <= now:
+                changed |= stored.pop(name, None) is not None
+            elif stored.get(name) != [value, expires]:
+                stored[name] = [value, expires]
+                changed = True
+
+        if changed:
+            self._schedule_save()
+
+    def token(self, host: str) -> Optional[str]:
+        session = self._evict_host(host, time.time() + EXPIRY_MARGIN)
+        if session is None or session.get("token") is None:
+            return None
+
+        return session["token"][0]
+
+    def set_token(
+        self, host: str, token: Optional[str], expires: Optional[float] = None
+    ):
+        """Remember a bearer token until expires (unix time; JWT exp or default_ttl)."""
+        if token is None:
+            if self._hosts.get(host, {}).get("token") is not None:
+                self._hosts[host]["token"] = None
+                self._evict_host(host, time.time())
+                self._schedule_save()
+            return
+
+        if expires is None:
+            expires = token_expiry(token) or time.time() + self.default_ttl
+
+        session = self._hosts.setdefault(host, {"cookies": {}, "token": None})
+        if session.get("token") != [token, expires]:
+            session["token"] = [token, expires]
+            self._schedule_save()
+
+    def clear(self, host: Optional[str] = None):
+        """Forget one host's session (e.g. after a rejected login) or all of them."""
+        if host is None:
+            self._hosts = {}
+        elif self._hosts.pop(host, None) is None:
+            return
+
+        self._schedule_save()
+
+    async def async_flush(self):
+        if self._store is not None:
+            await self._store.async_save(self._data())
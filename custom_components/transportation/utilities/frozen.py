@@ -0,0 +1,185 @@
+from copy import deepcopy
+from typing import Any, Iterator, Mapping
+
+_ATOMS = (str, int, float, bool, bytes, type(None))
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is immutable")
+
+
+class FrozenDict(dict):
+    """Read-only dict; still a dict, so lookups stay fast and it serializes as JSON."""
+
+    __slots__ = ("_hash",)
+
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+    __ior__ = _immutable
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({dict.__repr__(self)})"
+
+
+class FrozenList(list):
+    """Read-only list; like FrozenDict, a real list for readers and serializers."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = clear = extend = insert = pop = remove = reverse = sort = _immutable
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+    def __repr__(self) -> str:
+        return f"FrozenList({list.__repr__(self)})"
+
+
+def freeze(value: Any) -> Any:
+    """Immutable snapshot of parsed data (dict -> FrozenDict, list -> FrozenList).
+
+    Already frozen branches are reused as is, so freezing a payload assembled
+    from a previous snapshot only costs the parts that are new.
+    """
+    if isinstance(value, (FrozenDict, FrozenList, *_ATOMS)):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return FrozenList([freeze(item) for item in value])
+    if isinstance(value, set):
+        return frozenset(value)
+
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain, mutable copy of a (frozen or not) JSON-like structure."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+
+    return value
+
+
+def copy_tree(value: Any) -> Any:
+    """Deep copy for parsed JSON: containers are rebuilt, atoms shared.
+
+    Frozen containers are thawed into plain dicts and lists, since a copy is
+    taken to be changed. Much cheaper than copy.deepcopy as there is no memo
+    or reduce protocol; anything that is not JSON data still goes through
+    deepcopy.
+    """
+    cls = type(value)
+    if cls is dict or cls is FrozenDict:
+        return {key: copy_tree(item) for key, item in value.items()}
+    if cls is list or cls is FrozenList:
+        return [copy_tree(item) for item in value]
+    if cls is tuple:
+        return tuple(copy_tree(item) for item in value)
+    if isinstance(value, _ATOMS):
+        return value
+
+    return deepcopy(value)
+
+
+def _segment(container: Any, segment: str) -> Any:
+    if isinstance(container, list):
+        return int(segment)
+
+    return segment
+
+
+def assoc(snapshot: Any, key: str, value: Any) -> Any:
+    """New snapshot with the dotted key set to value; untouched branches are shared."""
+    segments = key.split(".")
+
+    def set_in(node: Any, position: int) -> Any:
+        segment = _segment(node, segments[position])
+        if position == len(segments) - 1:
+            child = freeze(value)
+        else:
+            current = node[segment] if _contains(node, segment) else FrozenDict()
+            child = set_in(current, position + 1)
+
+        if isinstance(node, list):
+            items = list(node)
+            items[segment] = child
+            return FrozenList(items)
+
+        items = dict(node)
+        items[segment] = child
+        return FrozenDict(items)
+
+    return set_in(snapshot, 0)
+
+
+def _contains(node: Any, segment: Any) -> bool:
+    if isinstance(node, list):
+        return -len(node) <= segment < len(node)
+
+    return segment in node
+
+
+def changed_paths(previous: Any, current: Any, prefix: str = "") -> Iterator[str]:
+    """Dotted keys that differ between two snapshots.
+
+    Branches shared between the snapshots are skipped by identity, without
+    being compared.
+    """
+    if previous is current:
+        return
+    if isinstance(previous, Mapping) and isinstance(current, Mapping):
+        for key in previous.keys() | current.keys():
+            if key in previous and key in current:
+                if previous[key] is current[key]:
+                    continue
+                yield from changed_paths(
+                    previous[key],
+                    current[key],
+                    f"{prefix}.{key}" if prefix else str(key),
+                )
+            else:
+                yield f"{prefix}.{key}" if prefix else str(key)
+        return
+    if (
+        isinstance(previous, list)
+        and isinstance(current, list)
+        and len(previous) == len(current)
+    ):
+        for index, (before, after) in enumerate(zip(previous, current)):
+            if before is after:
+                continue
+            yield from changed_paths(
+                before, after, f"{prefix}.{index}" if prefix else str(index)
+            )
+        return
+    if previous != current:
+        yield prefix
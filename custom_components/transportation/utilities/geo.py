@@ -0,0 +1,219 @@
+import heapq
+import math
+from typing import Callable, Hashable, Iterable, Iterator
+
+from custom_components.transportation.data.geo import Point
+
+EARTH_RADIUS_M = 6_371_008.8
+
+METERS_PER_DEGREE_LATITUDE = 111_320.0
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in meters."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+class GeoIndex:
+    """Uniform latitude/longitude grid for radius and nearest-neighbour lookups.
+
+    Cells are cell_size_m tall and at least cell_size_m wide up to
+    max_latitude, so a radius query only visits the few cells around a point.
+    """
+
+    def __init__(self, cell_size_m: float = 100, max_latitude: float = 45):
+        self._cell_lat = cell_size_m / METERS_PER_DEGREE_LATITUDE
+        self._cell_lon = cell_size_m / (
+            METERS_PER_DEGREE_LATITUDE * math.cos(math.radians(max_latitude))
+        )
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        self._keys: list[Hashable] = []
+        self._latitudes: list[float] = []
+        self._longitudes: list[float] = []
+        self._bounds: tuple[int, int, int, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _cell(self, latitude: float, longitude: float) -> tuple[int, int]:
+        return (
+            math.floor(latitude / self._cell_lat),
+            math.floor(longitude / self._cell_lon),
+        )
+
+    def add(self, key: Hashable, point: Point):
+        cell = self._cell(point.latitude, point.longitude)
+        self._cells.setdefault(cell, []).append(len(self._keys))
+        self._keys.append(key)
+        self._latitudes.append(point.latitude)
+        self._longitudes.append(point.longitude)
+
+        if self._bounds is None:
+            self._bounds = (cell[0], cell[0], cell[1], cell[1])
+        else:
+            self._bounds = (
+                min(self._bounds[0], cell[0]),
+                max(self._bounds[1], cell[0]),
+                min(self._bounds[2], cell[1]),
+                max(self._bounds[3], cell[1]),
+            )
+
+        return self
+
+    @staticmethod
+    def build(items: Iterable[tuple[Hashable, Point]], **kwargs) -> "GeoIndex":
+        index = GeoIndex(**kwargs)
+        for key, point in items:
+            index.add(key, point)
+
+        return index
+
+    def _reach(self, latitude: float, radius_m: float) -> tuple[int, int]:
+        """Number of cells to scan in each direction to cover radius_m."""
+        lat_cells = math.ceil(radius_m / METERS_PER_DEGREE_LATITUDE / self._cell_lat)
+        cos_lat = max(
+            math.cos(math.radians(abs(latitude) + lat_cells * self._cell_lat)), 1e-6
+        )
+        lon_cells = math.ceil(
+            radius_m / (METERS_PER_DEGREE_LATITUDE * cos_lat) / self._cell_lon
+        )
+
+        return lat_cells, lon_cells
+
+    def within(self, point: Point, radius_m: float) -> list[tuple[Hashable, float]]:
+        """Keys within radius_m of point with their distance, nearest first."""
+        found = []
+        row, col = self._cell(point.latitude, point.longitude)
+        lat_cells, lon_cells = self._reach(point.latitude, radius_m)
+
+        for i in range(row - lat_cells, row + lat_cells + 1):
+            for j in range(col - lon_cells, col + lon_cells + 1):
+                for index in self._cells.get((i, j), ()):
+                    distance = haversine(
+                        point.latitude,
+                        point.longitude,
+                        self._latitudes[index],
+                        self._longitudes[index],
+                    )
+                    if distance <= radius_m:
+                        found.append((self._keys[index], distance))
+
+        found.sort(key=lambda x: x[1])
+
+        return found
+
+    def nearest(
+        self, point: Point, k: int = 1, max_radius_m: float | None = None
+    ) -> list[tuple[Hashable, float]]:
+        """The k nearest keys, searching outward ring by ring."""
+        if len(self._keys) == 0 or k <= 0:
+            return []
+
+        row, col = self._cell(point.latitude, point.longitude)
+        cell_m = self._cell_lat * METERS_PER_DEGREE_LATITUDE
+        min_row, max_row, min_col, max_col = self._bounds
+        max_ring = max(
+            abs(row - min_row),
+            abs(row - max_row),
+            abs(col - min_col),
+            abs(col - max_col),
+        )
+        best: list[tuple[float, int]] = []  # max-heap of (-distance, index)
+        ring = 0
+
+        while ring <= max_ring:
+            for i, j in self._ring(row, col, ring):
+                for index in self._cells.get((i, j), ()):
+                    distance = haversine(
+                        point.latitude,
+                        point.longitude,
+                        self._latitudes[index],
+                        self._longitudes[index],
+                    )
+                    if max_radius_m is not None and distance > max_radius_m:
+                        continue
+                    if len(best) < k:
+                        heapq.heappush(best, (-distance, index))
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, index))
+
+            # Anything in further rings is at least `ring` cells away
+            if len(best) == k and ring * cell_m >= -best[0][0]:
+                break
+            if max_radius_m is not None and ring * cell_m > max_radius_m:
+                break
+            ring += 1
+
+        return [
+            (self._keys[index], -distance)
+            for distance, index in sorted(best, reverse=True)
+        ]
+
+    @staticmethod
+    def _ring(row: int, col: int, ring: int) -> Iterator[tuple[int, int]]:
+        if ring == 0:
+            yield row, col
+            return
+
+        for j in range(col - ring, col + ring + 1):
+            yield row - ring, j
+            yield row + ring, j
+        for i in range(row - ring + 1, row + ring):
+            yield i, col - ring
+            yield i, col + ring
+
+    def pairs_within(
+        self,
+        radius_m: float,
+        predicate: Callable[[Hashable, Hashable], bool] | None = None,
+    ) -> Iterator[tuple[Hashable, Hashable, float]]:
+        """Every unordered pair of keys closer than radius_m, in one pass over the grid."""
+        for (row, col), members in self._cells.items():
+            latitude = self._latitudes[members[0]]
+            lat_cells, lon_cells = self._reach(latitude, radius_m)
+
+            for i in range(row, row + lat_cells + 1):
+                for j in range(col - lon_cells, col + lon_cells + 1):
+                    # Visit each pair of cells once (the "forward" half-plane)
+                    if i == row and j < col:
+                        continue
+                    others = self._cells.get((i, j))
+                    if others is None:
+                        continue
+
+                    same_cell = i == row and j == col
+                    for position, a in enumerate(members):
+                        for b in others[position + 1 :] if same_cell else others:
+                            distance = haversine(
+                                self._latitudes[a],
+                                self._longitudes[a],
+                                self._latitudes[b],
+                                self._longitudes[b],
+                            )
+                            if distance > radius_m:
+                                continue
+                            key_a, key_b = self._keys[a], self._keys[b]
+                            if predicate is None or predicate(key_a, key_b):
+                                yield key_a, key_b, distance
+
+    def linked_graph(
+        self,
+        radius_m: float = 100,
+        predicate: Callable[[Hashable, Hashable], bool] | None = None,
+    ) -> dict[Hashable, set[Hashable]]:
+        """Adjacency of keys linked by distance (see .docs/related-station.md)."""
+        graph: dict[Hashable, set[Hashable]] = {}
+        for key_a, key_b, _ in self.pairs_within(radius_m, predicate):
+            graph.setdefault(key_a, set()).add(key_b)
+            graph.setdefault(key_b, set()).add(key_a)
+
+        return graph
@@ -0,0 +1,100 @@
+import unicodedata
+
+SYLLABLE_START = 0xAC00
+SYLLABLE_END = 0xD7A3
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+# Compound vowels and final clusters are split, so a half-typed syllable is a
+# prefix of the finished one ("서우" -> "서울", "갑" -> "값")
+JUNGSUNG = (
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ",
+)  # fmt: skip
+
+JONGSUNG = (
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ",
+    "ㄹㅂ", "ㄹㅅ", "ㄹㅌ", "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ",
+    "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)  # fmt: skip
+
+# Revised Romanization, syllable by syllable (no sound change rules)
+ROMAN_CHOSUNG = (
+    "g", "kk", "n", "d", "tt", "r", "m", "b", "pp", "s", "ss", "", "j", "jj",
+    "ch", "k", "t", "p", "h",
+)  # fmt: skip
+
+ROMAN_JUNGSUNG = (
+    "a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o", "wa", "wae", "oe",
+    "yo", "u", "wo", "we", "wi", "yu", "eu", "ui", "i",
+)  # fmt: skip
+
+ROMAN_JONGSUNG = (
+    "", "k", "k", "k", "n", "n", "n", "t", "l", "k", "m", "l", "l", "l", "p",
+    "l", "m", "p", "p", "t", "t", "ng", "t", "t", "k", "t", "p", "t",
+)  # fmt: skip
+
+
+# Standalone compound jamo, as typed mid-syllable, split the same way
+_SPLIT_JAMO = str.maketrans(
+    {
+        "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ",
+        "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ", "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ",
+        "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ",
+        "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    }
+)  # fmt: skip
+
+
+def _syllable(char: str) -> int | None:
+    code = ord(char)
+    if SYLLABLE_START <= code <= SYLLABLE_END:
+        return code - SYLLABLE_START
+
+    return None
+
+
+def normalize(text: str) -> str:
+    """Lowercase text without whitespace or punctuation, composed (NFC)."""
+    return "".join(x for x in unicodedata.normalize("NFC", text).lower() if x.isalnum())
+
+
+def decompose(text: str) -> str:
+    """Hangul syllables spelled out as compatibility jamo ("강남" -> "ㄱㅏㅇㄴㅏㅁ")."""
+    result = []
+    for char in text:
+        code = _syllable(char)
+        if code is None:
+            result.append(char.translate(_SPLIT_JAMO))
+        else:
+            result.append(CHOSUNG[code // 588])
+            result.append(JUNGSUNG[code % 588 // 28])
+            result.append(JONGSUNG[code % 28])
+
+    return "".join(result)
+
+
+def chosung(text: str) -> str:
+    """Initial consonant of every syllable ("강남역" -> "ㄱㄴㅇ")."""
+    return "".join(
+        CHOSUNG[code // 588] if (code := _syllable(x)) is not None else x for x in text
+    )
+
+
+def romanize(text: str) -> str:
+    """Revised Romanization of the Hangul in text ("서울역" -> "seoulyeok")."""
+    result = []
+    for char in text:
+        code = _syllable(char)
+        if code is None:
+            result.append(char)
+        else:
+            result.append(ROMAN_CHOSUNG[code // 588])
+            result.append(ROMAN_JUNGSUNG[code % 588 // 28])
+            result.append(ROMAN_JONGSUNG[code % 28])
+
+    return "".join(result)
+
+
+def is_chosung(text: str) -> bool:
+    return len(text) > 0 and all(x in CHOSUNG for x in text)
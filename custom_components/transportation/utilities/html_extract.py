@@ -0,0 +1,296 @@
+import functools
+import re
+from typing import Any, AsyncIterable, Callable, Iterable, Iterator
+
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+
+# lxml (with cssselect to compile CSS into XPath) is much faster and can parse
+# incrementally, both are declared requirements; BeautifulSoup restricted by a
+# SoupStrainer is only the fallback for an install without them
+try:
+    from cssselect import GenericTranslator
+    from lxml import etree, html as lxml_html
+except ImportError:  # pragma: no cover - depends on the installed packages
+    GenericTranslator = etree = lxml_html = None
+
+HTML_BACKEND = "lxml" if etree is not None else "bs4"
+
+# "tag", "tag#id", "tag.class", "#id" or ".class", as accepted for a scope
+_SIMPLE_SELECTOR = re.compile(
+    r"^(?P<tag>[\w-]*)(?:#(?P<id>[\w-]+)|\.(?P<cls>[\w-]+))?$"
+)
+
+# Field selectors may end with ::text (default) or ::attr(name)
+_PSEUDO = re.compile(r"\s*::(?:text|attr\((?P<attr>[\w:-]+)\))$")
+
+
+@functools.lru_cache(maxsize=8)
+def _lxml_parser(encoding: str):
+    return lxml_html.HTMLParser(encoding=encoding)
+
+
+def _text(value: str) -> str:
+    return " ".join(value.split())
+
+
+class _Scope:
+    """The element a layout's rows live in, matched without a selector engine."""
+
+    __slots__ = ("tag", "id", "cls")
+
+    def __init__(self, selector: str):
+        match = _SIMPLE_SELECTOR.match(selector.strip())
+        if match is None or selector.strip() == "":
+            raise ValueError(f"Unsupported scope selector: {selector}")
+
+        self.tag = match.group("tag") or None
+        self.id = match.group("id")
+        self.cls = match.group("cls")
+
+    def strainer(self) -> SoupStrainer:
+        attrs = {}
+        if self.id is not None:
+            attrs["id"] = self.id
+        if self.cls is not None:
+            # class is multi-valued, a plain string would only match it whole
+            attrs["class"] = self._has_class
+
+        return SoupStrainer(self.tag, attrs=attrs)
+
+    def _has_class(self, value: str | list[str] | None) -> bool:
+        if value is None:
+            return False
+        classes = value.split() if isinstance(value, str) else value
+
+        return self.cls in classes
+
+    def matches(self, element) -> bool:
+        if self.tag is not None and element.tag != self.tag:
+            return False
+        if self.id is not None and element.get("id") != self.id:
+            return False
+        if (
+            self.cls is not None
+            and self.cls not in (element.get("class") or "").split()
+        ):
+            return False
+
+        return True
+
+
+class HtmlLayout:
+    """Extraction recipe for one page layout, compiled once and reused.
+
+    rows is a CSS selector for the repeated elements (timetable rows, road
+    segments); fields maps names to CSS selectors relative to a row, optionally
+    ending in ::attr(name). With a scope ("table#timetable") only that element
+    is parsed (SoupStrainer) or kept in memory while streaming (lxml).
+    """
+
+    def __init__(
+        self,
+        rows: str,
+        fields: dict[str, str],
+        scope: str | None = None,
+        parsers: dict[str, Callable[[str], Any]] | None = None,
+        backend: str | None = None,
+    ):
+        self._rows = rows
+        self._fields: list[tuple[str, str, str | None]] = []
+        for name, selector in fields.items():
+            match = _PSEUDO.search(selector)
+            attribute = match.group("attr") if match else None
+            self._fields.append(
+                (name, selector[: match.start()] if match else selector, attribute)
+            )
+        self._scope = _Scope(scope) if scope is not None else None
+        self._parsers = parsers or {}
+        self.backend = backend or HTML_BACKEND
+        if self.backend == "lxml" and etree is None:
+            raise ValueError("lxml and cssselect are not installed")
+        self._compiled = None
+
+    def _compile(self):
+        if self._compiled is not None:
+            return self._compiled
+
+        if self.backend == "lxml":
+            translator = GenericTranslator()
+
+            def compile_css(css: str):
+                if css.strip() == "":
+                    return None
+                return etree.XPath(translator.css_to_xpath(css, prefix="descendant::"))
+
+        else:
+
+            def compile_css(css: str):
+                if css.strip() == "":
+                    return None
+                return soupsieve.compile(css)
+
+        self._compiled = (
+            compile_css(self._rows),
+            [
+                (name, compile_css(selector), attribute)
+                for name, selector, attribute in self._fields
+            ],
+        )
+
+        return self._compiled
+
+    def _value(self, name: str, element, attribute: str | None) -> Any:
+        if element is None:
+            value = None
+        elif attribute is not None:
+            value = element.get(attribute)
+            if isinstance(value, list):  # bs4 multi-valued attributes (class)
+                value = " ".join(value)
+        elif self.backend == "lxml":
+            value = _text("".join(element.itertext()))
+        else:
+            value = _text(element.get_text())
+
+        parser = self._parsers.get(name)
+        if parser is not None and value is not None:
+            return parser(value)
+
+        return value
+
+    def _first(self, compiled, row):
+        if compiled is None:
+            return row
+        if self.backend == "lxml":
+            found = compiled(row)
+            return found[0] if found else None
+
+        return compiled.select_one(row)
+
+    def _rows_of(self, root) -> Iterator[dict[str, Any]]:
+        rows, fields = self._compile()
+
+        if rows is None:
+            elements = [root]
+        elif self.backend == "lxml":
+            elements = rows(root)
+        else:
+            elements = rows.select(root)
+
+        for row in elements:
+            yield {
+                name: self._value(name, self._first(compiled, row), attribute)
+                for name, compiled, attribute in fields
+            }
+
+    def extract(
+        self, text: str | bytes, encoding: str = "utf-8"
+    ) -> list[dict[str, Any]]:
+        """Every row of a complete document (bytes are decoded with encoding)."""
+        if self.backend == "lxml":
+            root = lxml_html.document_fromstring(
+                text,
+                parser=(_lxml_parser(encoding) if isinstance(text, bytes) else None),
+            )
+            if self._scope is None:
+                return list(self._rows_of(root))
+
+            return [
+                row
+                for element in (
+                    root.iter(self._scope.tag) if self._scope.tag else root.iter()
+                )
+                if self._scope.matches(element)
+                for row in self._rows_of(element)
+            ]
+
+        soup = BeautifulSoup(
+            text,
+            "html.parser",
+            parse_only=self._scope.strainer() if self._scope is not None else None,
+            from_encoding=encoding if isinstance(text, bytes) else None,
+        )
+
+        # With a strainer, the document holds nothing but the scope elements
+        return list(self._rows_of(soup))
+
+    def feeder(self, encoding: str = "utf-8") -> "HtmlStream":
+        return HtmlStream(self, encoding)
+
+    def extract_chunks(
+        self, chunks: Iterable[bytes], encoding: str = "utf-8"
+    ) -> Iterator[dict[str, Any]]:
+        """Rows as soon as their scope element is complete, for streamed bodies."""
+        stream = self.feeder(encoding)
+        for chunk in chunks:
+            yield from stream.feed(chunk)
+
+        yield from stream.close()
+
+    async def async_extract_chunks(
+        self, chunks: AsyncIterable[bytes], encoding: str = "utf-8"
+    ) -> list[dict[str, Any]]:
+        """Rows of a streamed body (e.g. SafeRequest.stream) without buffering it."""
+        stream = self.feeder(encoding)
+        rows = []
+        async for chunk in chunks:
+            rows.extend(stream.feed(chunk))
+        rows.extend(stream.close())
+
+        return rows
+
+
+class HtmlStream:
+    """Incremental extraction: fed chunk by chunk, keeps only the open scope.
+
+    Needs lxml and a scope; otherwise the chunks are buffered and extracted
+    in one go when the stream is closed.
+    """
+
+    def __init__(self, layout: HtmlLayout, encoding: str = "utf-8"):
+        self._layout = layout
+        self._encoding = encoding
+        self._buffer: list[bytes] | None = None
+        self._parser = None
+
+        if layout.backend == "lxml" and layout._scope is not None:
+            self._parser = etree.HTMLPullParser(
+                events=("start", "end"), encoding=encoding
+            )
+            self._open_scopes = 0
+        else:
+            self._buffer = []
+
+    def _drain(self) -> Iterator[dict[str, Any]]:
+        scope = self._layout._scope
+        for event, element in self._parser.read_events():
+            if scope.matches(element):
+                if event == "start":
+                    self._open_scopes += 1
+                    continue
+                self._open_scopes -= 1
+                yield from self._layout._rows_of(element)
+            elif event == "start" or self._open_scopes > 0:
+                continue
+
+            # Outside of a scope, whatever is complete is no longer needed
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    def feed(self, chunk: bytes) -> list[dict[str, Any]]:
+        if self._parser is None:
+            self._buffer.append(chunk)
+            return []
+
+        self._parser.feed(chunk)
+
+        return list(self._drain())
+
+    def close(self) -> list[dict[str, Any]]:
+        if self._parser is None:
+            return self._layout.extract(b"".join(self._buffer), self._encoding)
+
+        self._parser.close()
+
+        return list(self._drain())
@@ -0,0 +1,123 @@
+import dataclasses
+import json
+import types
+import typing
+from typing import Any, Callable
+
+# Fastest available backend: orjson (ships with Home Assistant), msgspec, stdlib
+try:
+    import orjson
+
+    JSON_BACKEND = "orjson"
+    _loads: Callable[[bytes | str], Any] = orjson.loads
+    JSON_DECODE_ERRORS: tuple[type[Exception], ...] = (orjson.JSONDecodeError,)
+except ImportError:  # pragma: no cover - depends on the installed packages
+    orjson = None
+    JSON_BACKEND = "json"
+    _loads = json.loads
+    JSON_DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the installed packages
+    msgspec = None
+
+if msgspec is not None:
+    # json_decode uses msgspec whenever it is installed, whichever backend
+    # json_loads uses; ValidationError is a DecodeError
+    JSON_DECODE_ERRORS = (*JSON_DECODE_ERRORS, msgspec.DecodeError)
+
+if orjson is None and msgspec is not None:
+    JSON_BACKEND = "msgspec"
+    _loads = msgspec.json.Decoder().decode
+    JSON_DECODE_ERRORS = (msgspec.DecodeError, UnicodeDecodeError)
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Decode JSON from bytes (preferred, no intermediate str) or str."""
+    return _loads(data)
+
+
+def json_decode(data: bytes | str, type_: Any) -> Any:
+    """Decode JSON into a typed structure (dataclass, msgspec.Struct, list[...]).
+
+    Raises one of JSON_DECODE_ERRORS, or ValueError/TypeError without msgspec,
+    when the payload does not match type_.
+    """
+    if msgspec is not None:
+        return msgspec.json.decode(data, type=type_)
+
+    return _convert(json_loads(data), type_)
+
+
+def _mismatch(value: Any, type_: Any) -> ValueError:
+    return ValueError(f"Expected {type_}, got {type(value).__name__}")
+
+
+def _convert(value: Any, type_: Any) -> Any:
+    """Stdlib fallback of json_decode, validating like msgspec for the types it knows.
+
+    Lists, dicts, dataclasses, unions (Optional) and str/int/float/bool are
+    checked; any other annotation is accepted as is.
+    """
+    if type_ is Any:
+        return value
+
+    origin = typing.get_origin(type_)
+    args = typing.get_args(type_)
+
+    if origin in (typing.Union, types.UnionType):
+        for arg in args:
+            try:
+                return _convert(value, arg)
+            except (ValueError, TypeError):
+                continue
+        raise _mismatch(value, type_)
+
+    if type_ is None or type_ is type(None):
+        if value is not None:
+            raise _mismatch(value, type_)
+        return None
+
+    if origin in (list, tuple) or type_ in (list, tuple):
+        if not isinstance(value, list):
+            raise _mismatch(value, type_)
+        if origin is list and len(args) == 1:
+            return [_convert(x, args[0]) for x in value]
+        return value
+
+    if origin is dict or type_ is dict:
+        if not isinstance(value, dict):
+            raise _mismatch(value, type_)
+        if len(args) == 2:
+            return {k: _convert(v, args[1]) for k, v in value.items()}
+        return value
+
+    if dataclasses.is_dataclass(type_):
+        if not isinstance(value, dict):
+            raise _mismatch(value, type_)
+        hints = typing.get_type_hints(type_)
+        # Missing required fields raise TypeError from the constructor
+        return type_(
+            **{
+                field.name: _convert(value[field.name], hints.get(field.name, Any))
+                for field in dataclasses.fields(type_)
+                if field.name in value
+            }
+        )
+
+    if type_ is bool:
+        if not isinstance(value, bool):
+            raise _mismatch(value, type_)
+    elif type_ is int:
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise _mismatch(value, type_)
+    elif type_ is float:
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise _mismatch(value, type_)
+        return float(value)
+    elif type_ is str:
+        if not isinstance(value, str):
+            raise _mismatch(value, type_)
+
+    return value
@@ -1,4 +1,75 @@
-from copy import deepcopy
+import functools
+from typing import Any, Callable, Iterable
+
+from custom_components.transportation.utilities.frozen import (
+    copy_tree,
+    freeze,
+    thaw,
+)
+
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=1024)
+def _path_getter(key: str) -> Callable[[Any, Any], Any]:
+    """Getter for a (dotted) key, split once and cached per key string."""
+    keys = tuple(key.split("."))
+
+    if len(keys) == 1:
+
+        def get(target, default_value=None):
+            return target[key] if key in target else default_value
+
+        return get
+
+    def get_path(target, default_value=None):
+        # A literal key containing dots wins over the path, like before
+        if key in target:
+            return target[key]
+
+        for k in keys:
+            if k in target:
+                target = target[k]
+            else:
+                return default_value
+
+        return target
+
+    return get_path
+
+
+@functools.lru_cache(maxsize=256)
+def _path_plan(keys: tuple[str, ...]) -> tuple[tuple, tuple[str, ...]]:
+    """Trie of the path segments of many keys, so shared prefixes are walked once."""
+    trie: dict = {}
+    for key in keys:
+        node = trie
+        segments = key.split(".")
+        for position, segment in enumerate(segments):
+            child, outputs = node.setdefault(segment, ({}, []))
+            if position == len(segments) - 1:
+                outputs.append(key)
+            node = child
+
+    def freeze(node: dict) -> tuple:
+        return tuple(
+            (segment, tuple(outputs), freeze(child))
+            for segment, (child, outputs) in node.items()
+        )
+
+    return freeze(trie), tuple(x for x in keys if "." in x)
+
+
+def _walk(target, nodes: tuple, result: dict):
+    for segment, outputs, children in nodes:
+        if segment not in target:
+            continue
+
+        value = target[segment]
+        for output in outputs:
+            result[output] = value
+        if children:
+            _walk(value, children, result)
 
 
 class Lu:
@@ -12,21 +83,46 @@ class Lu:
 
     @staticmethod
     def get(target: [any], key: str, default_value: any = None):
-        if key in target:
-            return target[key]
+        return _path_getter(key)(target, default_value)
+
+    @staticmethod
+    def getter(key: str) -> Callable[[Any, Any], Any]:
+        """Compiled getter for a dotted key, for use in tight loops."""
+        return _path_getter(key)
 
-        if key.count(".") > 0:
-            keys = key.split(".")
+    @staticmethod
+    def extract(target: [any], keys: Iterable[str], default_value: any = None) -> dict:
+        """Values of many (dotted) keys at once, walking shared prefixes once."""
+        keys = tuple(keys)
+        trie, dotted = _path_plan(keys)
+        result = dict.fromkeys(keys, default_value)
+        _walk(target, trie, result)
 
-            for k in keys:
-                if k in target:
-                    target = target[k]
-                    continue
-                else:
-                    return default_value
-            return target
+        for key in dotted:
+            if key in target:
+                result[key] = target[key]
 
-        return default_value
+        return result
+
+    @staticmethod
+    def extract_all(
+        target: [any], keys: Iterable[str], default_value: any = None
+    ) -> list[dict]:
+        keys = tuple(keys)
+
+        return [Lu.extract(x, keys, default_value) for x in target]
+
+    @staticmethod
+    def index_by(target: [any], key: str) -> dict:
+        """Items by their value of key (first one wins), replacing repeated scans."""
+        get = _path_getter(key)
+        index = {}
+        for item in target:
+            value = get(item, _MISSING)
+            if value is not _MISSING and value not in index:
+                index[value] = item
+
+        return index
 
     @staticmethod
     def update(target: [any], key: str, value: any):
@@ -36,36 +132,11 @@ class Lu:
 
     @staticmethod
     def has(target: [any], key: str):
-        if key.count(".") > 0:
-            keys = key.split(".")
-
-            for k in keys:
-                if k in target:
-                    target = target[k]
-                else:
-                    return False
-
-            return True
-
-        return key in target
+        return _path_getter(key)(target, _MISSING) is not _MISSING
 
     @staticmethod
     def get_or_default(target: [any], key: str, default_value: any = None):
-        if key in target:
-            return target[key]
-
-        if key.count(".") > 0:
-            keys = key.split(".")
-
-            for k in keys:
-                if k in target:
-                    target = target[k]
-                    continue
-                else:
-                    return default_value
-            return target
-
-        return default_value
+        return _path_getter(key)(target, default_value)
 
     @staticmethod
     def remove_item(target: [any], key: str, value: any) -> list:
@@ -87,7 +158,16 @@ class Lu:
 
     @staticmethod
     def copy(target: [any]):
-        return deepcopy(target)
+        return copy_tree(target)
+
+    @staticmethod
+    def freeze(target: [any]):
+        """Immutable snapshot, safe to keep as the previous payload without a copy."""
+        return freeze(target)
+
+    @staticmethod
+    def thaw(target: [any]):
+        return thaw(target)
 
     @staticmethod
     def map(target: [any], lambda_function):
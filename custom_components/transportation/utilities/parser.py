@@ -1,67 +1,116 @@
+from array import array
+from typing import Iterable
+
 from bs4 import BeautifulSoup
 
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+TRUE_VALUES = frozenset(
+    {
+        "true",
+        "yes",
+        "y",
+        "はい",
+        "예",
+        "ok",
+        "1",
+        "on",
+        "enable",
+        "enabled",
+        "active",
+        "activated",
+        "open",
+        "opened",
+        "unlock",
+        "unlocked",
+    }
+)
+
 
 def parse_bool(value: any) -> bool:
     if isinstance(value, bool):
         return value
     elif isinstance(value, str):
-        return value.lower() in [
-            "true",
-            "yes",
-            "y",
-            "はい",
-            "예",
-            "ok",
-            "1",
-            "on",
-            "enable",
-            "enabled",
-            "active",
-            "activated",
-            "open",
-            "opened",
-            "unlock",
-            "unlocked",
-        ]
+        return value.lower() in TRUE_VALUES
     return bool(value)
 
 
-def parse_float(value: any) -> float:
+def _strip_noise(text: str) -> str:
+    """Drop thousands separators, currency signs and spacing around numbers."""
+    # isascii() is a flag check; ASCII text can only hold the separators
+    if text.isascii():
+        if "," in text:
+            text = text.replace(",", "")
+        if " " in text or "\t" in text:
+            text = text.replace(" ", "").replace("\t", "")
+        return text
+
+    return (
+        text.replace(",", "")
+        .replace(" ", "")
+        .replace("\t", "")
+        .replace("円", "")
+        .replace("¥", "")
+        .replace("￦", "")
+        .replace("원", "")
+    )
+
+
+def parse_float(value: any, default: float = 0.0) -> float:
+    # Payload values are mostly strings, check them first
+    if type(value) is str:
+        value = _strip_noise(value)
+        try:
+            return float(value)
+        except ValueError:
+            return default
     if isinstance(value, float):
         return value
+    if type(value) is int:
+        return float(value)
 
     try:
-        return float(
-            str(value)
-            .replace(",", "")
-            .replace(" ", "")
-            .replace("円", "")
-            .replace("¥", "")
-            .replace("￦", "")
-            .replace("\t", "")
-            .replace("원", "")
-        )
+        return float(_strip_noise(str(value)))
     except (ValueError, TypeError):
-        return 0.0
+        return default
 
 
-def parse_number(value: any) -> int:
+def parse_number(value: any, default: int = 0) -> int:
+    if type(value) is str:
+        value = _strip_noise(value)
+        try:
+            return int(value)
+        except ValueError:
+            return default
     if value is None:
-        return 0
+        return default
+    if type(value) is int:
+        return value
 
     try:
-        return int(
-            str(value)
-            .replace(",", "")
-            .replace(" ", "")
-            .replace("円", "")
-            .replace("¥", "")
-            .replace("￦", "")
-            .replace("\t", "")
-            .replace("원", "")
-        )
+        return int(_strip_noise(str(value)))
     except (ValueError, TypeError):
-        return 0
+        return default
+
+
+def parse_floats(values: Iterable[any], default: float = 0.0) -> array:
+    """parse_float over many values, packed in an array("d")."""
+    return array("d", [parse_float(x, default) for x in values])
+
+
+def parse_numbers(values: Iterable[any], default: int = 0) -> array:
+    """parse_number over many values, packed in an array("q")."""
+    numbers = [parse_number(x, default) for x in values]
+
+    try:
+        return array("q", numbers)
+    except OverflowError:
+        # Ids and the like beyond 64 bits do not fit, treat them as unparsable
+        return array(
+            "q", [x if _INT64_MIN <= x <= _INT64_MAX else default for x in numbers]
+        )
 
 
 def parse_html(text: str):
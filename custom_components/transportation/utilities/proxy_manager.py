@@ -0,0 +1,149 @@
+import random
+import time
+from enum import Enum
+from typing import Optional
+
+from custom_components.transportation.utilities.request_stats import RequestStats
+
+
+class ProxyCircuit(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class ProxyState:
+    def __init__(self):
+        self.stats = RequestStats()
+        self.circuit = ProxyCircuit.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.reset_timeout = 0.0
+        self.probe_started: Optional[float] = None
+
+
+class ProxyManager:
+    """Latency/failure tracking and circuit breaking for request proxies."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 60,
+        max_reset_timeout: float = 900,
+        default_latency: float = 1.0,
+    ):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._max_reset_timeout = max_reset_timeout
+        self._default_latency = default_latency
+        self._states: dict[Optional[str], ProxyState] = {}
+
+    def _state(self, proxy: Optional[str]) -> ProxyState:
+        if proxy not in self._states:
+            self._states[proxy] = ProxyState()
+
+        return self._states[proxy]
+
+    def available(self, proxy: Optional[str]) -> bool:
+        # A direct connection (None) is never ejected
+        if proxy is None:
+            return True
+
+        state = self._state(proxy)
+        if state.circuit == ProxyCircuit.OPEN:
+            if time.monotonic() - state.opened_at < state.reset_timeout:
+                return False
+            state.circuit = ProxyCircuit.HALF_OPEN
+            state.probe_started = None
+
+        if state.circuit == ProxyCircuit.CLOSED:
+            return True
+
+        # Half-open proxies let a single probe through; a probe that never
+        # reported back (e.g. cancelled) is given up after reset_timeout
+        return (
+            state.probe_started is None
+            or time.monotonic() - state.probe_started > state.reset_timeout
+        )
+
+    def weight(self, proxy: Optional[str]) -> float:
+        stats = self._state(proxy).stats
+        latency = stats.p50 if stats.p50 is not None else self._default_latency
+
+        return stats.success_rate / max(latency, 0.01)
+
+    def rank(self, proxies: list[Optional[str]]) -> list[Optional[str]]:
+        """Available proxies, fastest and most reliable first."""
+        return sorted(
+            [x for x in proxies if self.available(x)],
+            key=self.weight,
+            reverse=True,
+        )
+
+    def select(self, proxies: list[str], include_direct: bool = True) -> Optional[str]:
+        candidates = [x for x in proxies if self.available(x)]
+        if include_direct:
+            candidates.append(None)
+        if len(candidates) == 0:
+            return None
+
+        proxy = random.choices(
+            candidates, weights=[self.weight(x) for x in candidates]
+        )[0]
+        self._mark_probe(proxy)
+
+        return proxy
+
+    def select_many(self, proxies: list[str], count: int) -> list[str]:
+        selected = [x for x in self.rank(proxies) if x is not None][:count]
+        for proxy in selected:
+            self._mark_probe(proxy)
+
+        return selected
+
+    def _mark_probe(self, proxy: Optional[str]):
+        if proxy is None:
+            return
+
+        state = self._state(proxy)
+        if state.circuit == ProxyCircuit.HALF_OPEN:
+            state.probe_started = time.monotonic()
+
+    def record_success(self, proxy: Optional[str], latency: float):
+        state = self._state(proxy)
+        state.stats.record_success(latency)
+        state.consecutive_failures = 0
+        state.circuit = ProxyCircuit.CLOSED
+        state.reset_timeout = 0.0
+        state.probe_started = None
+
+    def record_failure(self, proxy: Optional[str]):
+        state = self._state(proxy)
+        state.stats.record_failure()
+        state.consecutive_failures += 1
+        state.probe_started = None
+
+        if proxy is None:
+            return
+
+        if (
+            state.circuit == ProxyCircuit.HALF_OPEN
+            or state.consecutive_failures >= self._failure_threshold
+        ):
+            # Back off exponentially while the proxy keeps failing its probes
+            state.reset_timeout = min(
+                max(state.reset_timeout * 2, self._reset_timeout),
+                self._max_reset_timeout,
+            )
+            state.circuit = ProxyCircuit.OPEN
+            state.opened_at = time.monotonic()
+
+    def diagnostics(self) -> dict:
+        return {
+            proxy or "direct": {
+                **state.stats.as_dict(),
+                "circuit": state.circuit.value,
+                "consecutive_failures": state.consecutive_failures,
+            }
+            for proxy, state in self._states.items()
+        }
@@ -0,0 +1,194 @@
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import AsyncIterator
+
+
+class RequestPriority(IntEnum):
+    # Lower values are scheduled first
+    USER = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def take(self) -> float:
+        """Take a token if one is available (0.0), else how long until one is."""
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+
+        return (1 - self._tokens) / self.rate
+
+    def refund(self):
+        self._tokens = min(float(self.burst), self._tokens + 1)
+
+
+class _HostQueue:
+    """Requests waiting for a host's tokens, handed out by priority."""
+
+    def __init__(self, bucket: TokenBucket):
+        self.bucket = bucket
+        self.waiters: list[tuple[int, int, asyncio.Future]] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class _WaitMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, wait: float):
+        self.requests += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "wait_avg": self.wait_total / self.requests if self.requests else 0.0,
+            "wait_max": self.wait_max,
+        }
+
+
+class RequestScheduler:
+    """Per-host token buckets plus a global, priority ordered concurrency cap."""
+
+    def __init__(self, max_concurrency: int = 8, rate: float = 2.0, burst: int = 4):
+        self._max_concurrency = max_concurrency
+        self._rate = rate
+        self._burst = burst
+        self._hosts: dict[str, _HostQueue] = {}
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._max_queue_depth = 0
+        self._metrics: dict[str, _WaitMetrics] = {}
+
+    def host_rate(self, host: str, rate: float, burst: int = 1):
+        """Override the request rate (per second) and burst for one host."""
+        self._host_queue(host).bucket = TokenBucket(rate, burst)
+
+        return self
+
+    @property
+    def queue_depth(self) -> int:
+        return len([x for x in self._waiters if not x[2].done()])
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, host: str, priority: RequestPriority = RequestPriority.NORMAL
+    ) -> AsyncIterator[None]:
+        enqueued = time.monotonic()
+
+        # Per-host spacing first, so a throttled host never holds a global slot
+        await self._acquire_host(host, priority)
+
+        await self._acquire(priority)
+        try:
+            self._metrics.setdefault(host, _WaitMetrics()).record(
+                time.monotonic() - enqueued
+            )
+            yield
+        finally:
+            self._release()
+
+    def _host_queue(self, host: str) -> _HostQueue:
+        queue = self._hosts.get(host)
+        if queue is None:
+            queue = self._hosts[host] = _HostQueue(TokenBucket(self._rate, self._burst))
+
+        return queue
+
+    async def _acquire_host(self, host: str, priority: RequestPriority):
+        queue = self._host_queue(host)
+        if len(queue.waiters) == 0 and queue.bucket.take() == 0:
+            return
+
+        # A backlog builds here, so tokens go to the highest priority waiter
+        # rather than first come, first served
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(queue.waiters, (int(priority), next(self._sequence), future))
+        self._dispatch_host(queue)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                queue.bucket.refund()
+                self._dispatch_host(queue)
+            raise
+
+    def _dispatch_host(self, queue: _HostQueue):
+        while len(queue.waiters) > 0:
+            if queue.waiters[0][2].done():
+                heapq.heappop(queue.waiters)
+                continue
+
+            wait = queue.bucket.take()
+            if wait > 0:
+                if queue.timer is None:
+                    queue.timer = asyncio.get_running_loop().call_later(
+                        wait, self._on_host_timer, queue
+                    )
+                return
+
+            _, _, future = heapq.heappop(queue.waiters)
+            future.set_result(None)
+
+    def _on_host_timer(self, queue: _HostQueue):
+        queue.timer = None
+        self._dispatch_host(queue)
+
+    async def _acquire(self, priority: RequestPriority):
+        if self._active < self._max_concurrency and self.queue_depth == 0:
+            self._active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), future))
+        self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot may have been handed over right before the cancellation
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self):
+        # Hand the slot straight to the highest priority waiter
+        while len(self._waiters) > 0:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+
+        self._active -= 1
+
+    def metrics(self) -> dict:
+        return {
+            "active": self._active,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "hosts": {host: x.as_dict() for host, x in self._metrics.items()},
+        }
@@ -0,0 +1,59 @@
+from collections import deque
+
+
+class RequestStats:
+    """Rolling success rate and latency percentiles over the most recent requests."""
+
+    def __init__(self, window: int = 50):
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    @property
+    def attempts(self) -> int:
+        return len(self._outcomes)
+
+    @property
+    def success_rate(self) -> float:
+        # Laplace smoothing, so an untried target ranks between good and bad ones
+        return (sum(self._outcomes) + 1) / (len(self._outcomes) + 2)
+
+    @property
+    def expected_latency(self) -> float:
+        """Median latency over the success rate: expected seconds per success."""
+        p50 = self.p50
+        if p50 is None:
+            return float("inf")
+
+        return p50 / self.success_rate
+
+    @property
+    def p50(self) -> float | None:
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> float | None:
+        return self.percentile(95)
+
+    def percentile(self, percent: float) -> float | None:
+        if len(self._latencies) == 0:
+            return None
+
+        latencies = sorted(self._latencies)
+        index = round((len(latencies) - 1) * percent / 100)
+
+        return latencies[index]
+
+    def record_success(self, latency: float):
+        self._outcomes.append(True)
+        self._latencies.append(latency)
+
+    def record_failure(self):
+        self._outcomes.append(False)
+
+    def as_dict(self) -> dict:
+        return {
+            "attempts": self.attempts,
+            "success_rate": round(self.success_rate, 3),
+            "p50": self.p50,
+            "p95": self.p95,
+        }
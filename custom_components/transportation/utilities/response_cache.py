@@ -0,0 +1,130 @@
+import asyncio
+import json
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+
+class CacheEntry:
+    def __init__(self, response: Any, ttl: float, headers: dict):
+        self.response = response
+        self.expires_at = time.monotonic() + ttl
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        self.etag: Optional[str] = headers.get("etag")
+        self.last_modified: Optional[str] = headers.get("last-modified")
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+    def refresh(self, ttl: float):
+        self.expires_at = time.monotonic() + ttl
+
+
+class ResponseCache:
+    """Size-bounded LRU of responses with per-endpoint TTLs and request coalescing."""
+
+    def __init__(self, max_entries: int = 256, default_ttl: float = 30):
+        self._max_entries = max_entries
+        self._default_ttl = default_ttl
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._ttls: list[tuple[re.Pattern, float]] = []
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def key(method: str, url: str, data: Any = None, identity: str = "") -> str:
+        """Cache key; identity keeps responses of different credentials apart."""
+        body = json.dumps(data, sort_keys=True, default=str) if data else ""
+
+        return f"{method.upper()} {url} {body} {identity}"
+
+    def endpoint_ttl(self, pattern: str, ttl: float):
+        """TTL (seconds) for URLs matching the regular expression pattern."""
+        self._ttls.append((re.compile(pattern), ttl))
+
+        return self
+
+    def ttl(self, url: str) -> float:
+        for pattern, ttl in self._ttls:
+            if pattern.search(url):
+                return ttl
+
+        return self._default_ttl
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+        return entry
+
+    def store(self, key: str, response: Any, ttl: float, headers: dict = None):
+        cache_control = {k.lower(): v for k, v in (headers or {}).items()}.get(
+            "cache-control", ""
+        )
+        if ttl <= 0 or "no-store" in cache_control:
+            return
+
+        self._entries[key] = CacheEntry(response, ttl, headers)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: str = None):
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def coalesce(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Share one in-flight call between concurrent callers of the same key."""
+        if key in self._inflight:
+            self.coalesced += 1
+            return await asyncio.shield(self._inflight[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            result = await factory()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve once so an error nobody waited for is not reported as lost
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "coalesced": self.coalesced,
+        }
@@ -1,47 +1,120 @@
 import asyncio
 import dataclasses
-import json
+import hashlib
+import importlib
 import logging
 import random
-import ssl
+import time
 from enum import Enum
-from typing import Optional, Callable, Self, Awaitable
+from types import ModuleType
+from typing import (
+    Any,
+    Optional,
+    Callable,
+    Self,
+    Awaitable,
+    TYPE_CHECKING,
+    AsyncIterator,
+    Iterator,
+)
+from urllib.parse import urlsplit
 
 import aiohttp
-import cloudscraper
-import fake_useragent
-import httpx
-import requests
-import undetected_chromedriver as uc
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
 from voluptuous import default_factory
-from webdriver_manager.chrome import ChromeDriverManager
 
+from custom_components.transportation.utilities.browser_pool import BrowserPool
+from custom_components.transportation.utilities.cookie_store import (
+    CookieStore,
+    cookie_values,
+    parse_cookie_header,
+)
+from custom_components.transportation.utilities.frozen import FrozenDict, freeze
+from custom_components.transportation.utilities.json_codec import (
+    JSON_DECODE_ERRORS,
+    json_decode,
+    json_loads,
+)
 from custom_components.transportation.utilities.list import Lu
+from custom_components.transportation.utilities.proxy_manager import ProxyManager
+from custom_components.transportation.utilities.request_scheduler import (
+    RequestPriority,
+    RequestScheduler,
+)
+from custom_components.transportation.utilities.request_stats import RequestStats
+from custom_components.transportation.utilities.response_cache import ResponseCache
+from custom_components.transportation.utilities.user_agent import (
+    CLIENT_HINT_HEADERS,
+    UserAgentPool,
+)
+
+if TYPE_CHECKING:
+    import httpx
 
 
-async def ssl_context():
-    ctx = await asyncio.to_thread(ssl.create_default_context)
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
+_LOGGER = logging.getLogger(__name__)
 
-    return ctx
+_MODULES: dict[str, ModuleType] = {}
 
 
-_LOGGER = logging.getLogger(__name__)
+async def _async_import(name: str) -> ModuleType:
+    """Import a heavyweight engine dependency on first use, off the event loop."""
+    if name not in _MODULES:
+        _MODULES[name] = await asyncio.to_thread(importlib.import_module, name)
+
+    return _MODULES[name]
 
 
 class SafeRequestError(Exception):
-    pass
+    def __init__(self, message: str = "", status_code: Optional[int] = None):
+        super().__init__(message)
+        # HTTP status of an error response, None for transport and other failures
+        self.status_code = status_code
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_UNSET = object()
+
+
+async def _read_capped(
+        chunks: AsyncIterator[bytes], url: str, max_body_size: Optional[int]
+) -> bytes:
+    body = bytearray()
+    async for chunk in chunks:
+        body.extend(chunk)
+        if max_body_size is not None and len(body) > max_body_size:
+            raise SafeRequestError(
+                f"Response body of {url} exceeds {max_body_size} bytes"
+            )
+
+    return bytes(body)
+
+
+def _read_capped_sync(
+        chunks: Iterator[bytes], url: str, max_body_size: Optional[int]
+) -> bytes:
+    body = bytearray()
+    for chunk in chunks:
+        body.extend(chunk)
+        if max_body_size is not None and len(body) > max_body_size:
+            raise SafeRequestError(
+                f"Response body of {url} exceeds {max_body_size} bytes"
+            )
+
+    return bytes(body)
 
 
 @dataclasses.dataclass
 class SafeRequestResponseData:
-    data: Optional[str] = default_factory("")
+    content: Optional[bytes] = default_factory(None)
     status_code: int = default_factory(400)
     access_token: Optional[str] = default_factory(None)
     cookies: dict = default_factory({})
+    headers: dict = default_factory({})
+    encoding: Optional[str] = default_factory(None)
+
+    # Set on read-only copies handed to several callers (see freeze())
+    _frozen = False
 
     def __init__(
             self,
@@ -49,13 +122,62 @@ class SafeRequestResponseData:
             status_code: int = 400,
             cookies=None,
             access_token: Optional[str] = None,
+            headers: Optional[dict] = None,
+            content: Optional[bytes] = None,
+            encoding: Optional[str] = None,
     ):
         if cookies is None:
             cookies = {}
-        self.data = data
+        if headers is None:
+            headers = {}
+        self._data = data
+        self._json = _UNSET
+        self.content = content
+        self.encoding = encoding
         self.status_code = status_code
         self.cookies = cookies
         self.access_token = access_token
+        self.headers = headers
+
+    def __setattr__(self, name: str, value: any):
+        if self._frozen:
+            raise AttributeError(f"Shared response is read-only, cannot set {name}")
+
+        object.__setattr__(self, name, value)
+
+    def freeze(self) -> "SafeRequestResponseData":
+        """Read-only copy that many callers can share (cached responses).
+
+        Cookies and headers become FrozenDicts and the parsed JSON is frozen,
+        so no caller can change what the others see.
+        """
+        frozen = SafeRequestResponseData(
+            data=self._data,
+            status_code=self.status_code,
+            cookies=FrozenDict(cookie_values(self.cookies)),
+            access_token=self.access_token,
+            headers=FrozenDict(self.headers),
+            content=self.content,
+            encoding=self.encoding,
+        )
+        if self._json is not _UNSET:
+            frozen._json = freeze(self._json)
+        frozen._frozen = True
+
+        return frozen
+
+    @property
+    def data(self) -> Optional[str]:
+        """Body as text, decoded from content once and then cached."""
+        if self._data is None and self.content is not None:
+            # Memoized through object.__setattr__, frozen copies decode too
+            object.__setattr__(
+                self,
+                "_data",
+                self.content.decode(self.encoding or "utf-8", "replace"),
+            )
+
+        return self._data
 
     @property
     def text(self):
@@ -63,13 +185,45 @@ class SafeRequestResponseData:
 
     @property
     def has(self):
-        return self.status_code <= 399 and self.data is not None
+        return self.status_code <= 399 and (
+            self._data is not None or self.content is not None
+        )
+
+    def _json_source(self) -> Optional[bytes | str]:
+        # Decode straight from UTF-8 bytes; other charsets go through text
+        if (
+                self.content is not None
+                and self._data is None
+                and (self.encoding or "utf-8").lower().replace("-", "") == "utf8"
+        ):
+            return self.content
+
+        return self.data
 
     @property
     def json(self):
+        """Body parsed as JSON once, with the fastest available backend."""
+        if self._json is _UNSET:
+            source = self._json_source()
+            try:
+                parsed = json_loads(source) if source is not None else None
+            except JSON_DECODE_ERRORS:
+                parsed = None
+            object.__setattr__(
+                self, "_json", freeze(parsed) if self._frozen else parsed
+            )
+
+        return self._json
+
+    def json_as(self, type_: any):
+        """Body decoded into a typed structure (dataclass, msgspec.Struct, list[...])."""
+        source = self._json_source()
+        if source is None:
+            return None
+
         try:
-            return json.loads(self.data)
-        except json.JSONDecodeError:
+            return json_decode(source, type_)
+        except (*JSON_DECODE_ERRORS, TypeError, ValueError):
             return None
 
 
@@ -81,6 +235,15 @@ class SafeRequestMethod(Enum):
 
 
 class SafeRequestEngine:
+    # Engines that can hand out the body chunk by chunk implement stream()
+    supports_stream = False
+
+    # Whether adaptive ordering may try the engine just to measure it
+    explore = True
+
+    # Per-host history of an instance configured directly (see engine_stats)
+    _host_stats: Optional[dict[str, RequestStats]] = None
+
     async def request(
             self,
             headers: dict,
@@ -89,11 +252,95 @@ class SafeRequestEngine:
             data: dict,
             proxy: str,
             timeout: int,
+            max_body_size: Optional[int] = None,
     ) -> SafeRequestResponseData:
         pass
 
+    async def stream(
+            self,
+            headers: dict,
+            method: SafeRequestMethod,
+            url: str,
+            data: dict,
+            proxy: str,
+            timeout: int,
+            chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        raise SafeRequestError(f"{self.__class__.__name__} does not support streaming")
+
+    async def sweep(self):
+        """Release pooled resources that have been idle too long."""
+        pass
+
+    async def close(self):
+        """Release pooled resources (sessions, clients) held by the engine."""
+        pass
+
 
 class SafeRequestEngineAiohttp(SafeRequestEngine):
+    supports_stream = True
+
+    def __init__(
+            self,
+            limit: int = 100,
+            limit_per_host: int = 10,
+            keepalive_timeout: float = 30,
+            ttl_dns_cache: int = 300,
+    ):
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._ttl_dns_cache = ttl_dns_cache
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _client_session(self) -> aiohttp.ClientSession:
+        """Long-lived session; the connector keeps a keep-alive pool per host."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._limit,
+                    limit_per_host=self._limit_per_host,
+                    keepalive_timeout=self._keepalive_timeout,
+                    use_dns_cache=True,
+                    ttl_dns_cache=self._ttl_dns_cache,
+                    ssl=False,
+                ),
+                # Cookies are managed by SafeRequest, never shared via the pool
+                cookie_jar=aiohttp.DummyCookieJar(),
+            )
+
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _request(
+            self,
+            headers: dict,
+            method: SafeRequestMethod,
+            url: str,
+            data: dict,
+            proxy: str,
+            timeout: int,
+    ):
+        return self._client_session().request(
+            method=method.name.lower(),
+            url=url,
+            headers=headers,
+            json=data,
+            proxy=proxy,
+            timeout=timeout,
+            allow_redirects=True,
+            auto_decompress=True,
+            max_line_size=99999999,
+            compress=False,
+            read_until_eof=True,
+            expect100=True,
+            ssl=False,
+        )
+
     async def request(
             self,
             headers: dict,
@@ -102,46 +349,57 @@ class SafeRequestEngineAiohttp(SafeRequestEngine):
             data: dict,
             proxy: str,
             timeout: int,
+            max_body_size: Optional[int] = None,
     ) -> SafeRequestResponseData:
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                    method=method.name.lower(),
-                    url=url,
-                    headers=headers,
-                    json=data,
-                    data=data,
-                    proxy=proxy,
-                    timeout=timeout,
-                    allow_redirects=True,
-                    auto_decompress=True,
-                    max_line_size=99999999,
-                    read_bufsize=99999999,
-                    compress=False,
-                    read_until_eof=True,
-                    expect100=True,
-                    chunked=False,
-                    ssl=False,
-            ) as response:
-                data = await response.text()
-                cookies = response.cookies
-                access_token = (
-                    response.headers.get("Authorization").replace("Bearer ", "")
-                    if response.headers.get("Authorization") is not None
-                    else None
+        async with self._request(
+                headers, method, url, data, proxy, timeout
+        ) as response:
+            if response.status > 399:
+                raise SafeRequestError(
+                    f"Failed to request {url} with status code {response.status}",
+                    status_code=response.status,
                 )
 
-                if response.status > 399:
-                    raise SafeRequestError(
-                        f"Failed to request {url} with status code {response.status}"
-                    )
+            content = await _read_capped(
+                response.content.iter_chunked(STREAM_CHUNK_SIZE), url, max_body_size
+            )
+            access_token = (
+                response.headers.get("Authorization").replace("Bearer ", "")
+                if response.headers.get("Authorization") is not None
+                else None
+            )
 
-                return SafeRequestResponseData(
-                    data=data,
+            return SafeRequestResponseData(
+                content=content,
+                encoding=response.charset,
+                status_code=response.status,
+                cookies=response.cookies,
+                access_token=access_token,
+                headers=dict(response.headers),
+            )
+
+    async def stream(
+            self,
+            headers: dict,
+            method: SafeRequestMethod,
+            url: str,
+            data: dict,
+            proxy: str,
+            timeout: int,
+            chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        async with self._request(
+                headers, method, url, data, proxy, timeout
+        ) as response:
+            if response.status > 399:
+                raise SafeRequestError(
+                    f"Failed to request {url} with status code {response.status}",
                     status_code=response.status,
-                    cookies=cookies,
-                    access_token=access_token,
                 )
 
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+
 
 class SafeRequestEngineRequests(SafeRequestEngine):
     async def request(
@@ -152,13 +410,15 @@ class SafeRequestEngineRequests(SafeRequestEngine):
             data: dict,
             proxy: str,
             timeout: int,
+            max_body_size: Optional[int] = None,
     ) -> SafeRequestResponseData:
+        requests = await _async_import("requests")
         response = await asyncio.to_thread(
             requests.request,
             method=method.name.lower(),
             url=url,
             headers=headers,
-            data=data,
+            json=data,
             proxies={
                 "http": proxy,
                 "https": proxy,
@@ -167,62 +427,99 @@ class SafeRequestEngineRequests(SafeRequestEngine):
             else None,
             timeout=timeout,
             verify=False,
+            stream=True,
         )
 
         if response.status_code > 399:
+            response.close()
             raise SafeRequestError(
-                f"Failed to request {url} with status code {response.status_code}"
+                f"Failed to request {url} with status code {response.status_code}",
+                status_code=response.status_code,
             )
 
+        content = await asyncio.to_thread(
+            _read_capped_sync,
+            response.iter_content(STREAM_CHUNK_SIZE),
+            url,
+            max_body_size,
+        )
+
         return SafeRequestResponseData(
-            data=response.text,
+            content=content,
+            encoding=response.encoding,
             status_code=response.status_code,
             cookies=response.cookies.get_dict(),
             access_token=response.headers.get("Authorization").replace("Bearer ", "")
             if response.headers.get("Authorization") is not None
             else None,
+            headers=dict(response.headers),
         )
 
 
-class SafeRequestEngineSelenium(SafeRequestEngine):
-    async def request(
+class SafeRequestEngineBrowser(SafeRequestEngine):
+    """Base for browser engines; keeps a warm pool of drivers per proxy."""
+
+    # Launching a browser to measure it costs more than it could ever save
+    explore = False
+
+    def __init__(
             self,
-            headers: dict,
-            method: SafeRequestMethod,
-            url: str,
-            data: dict,
-            proxy: str,
-            timeout: int,
-    ) -> SafeRequestResponseData:
-        manager = ChromeDriverManager()
-        manager_install = await asyncio.to_thread(manager.install)
-        options = webdriver.ChromeOptions()
+            max_browsers: int = 2,
+            max_uses: int = 50,
+            idle_timeout: float = 300,
+            max_proxy_pools: int = 2,
+    ):
+        self._max_browsers = max_browsers
+        self._max_uses = max_uses
+        self._idle_timeout = idle_timeout
+        self._max_proxy_pools = max_proxy_pools
+        # Chrome takes the proxy at launch, so drivers are pooled per proxy
+        self._pools: dict[Optional[str], BrowserPool] = {}
+
+    async def _create_driver(self, proxy: Optional[str]):
+        pass
 
+    async def _pool(self, proxy: Optional[str]) -> BrowserPool:
+        if proxy in self._pools:
+            # Move to the end so the least recently used pool is evicted first
+            self._pools[proxy] = self._pools.pop(proxy)
+            return self._pools[proxy]
+
+        while len(self._pools) >= self._max_proxy_pools:
+            oldest = next(iter(self._pools))
+            await self._pools.pop(oldest).close()
+
+        self._pools[proxy] = BrowserPool(
+            factory=lambda: self._create_driver(proxy),
+            max_size=self._max_browsers,
+            max_uses=self._max_uses,
+            idle_timeout=self._idle_timeout,
+        )
+
+        return self._pools[proxy]
+
+    async def sweep(self):
+        for pool in list(self._pools.values()):
+            await pool.sweep()
+
+    async def close(self):
+        pools = list(self._pools.values())
+        self._pools = {}
+
+        for pool in pools:
+            await pool.close()
+
+    @staticmethod
+    def _chrome_arguments(options, proxy: Optional[str]):
         options.add_argument("--disable-gpu")
         options.add_argument("--no-sandbox")
         options.add_argument("--window-size=1420,1080")
         options.add_argument("--headless=new")
         if proxy is not None:
             options.add_argument(f"--proxy-server={proxy}")
-        driver = await asyncio.to_thread(
-            webdriver.Chrome, service=ChromeService(manager_install), options=options
-        )
-        driver.get(url)
-
-        all_cookies = driver.get_cookies()
-        cookies_dict = {}
-        for cookie in all_cookies:
-            cookies_dict[cookie["name"]] = cookie["value"]
-
-        return SafeRequestResponseData(
-            data=driver.page_source,
-            status_code=200,
-            cookies=cookies_dict,
-            access_token=None,
-        )
 
+        return options
 
-class SafeRequestEngineUndetectedSelenium(SafeRequestEngine):
     async def request(
             self,
             headers: dict,
@@ -231,32 +528,190 @@ class SafeRequestEngineUndetectedSelenium(SafeRequestEngine):
             data: dict,
             proxy: str,
             timeout: int,
+            max_body_size: Optional[int] = None,
     ) -> SafeRequestResponseData:
-        options = uc.ChromeOptions()
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--window-size=1420,1080")
-        options.add_argument("--headless=new")
-        if proxy is not None:
-            options.add_argument(f"--proxy-server={proxy}")
+        pool = await self._pool(proxy)
 
-        driver = await asyncio.to_thread(uc.Chrome, options=options)
+        async with pool.acquire() as driver:
+            return await asyncio.to_thread(self._browse, driver, url, timeout)
+
+    @staticmethod
+    def _browse(driver, url: str, timeout: int) -> SafeRequestResponseData:
+        driver.set_page_load_timeout(timeout)
         driver.get(url)
 
         all_cookies = driver.get_cookies()
         cookies_dict = {}
         for cookie in all_cookies:
             cookies_dict[cookie["name"]] = cookie["value"]
+        page_source = driver.page_source
+
+        # Pooled drivers must not leak cookies into the next request
+        driver.delete_all_cookies()
 
         return SafeRequestResponseData(
-            data=driver.page_source,
+            data=page_source,
             status_code=200,
             cookies=cookies_dict,
             access_token=None,
         )
 
 
+class SafeRequestEngineSelenium(SafeRequestEngineBrowser):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._driver_path: Optional[str] = None
+
+    async def _create_driver(self, proxy: Optional[str]):
+        webdriver = await _async_import("selenium.webdriver")
+        chrome_service = await _async_import("selenium.webdriver.chrome.service")
+
+        if self._driver_path is None:
+            webdriver_manager = await _async_import("webdriver_manager.chrome")
+            manager = webdriver_manager.ChromeDriverManager()
+            self._driver_path = await asyncio.to_thread(manager.install)
+
+        return await asyncio.to_thread(
+            webdriver.Chrome,
+            service=chrome_service.Service(self._driver_path),
+            options=self._chrome_arguments(webdriver.ChromeOptions(), proxy),
+        )
+
+
+class SafeRequestEngineUndetectedSelenium(SafeRequestEngineBrowser):
+    async def _create_driver(self, proxy: Optional[str]):
+        uc = await _async_import("undetected_chromedriver")
+
+        return await asyncio.to_thread(
+            uc.Chrome, options=self._chrome_arguments(uc.ChromeOptions(), proxy)
+        )
+
+
+class _ScraperSession:
+    def __init__(self, scraper: Any):
+        self.scraper = scraper
+        self.lock = asyncio.Lock()
+        self.created = time.monotonic()
+        self.last_used = self.created
+
+    def clearance_expired(self) -> bool:
+        now = time.time()
+
+        return any(
+            cookie.expires is not None and cookie.expires <= now
+            for cookie in self.scraper.cookies
+            if cookie.name == "cf_clearance"
+        )
+
+
 class SafeRequestEngineCloudscraper(SafeRequestEngine):
+    """Keeps a cloudscraper session per host and proxy, so a solved challenge
+    (its clearance cookies) is reused until it expires instead of every poll."""
+
+    # Cookies kept between requests; anything else is dropped like other engines do
+    CLEARANCE_COOKIE_PREFIXES = ("cf_", "__cf")
+
+    # Statuses of a failed or stale challenge, the session is solved again
+    CHALLENGE_STATUSES = frozenset({403, 429, 503})
+
+    def __init__(
+            self,
+            max_sessions: int = 16,
+            max_age: float = 1800,
+            idle_timeout: float = 600,
+    ):
+        self._max_sessions = max_sessions
+        self._max_age = max_age
+        self._idle_timeout = idle_timeout
+        self._sessions: dict[tuple[str, Optional[str]], _ScraperSession] = {}
+        # Sessions being created, concurrent first requests wait for the same one
+        self._pending: dict[tuple[str, Optional[str]], asyncio.Future] = {}
+
+    def _expired(self, session: _ScraperSession) -> bool:
+        now = time.monotonic()
+
+        return (
+            now - session.created > self._max_age
+            or now - session.last_used > self._idle_timeout
+            or session.clearance_expired()
+        )
+
+    async def _session(self, key: tuple[str, Optional[str]]) -> _ScraperSession:
+        while (pending := self._pending.get(key)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Only a cancelled creation is retried, not our own cancellation
+                if not pending.cancelled():
+                    raise
+
+        # Popped and put back so the least recently used session is evicted first
+        session = self._sessions.pop(key, None)
+        if session is not None and not self._expired(session):
+            self._sessions[key] = session
+
+            return session
+
+        # The key is reserved before the first await, so it gets a single scraper
+        pending = asyncio.get_running_loop().create_future()
+        self._pending[key] = pending
+        stale = [session] if session is not None else []
+        while self._sessions and len(self._sessions) + len(self._pending) > self._max_sessions:
+            stale.append(self._sessions.pop(next(iter(self._sessions))))
+
+        try:
+            for old in stale:
+                await self._discard(old)
+
+            cloudscraper = await _async_import("cloudscraper")
+            session = _ScraperSession(
+                await asyncio.to_thread(cloudscraper.create_scraper)
+            )
+        except Exception as e:
+            pending.set_exception(e)
+            # Retrieved here, so nobody waiting is not reported as a lost error
+            pending.exception()
+            raise
+        except BaseException:
+            pending.cancel()
+            raise
+        finally:
+            del self._pending[key]
+
+        self._sessions[key] = session
+        pending.set_result(session)
+
+        return session
+
+    @staticmethod
+    async def _discard(session: _ScraperSession):
+        try:
+            await asyncio.to_thread(session.scraper.close)
+        except Exception as e:
+            _LOGGER.debug("Failed to close cloudscraper session: %s", e)
+
+    def _forget(self, key: tuple[str, Optional[str]], session: _ScraperSession):
+        if self._sessions.get(key) is session:
+            del self._sessions[key]
+
+    async def sweep(self):
+        expired = [
+            key
+            for key, session in self._sessions.items()
+            if not session.lock.locked() and self._expired(session)
+        ]
+        sessions = [self._sessions.pop(key) for key in expired]
+
+        for session in sessions:
+            await self._discard(session)
+
+    async def close(self):
+        sessions = list(self._sessions.values())
+        self._sessions = {}
+
+        for session in sessions:
+            await self._discard(session)
+
     async def request(
             self,
             headers: dict,
@@ -265,40 +720,107 @@ class SafeRequestEngineCloudscraper(SafeRequestEngine):
             data: any,
             proxy: str,
             timeout: int,
+            max_body_size: Optional[int] = None,
     ) -> SafeRequestResponseData:
-        scraper = await asyncio.to_thread(cloudscraper.create_scraper)
-        response = await asyncio.to_thread(
-            scraper.request,
-            method=method.name.lower(),
-            url=url,
-            headers=headers,
-            json=data,
-            proxies={
-                "http": proxy,
-                "https": proxy,
-            }
-            if proxy is not None
-            else None,
-            timeout=timeout,
-            verify=False,
-        )
+        key = (urlsplit(url).netloc, proxy)
+        session = await self._session(key)
+
+        # requests sessions are not safe for concurrent use
+        async with session.lock:
+            try:
+                response = await asyncio.to_thread(
+                    session.scraper.request,
+                    method=method.name.lower(),
+                    url=url,
+                    headers=headers,
+                    json=data,
+                    proxies={
+                        "http": proxy,
+                        "https": proxy,
+                    }
+                    if proxy is not None
+                    else None,
+                    timeout=timeout,
+                    verify=False,
+                )
+            except Exception:
+                self._forget(key, session)
+                await self._discard(session)
+                raise
+            finally:
+                session.last_used = time.monotonic()
+
+            scraper_cookies = session.scraper.cookies
+            for cookie in list(scraper_cookies):
+                if not cookie.name.startswith(self.CLEARANCE_COOKIE_PREFIXES):
+                    scraper_cookies.clear(cookie.domain, cookie.path, cookie.name)
+
+        if response.status_code in self.CHALLENGE_STATUSES:
+            self._forget(key, session)
+            await self._discard(session)
 
         if response.status_code > 399:
             raise SafeRequestError(
-                f"Failed to request {url} with status code {response.status_code}"
+                f"Failed to request {url} with status code {response.status_code}",
+                status_code=response.status_code,
+            )
+
+        # Cloudscraper reads the body to detect challenges, so only cap it here
+        if max_body_size is not None and len(response.content) > max_body_size:
+            raise SafeRequestError(
+                f"Response body of {url} exceeds {max_body_size} bytes"
             )
 
         return SafeRequestResponseData(
-            data=response.text,
+            content=response.content,
+            encoding=response.encoding,
             status_code=response.status_code,
             cookies=response.cookies.get_dict(),
             access_token=response.headers.get("Authorization").replace("Bearer ", "")
             if response.headers.get("Authorization") is not None
             else None,
+            headers=dict(response.headers),
         )
 
 
 class SafeRequestEngineHttpx(SafeRequestEngine):
+    supports_stream = True
+
+    def __init__(
+            self,
+            max_connections: int = 100,
+            max_keepalive_connections: int = 20,
+            keepalive_expiry: float = 30,
+    ):
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._keepalive_expiry = keepalive_expiry
+        # httpx binds the proxy to the client, so keep one pooled client per proxy
+        self._clients: dict[Optional[str], "httpx.AsyncClient"] = {}
+
+    async def _client(self, proxy: Optional[str]) -> "httpx.AsyncClient":
+        client = self._clients.get(proxy)
+        if client is None or client.is_closed:
+            httpx = await _async_import("httpx")
+            client = httpx.AsyncClient(
+                verify=False,
+                proxy=proxy,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_keepalive_connections,
+                    keepalive_expiry=self._keepalive_expiry,
+                ),
+            )
+            self._clients[proxy] = client
+
+        return client
+
+    async def close(self):
+        clients = list(self._clients.values())
+        self._clients = {}
+        for client in clients:
+            await client.aclose()
+
     async def request(
             self,
             headers: dict,
@@ -307,42 +829,260 @@ class SafeRequestEngineHttpx(SafeRequestEngine):
             data: dict,
             proxy: str,
             timeout: int,
+            max_body_size: Optional[int] = None,
     ) -> SafeRequestResponseData:
-        async with httpx.AsyncClient(verify=False, proxy=proxy) as client:
-            response = await client.request(
+        client = await self._client(proxy)
+        async with client.stream(
                 method=method.name.lower(),
                 url=url,
                 headers=headers,
                 json=data,
                 timeout=timeout,
                 follow_redirects=True,
-            )
+        ) as response:
+            # Cookies are managed by SafeRequest, never shared via the pool
+            client.cookies.clear()
+
             if response.status_code > 399:
                 raise SafeRequestError(
-                    f"Failed to request {url} with status code {response.status_code}"
+                    f"Failed to request {url} with status code {response.status_code}",
+                    status_code=response.status_code,
                 )
 
-            return SafeRequestResponseData(
-                data=response.text,
-                status_code=response.status_code,
-                cookies=response.cookies,
-                access_token=response.headers.get("Authorization").replace(
-                    "Bearer ", ""
-                )
-                if response.headers.get("Authorization") is not None
-                else None,
+            content = await _read_capped(
+                response.aiter_bytes(STREAM_CHUNK_SIZE), url, max_body_size
             )
 
+        return SafeRequestResponseData(
+            content=content,
+            encoding=response.charset_encoding,
+            status_code=response.status_code,
+            cookies=response.cookies,
+            access_token=response.headers.get("Authorization").replace(
+                "Bearer ", ""
+            )
+            if response.headers.get("Authorization") is not None
+            else None,
+            headers=dict(response.headers),
+        )
+
+    async def stream(
+            self,
+            headers: dict,
+            method: SafeRequestMethod,
+            url: str,
+            data: dict,
+            proxy: str,
+            timeout: int,
+            chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        client = await self._client(proxy)
+        async with client.stream(
+                method=method.name.lower(),
+                url=url,
+                headers=headers,
+                json=data,
+                timeout=timeout,
+                follow_redirects=True,
+        ) as response:
+            client.cookies.clear()
+
+            if response.status_code > 399:
+                raise SafeRequestError(
+                    f"Failed to request {url} with status code {response.status_code}",
+                    status_code=response.status_code,
+                )
+
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+
+SAFE_REQUEST_ENGINES: dict[str, type[SafeRequestEngine]] = {
+    "aiohttp": SafeRequestEngineAiohttp,
+    "requests": SafeRequestEngineRequests,
+    "httpx": SafeRequestEngineHttpx,
+    "cloudscraper": SafeRequestEngineCloudscraper,
+    "selenium": SafeRequestEngineSelenium,
+    "undetected_selenium": SafeRequestEngineUndetectedSelenium,
+}
+
+_SHARED_ENGINES: dict[type, SafeRequestEngine] = {}
+
+
+def shared_engine(
+        engine_type: type[SafeRequestEngine] | str,
+) -> SafeRequestEngine:
+    """Process-wide engine instance, so pooled connections are reused across requests."""
+    if isinstance(engine_type, str):
+        if engine_type not in SAFE_REQUEST_ENGINES:
+            raise SafeRequestError(f"Unknown safe request engine {engine_type}")
+        engine_type = SAFE_REQUEST_ENGINES[engine_type]
+
+    if engine_type not in _SHARED_ENGINES:
+        _SHARED_ENGINES[engine_type] = engine_type()
+
+    return _SHARED_ENGINES[engine_type]
+
+
+def engine_name(engine: SafeRequestEngine | str) -> Optional[str]:
+    """Registry name of a shared engine, None for an instance configured directly."""
+    if isinstance(engine, str):
+        return engine
+
+    for name, engine_type in SAFE_REQUEST_ENGINES.items():
+        if isinstance(engine, engine_type) and _SHARED_ENGINES.get(engine_type) is engine:
+            return name
+
+    return None
+
+
+_ENGINE_STATS: dict[str, dict[str, RequestStats]] = {}
+
+# Share of requests that lead with an engine other than the best ranked one
+ENGINE_EXPLORATION_RATE = 0.05
+
+
+def engine_stats(host: str, engine: SafeRequestEngine | str) -> RequestStats:
+    """Per-host outcome/latency history of an engine.
+
+    Shared engines keep theirs by registry name for all SafeRequests; an
+    instance configured directly keeps its own, which goes away with it.
+    """
+    name = engine_name(engine)
+    if name is None:
+        if engine._host_stats is None:
+            engine._host_stats = {}
+        stats, name = engine._host_stats, host
+    else:
+        stats = _ENGINE_STATS.setdefault(host, {})
+
+    if name not in stats:
+        stats[name] = RequestStats()
+
+    return stats[name]
+
+
+def engine_diagnostics() -> dict:
+    return {
+        host: {name: stats.as_dict() for name, stats in engines.items()}
+        for host, engines in _ENGINE_STATS.items()
+    }
+
+
+_RESPONSE_CACHE = ResponseCache()
+
+
+def response_cache() -> ResponseCache:
+    """Response cache shared by every SafeRequest that enables caching."""
+    return _RESPONSE_CACHE
+
+
+_PROXY_MANAGER = ProxyManager()
+
+
+def proxy_manager() -> ProxyManager:
+    """Proxy health shared by every SafeRequest, so dead proxies are skipped everywhere."""
+    return _PROXY_MANAGER
+
+
+_REQUEST_SCHEDULER = RequestScheduler()
+
+
+def request_scheduler() -> RequestScheduler:
+    """Scheduler every engine call goes through (per-host rate, global concurrency)."""
+    return _REQUEST_SCHEDULER
+
+
+_USER_AGENT_POOL = UserAgentPool()
+
+
+def user_agent_pool() -> UserAgentPool:
+    """User agents shared by every SafeRequest, loaded on first use."""
+    return _USER_AGENT_POOL
+
+
+_COOKIE_STORE = CookieStore()
+
+
+def cookie_store() -> CookieStore:
+    """Cookies and tokens of SafeRequests with persistent sessions, per host."""
+    return _COOKIE_STORE
+
+
+HEDGE_BUDGET_PER_HOST = 4
+
+_HEDGE_BUDGETS: dict[str, asyncio.Semaphore] = {}
+
+
+def hedge_budget(host: str) -> asyncio.Semaphore:
+    """Caps concurrent hedged (extra) attempts per upstream host."""
+    if host not in _HEDGE_BUDGETS:
+        _HEDGE_BUDGETS[host] = asyncio.Semaphore(HEDGE_BUDGET_PER_HOST)
+
+    return _HEDGE_BUDGETS[host]
+
+
+# Exceptions of the engines' libraries that mean the connection (or the proxy
+# in front of it) failed, matched by name so none of them has to be imported
+_TRANSPORT_ERRORS = frozenset(
+    {
+        "aiohttp.client_exceptions.ClientConnectionError",
+        "aiohttp.client_exceptions.ClientHttpProxyError",
+        "httpx.TransportError",
+        "requests.exceptions.ConnectionError",
+        "requests.exceptions.Timeout",
+    }
+)
+
+# Chrome's network errors, as reported in a WebDriverException message
+_BROWSER_TRANSPORT_ERRORS = ("ERR_PROXY", "ERR_TUNNEL", "ERR_CONNECTION", "ERR_TIMED_OUT")
+
+
+def is_transport_error(error: BaseException) -> bool:
+    """Whether an engine failed to connect or time out, rather than got an answer.
+
+    Only these count against a proxy; an upstream 404/429, an oversized body
+    or a local engine error says nothing about the proxy's health.
+    """
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+
+    for cls in type(error).__mro__:
+        if f"{cls.__module__}.{cls.__qualname__}" in _TRANSPORT_ERRORS:
+            return True
+        if cls.__module__.startswith("selenium."):
+            return any(x in str(error) for x in _BROWSER_TRANSPORT_ERRORS)
+
+    return False
+
+
+async def async_sweep_engines():
+    """Release idle pooled resources (browsers, scrapers) of every shared engine."""
+    for engine in list(_SHARED_ENGINES.values()):
+        try:
+            await engine.sweep()
+        except Exception as e:
+            _LOGGER.debug("Failed to sweep %s: %s", engine.__class__.__name__, e)
+
+
+async def async_close_engines():
+    """Close every shared engine (called when the last config entry unloads)."""
+    engines = list(_SHARED_ENGINES.values())
+    _SHARED_ENGINES.clear()
+
+    for engine in engines:
+        try:
+            await engine.close()
+        except Exception as e:
+            _LOGGER.debug("Failed to close %s: %s", engine.__class__.__name__, e)
+
 
 class SafeRequest:
-    def __init__(self, chains: list[SafeRequestEngine] = None):
-        self._chains = (
-            [
-                SafeRequestEngineCloudscraper(),
-                SafeRequestEngineAiohttp(),
-                SafeRequestEngineRequests(),
-                SafeRequestEngineHttpx(),
-            ]
+    def __init__(self, chains: list[SafeRequestEngine | str] = None):
+        # Engines given by registry name are only created (and their
+        # dependencies imported) when the chain actually reaches them
+        self._chains: list[SafeRequestEngine | str] = (
+            ["cloudscraper", "aiohttp", "requests", "httpx"]
             if chains is None
             else chains
         )
@@ -353,13 +1093,23 @@ class SafeRequest:
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
             "Cache-Control": "max-age=0",
             "Content-Type": "application/json",
-            "Connection": "close",
+            "Connection": "keep-alive",
             "Sec-Fetch-Dest": "document",
             "Priority": "u=0, i",
         }
         self._timeout = 60
         self._proxies: list[str] = []
         self._cookies: dict = {}
+        self._adaptive = True
+        self._backoff_base = 0.5
+        self._backoff_factor = 2.0
+        self._backoff_max = 5.0
+        self._cache_enabled = False
+        self._cache_ttl: Optional[float] = None
+        self._priority = RequestPriority.NORMAL
+        self._max_body_size: Optional[int] = None
+        self._persist_session = False
+        self._session_key: Optional[str] = None
 
     def accept_text_html(self):
         """"""
@@ -414,26 +1164,109 @@ class SafeRequest:
             platforms.append("mobile")
         if pc_random:
             platforms.append("pc")
-        ua_engine = await asyncio.to_thread(
-            fake_useragent.UserAgent, platforms=platforms
-        )
-        self._headers["User-Agent"] = ua_engine.random
+        pool = await user_agent_pool().async_load()
+        profile = pool.random(platforms)
 
-        if mobile_random:
-            self._headers["Sec-Ch-Ua-Platform"] = '"Android"'
-            self._headers["Sec-Ch-Ua-Mobile"] = "?0"
-            self._headers["Sec-Ch-Ua"] = (
-                '"Not A;Brand";v="99", "Chromium";v="99", "Google Chrome";v="99"'
-            )
+        # Hints of a previous profile must not contradict the new User-Agent
+        for header in CLIENT_HINT_HEADERS:
+            self._headers.pop(header, None)
+        self._headers.update(profile.headers())
 
         return self
 
-    def chains(self, chains: list[SafeRequestEngine]):
+    def chains(self, chains: list[SafeRequestEngine | str]):
         """"""
         self._chains = chains
 
         return self
 
+    def adaptive(self, enabled: bool = True):
+        """Try the engine with the best per-host track record first"""
+        self._adaptive = enabled
+
+        return self
+
+    def backoff(self, base: float = 0.5, factor: float = 2.0, maximum: float = 5.0):
+        """Delay between fallback attempts (the first attempt never waits)"""
+        self._backoff_base = base
+        self._backoff_factor = factor
+        self._backoff_max = maximum
+
+        return self
+
+    def cache(self, enabled: bool = True, ttl: Optional[float] = None):
+        """Serve from the shared response cache; ttl overrides the endpoint TTL
+
+        Cached responses are shared between callers and therefore read-only
+        (see SafeRequestResponseData.freeze()).
+        """
+        self._cache_enabled = enabled
+        self._cache_ttl = ttl
+
+        return self
+
+    def max_body_size(self, size: Optional[int]):
+        """Fail responses whose body exceeds size bytes (None for no limit)"""
+        self._max_body_size = size
+
+        return self
+
+    def persist_session(self, enabled: bool = True, key: Optional[str] = None):
+        """Share cookies and the bearer token of each host through the cookie store
+
+        key keeps sessions apart that share a host (one per account)
+        """
+        self._persist_session = enabled
+        self._session_key = key
+
+        return self
+
+    def priority(self, priority: RequestPriority):
+        """Scheduling priority, USER for user-visible sensors"""
+        self._priority = priority
+
+        return self
+
+    def _ordered_chains(self, host: str) -> list[SafeRequestEngine | str]:
+        if not self._adaptive or len(self._chains) < 2:
+            return self._chains
+
+        def explorable(chain: SafeRequestEngine | str) -> bool:
+            engine_type = (
+                SAFE_REQUEST_ENGINES.get(chain) if isinstance(chain, str) else type(chain)
+            )
+            return engine_type is None or engine_type.explore
+
+        def rank(chain: SafeRequestEngine | str) -> float:
+            stats = engine_stats(host, chain)
+            if stats.attempts == 0:
+                # Untried engines are measured once, browsers only as a fallback
+                return 0.0 if explorable(chain) else float("inf")
+
+            return stats.expected_latency
+
+        # Stable sort: equally ranked engines keep their configured order
+        ordered = sorted(self._chains, key=rank)
+
+        # Now and then lead with another engine, so a faster one that had a
+        # bad run is measured again instead of staying behind forever
+        if random.random() < ENGINE_EXPLORATION_RATE:
+            candidates = [x for x in ordered[1:] if explorable(x)]
+            if len(candidates) > 0:
+                chosen = random.choice(candidates)
+                ordered.remove(chosen)
+                ordered.insert(0, chosen)
+
+        return ordered
+
+    def _backoff_delay(self, tries: int) -> float:
+        delay = min(
+            self._backoff_base * self._backoff_factor ** (tries - 1),
+            self._backoff_max,
+        )
+
+        return delay * random.uniform(0.5, 1.0)
+
     def auth(self, token: Optional[str]):
         """"""
         if token is not None:
@@ -505,21 +1338,242 @@ class SafeRequest:
             self, key: str = None, value: str = None, data: str = None, item: dict = None
     ):
         """"""
-        if key is not None and value is not None and data is None and item is None:
+        if key is None and data is None and item is None:
             return self
 
         if data is not None:
-            self._cookies = {
-                **self._cookies,
-                **Lu.map(data.split(";"), lambda x: x.split("=")).to_dict(),
-            }
+            self._cookies = {**self._cookies, **parse_cookie_header(data)}
         elif item is not None:
-            self._cookies = {**self._cookies, **item}
+            self._cookies = {**self._cookies, **cookie_values(item)}
         else:
             self._cookies[key] = value
 
         return self
 
+    def _request_headers(
+            self, host: Optional[str] = None, extra_headers: Optional[dict] = None
+    ) -> dict:
+        headers = self._headers
+        cookies = self._cookies
+
+        if self._persist_session and host is not None:
+            store = cookie_store()
+            key = self._session_key or host
+            cookies = {**store.cookies(key), **cookies}
+            token = store.token(key)
+            if token is not None and "Authorization" not in headers:
+                headers = {**headers, "Authorization": f"Bearer {token}"}
+
+        return {
+            **headers,
+            **{
+                "Cookie": "; ".join([f"{k}={v}" for k, v in cookies.items()]),
+            },
+            **(extra_headers or {}),
+        }
+
+    def _cache_identity(self, host: str) -> str:
+        """Who the response belongs to: credentials and session, hashed for the key."""
+        parts = [
+            self._headers.get("Authorization", ""),
+            "; ".join(f"{k}={v}" for k, v in sorted(self._cookies.items())),
+        ]
+        if self._persist_session:
+            # Stored cookies rotate, the session they belong to does not
+            parts.append(f"session:{self._session_key or host}")
+
+        if not any(parts):
+            return ""
+
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()[:32]
+
+    def _remember_session(self, host: str, response: SafeRequestResponseData):
+        if not self._persist_session or response.status_code > 399:
+            return
+
+        store = cookie_store()
+        key = self._session_key or host
+        store.update_cookies(key, response.cookies)
+        if response.access_token:
+            store.set_token(key, response.access_token)
+
+    def _pick_proxy(self) -> Optional[str]:
+        return proxy_manager().select(self._proxies) if len(self._proxies) > 0 else None
+
+    async def _attempt(
+            self,
+            engine: SafeRequestEngine,
+            host: str,
+            method: SafeRequestMethod,
+            url: str,
+            data: any,
+            proxy: Optional[str],
+            timeout: int,
+            extra_headers: Optional[dict] = None,
+    ) -> SafeRequestResponseData:
+        stats = engine_stats(host, engine)
+
+        async with request_scheduler().slot(host, self._priority):
+            started = time.monotonic()
+
+            try:
+                response = await engine.request(
+                    headers=self._request_headers(host, extra_headers),
+                    method=method,
+                    url=url,
+                    data=data,
+                    proxy=proxy,
+                    timeout=timeout,
+                    max_body_size=self._max_body_size,
+                )
+            except Exception as e:
+                stats.record_failure()
+                if is_transport_error(e):
+                    proxy_manager().record_failure(proxy)
+                raise
+
+            latency = time.monotonic() - started
+        stats.record_success(latency)
+        proxy_manager().record_success(proxy, latency)
+        self._remember_session(host, response)
+
+        return response
+
+    def _hedge_candidates(
+            self, chains: list[SafeRequestEngine | str], hedge: int
+    ) -> list[tuple[SafeRequestEngine | str, Optional[str]]]:
+        # A single-engine chain is hedged through different proxies instead
+        if len(chains) == 1 and len(self._proxies) > 0:
+            proxies = proxy_manager().select_many(self._proxies, hedge)
+            if len(proxies) > 0:
+                return [(chains[0], proxy) for proxy in proxies]
+
+        return [(chain, self._pick_proxy()) for chain in chains[:hedge]]
+
+    async def _race(
+            self,
+            candidates: list[tuple[SafeRequestEngine | str, Optional[str]]],
+            host: str,
+            method: SafeRequestMethod,
+            url: str,
+            data: any,
+            timeout: int,
+            hedge_delay: float,
+            errors: list,
+            extra_headers: Optional[dict] = None,
+    ) -> tuple[Optional[SafeRequestResponseData], int]:
+        """Start candidates hedge_delay apart, return the first success and cancel the rest."""
+        budget = hedge_budget(host)
+        pending: set[asyncio.Task] = set()
+        held = 0
+        started = 0
+
+        def first_success(done: set[asyncio.Task]):
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                errors.append(task.exception())
+            return None
+
+        try:
+            for chain, proxy in candidates:
+                # Only extra (hedged) attempts are charged against the host budget
+                if started > 0:
+                    if budget.locked():
+                        break
+                    await budget.acquire()
+                    held += 1
+
+                engine = shared_engine(chain) if isinstance(chain, str) else chain
+                _LOGGER.debug(
+                    "Hedged request with %s [%s] %s [Proxy: %s]",
+                    engine.__class__.__name__,
+                    method.name,
+                    url,
+                    proxy,
+                )
+                pending.add(
+                    asyncio.create_task(
+                        self._attempt(
+                            engine,
+                            host,
+                            method,
+                            url,
+                            data,
+                            proxy,
+                            timeout,
+                            extra_headers,
+                        )
+                    )
+                )
+                started += 1
+
+                done, pending = await asyncio.wait(
+                    pending, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                result = first_success(done)
+                if result is not None:
+                    return result, started
+
+            while len(pending) > 0:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                result = first_success(done)
+                if result is not None:
+                    return result, started
+        finally:
+            for task in pending:
+                task.cancel()
+            if len(pending) > 0:
+                await asyncio.gather(*pending, return_exceptions=True)
+            for _ in range(held):
+                budget.release()
+
+        return None, started
+
+    async def stream(
+            self,
+            url: str,
+            method: SafeRequestMethod = SafeRequestMethod.GET,
+            data: any = None,
+            timeout: int = 60,
+            chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Yield the response body in chunks, for incremental parsers.
+
+        Uses the best streaming capable engine of the chain; there is no
+        fallback once the first chunk has been yielded.
+        """
+        host = urlsplit(url).netloc
+        engines = [
+            shared_engine(chain) if isinstance(chain, str) else chain
+            for chain in self._ordered_chains(host)
+        ]
+        engine = next((x for x in engines if x.supports_stream), None)
+        if engine is None:
+            raise SafeRequestError("No engine in the chain supports streaming")
+
+        proxy = self._pick_proxy()
+        received = 0
+
+        async with request_scheduler().slot(host, self._priority):
+            async for chunk in engine.stream(
+                    headers=self._request_headers(host),
+                    method=method,
+                    url=url,
+                    data=data,
+                    proxy=proxy,
+                    timeout=timeout,
+                    chunk_size=chunk_size,
+            ):
+                received += len(chunk)
+                if self._max_body_size is not None and received > self._max_body_size:
+                    raise SafeRequestError(
+                        f"Response body of {url} exceeds {self._max_body_size} bytes"
+                    )
+                yield chunk
+
     async def request(
             self,
             url: str,
@@ -529,26 +1583,128 @@ class SafeRequest:
             raise_errors: bool = False,
             max_tries: int = 10,
             post_try_callables: list[Callable[[Self], Awaitable[None]]] = None,
+            hedge: int = 1,
+            hedge_delay: float = 0.3,
+    ) -> SafeRequestResponseData:
+        """Request url through the engine chain.
+
+        With hedge > 1 the first `hedge` engines (or the only engine through
+        different proxies) are raced, started `hedge_delay` seconds apart, before
+        falling back to the remaining chain.
+        """
+        if not self._cache_enabled:
+            return await self._request_chain(
+                url,
+                method,
+                data,
+                timeout,
+                raise_errors,
+                max_tries,
+                post_try_callables,
+                hedge,
+                hedge_delay,
+            )
+
+        cache = response_cache()
+        key = cache.key(
+            method.name, url, data, self._cache_identity(urlsplit(url).netloc)
+        )
+        entry = cache.get(key)
+
+        if entry is not None and entry.fresh:
+            cache.hits += 1
+            return entry.response
+
+        async def fetch() -> SafeRequestResponseData:
+            cache.misses += 1
+            ttl = self._cache_ttl if self._cache_ttl is not None else cache.ttl(url)
+            conditional = (
+                entry.conditional_headers()
+                if entry is not None and entry.revalidatable
+                else None
+            )
+            response = await self._request_chain(
+                url,
+                method,
+                data,
+                timeout,
+                raise_errors,
+                max_tries,
+                post_try_callables,
+                hedge,
+                hedge_delay,
+                conditional,
+            )
+
+            if response.status_code == 304 and entry is not None:
+                cache.revalidated += 1
+                entry.refresh(ttl)
+                return entry.response
+
+            # Coalesced callers share this response as well
+            response = response.freeze()
+            if response.has:
+                cache.store(key, response, ttl, response.headers)
+
+            return response
+
+        return await cache.coalesce(key, fetch)
+
+    async def _request_chain(
+            self,
+            url: str,
+            method: SafeRequestMethod,
+            data: any,
+            timeout: int,
+            raise_errors: bool,
+            max_tries: int,
+            post_try_callables: Optional[list[Callable[[Self], Awaitable[None]]]],
+            hedge: int,
+            hedge_delay: float,
+            extra_headers: Optional[dict] = None,
     ) -> SafeRequestResponseData:
         errors = []
         tries = 0
         return_data = SafeRequestResponseData()
+        host = urlsplit(url).netloc
+        chains = self._ordered_chains(host)
+
+        if hedge > 1:
+            candidates = self._hedge_candidates(chains, min(hedge, max_tries))
+            result, tries = await self._race(
+                candidates,
+                host,
+                method,
+                url,
+                data,
+                timeout,
+                hedge_delay,
+                errors,
+                extra_headers,
+            )
+
+            if result is not None:
+                if result.status_code <= 399:
+                    self.cookie(item=result.cookies)
+                return result
 
-        for chain in self._chains:
-            await asyncio.sleep(random.randrange(1, 2))
+            raced = [chain for chain, _ in candidates[:tries]]
+            chains = [chain for chain in chains if chain not in raced]
 
+        for chain in chains:
             if tries >= max_tries:
                 return return_data
 
+            if tries > 0:
+                await asyncio.sleep(self._backoff_delay(tries))
+
+            engine = shared_engine(chain) if isinstance(chain, str) else chain
+
             if tries > 0 and post_try_callables is not None:
                 for callable_ in post_try_callables:
                     await callable_(self)
 
-            proxy = (
-                random.choice(self._proxies + [None])
-                if len(self._proxies) > 0
-                else None
-            )
+            proxy = self._pick_proxy()
 
             if proxy is not None:
                 _LOGGER.debug(
@@ -560,20 +1716,8 @@ class SafeRequest:
                 )
 
             try:
-                return_data = await chain.request(
-                    headers={
-                        **self._headers,
-                        **{
-                            "Cookie": "; ".join(
-                                [f"{k}={v}" for k, v in self._cookies.items()]
-                            ),
-                        },
-                    },
-                    method=method,
-                    url=url,
-                    data=data,
-                    proxy=proxy,
-                    timeout=timeout,
+                return_data = await self._attempt(
+                    engine, host, method, url, data, proxy, timeout, extra_headers
                 )
 
                 if return_data.status_code <= 399:
@@ -581,7 +1725,7 @@ class SafeRequest:
 
                 _LOGGER.debug(
                     "Safe request success with %s [%s] (%s) [Proxy: %s] <%s>",
-                    chain.__class__.__name__,
+                    engine.__class__.__name__,
                     method.name,
                     url,
                     proxy,
@@ -591,7 +1735,7 @@ class SafeRequest:
                 return return_data
             except Exception as e:
                 _LOGGER.error(
-                    f"Failed to request {url} with {chain.__class__.__name__}: {e}"
+                    f"Failed to request {url} with {engine.__class__.__name__}: {e}"
                 )
                 errors.append(e)
                 pass
@@ -0,0 +1,132 @@
+import bisect
+import heapq
+import re
+from typing import Hashable
+
+from custom_components.transportation.utilities.hangul import (
+    chosung,
+    decompose,
+    normalize,
+    romanize,
+)
+
+_WORD_SEPARATOR = re.compile(r"[\W_]+")
+
+# Lower is better
+RANK_EXACT = 0
+RANK_PREFIX = 1
+RANK_WORD_PREFIX = 2
+RANK_SUBSTRING = 3
+
+
+def search_forms(text: str) -> set[str]:
+    """Searchable spellings of text: jamo, initial consonants and romanized."""
+    normalized = normalize(text)
+    if len(normalized) == 0:
+        return set()
+
+    return {decompose(normalized), chosung(normalized), romanize(normalized)}
+
+
+class SearchIndex:
+    """Name search over many entries (stations), built once and queried per keystroke.
+
+    Every name is indexed as Hangul jamo, initial consonants (chosung) and
+    Revised Romanization, so "ㄱㄴ", "강나" and "gangnam" all find 강남. Prefix
+    matches come from a sorted term list, substring matches from bigram postings.
+    """
+
+    def __init__(self):
+        self._keys: list[Hashable] = []
+        self._names: list[str] = []
+        self._terms: list[str] = []
+        self._term_entry: list[int] = []
+        self._prefixes: list[tuple[str, int, int]] = []
+        self._grams: dict[str, list[int]] = {}
+        self._sorted = True
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: Hashable, name: str, *aliases: str):
+        entry = len(self._keys)
+        self._keys.append(key)
+        self._names.append(name)
+
+        for text in (name, *aliases):
+            words = [x for x in _WORD_SEPARATOR.split(text) if x]
+            for position in range(len(words)):
+                rank = RANK_PREFIX if position == 0 else RANK_WORD_PREFIX
+                for form in search_forms("".join(words[position:])):
+                    if position == 0:
+                        self._add_term(entry, form)
+                    self._prefixes.append((form, entry, rank))
+
+        self._sorted = False
+
+        return self
+
+    def _add_term(self, entry: int, term: str):
+        index = len(self._terms)
+        self._terms.append(term)
+        self._term_entry.append(entry)
+
+        for gram in {term[i : i + 2] for i in range(len(term) - 1)}:
+            self._grams.setdefault(gram, []).append(index)
+
+    def build(self):
+        self._prefixes.sort()
+        self._sorted = True
+
+        return self
+
+    def search(self, query: str, limit: int = 10) -> list[Hashable]:
+        """Keys of the best matching entries, best first."""
+        return [self._keys[x] for x in self._search(query, limit)]
+
+    def search_names(self, query: str, limit: int = 10) -> list[tuple[Hashable, str]]:
+        return [(self._keys[x], self._names[x]) for x in self._search(query, limit)]
+
+    def _search(self, query: str, limit: int) -> list[int]:
+        query = decompose(normalize(query))
+        if len(query) == 0 or limit <= 0:
+            return []
+        if not self._sorted:
+            self.build()
+
+        best: dict[int, int] = {}
+
+        start = bisect.bisect_left(self._prefixes, (query,))
+        for i in range(start, len(self._prefixes)):
+            term, entry, rank = self._prefixes[i]
+            if not term.startswith(query):
+                break
+            if len(term) == len(query) and rank == RANK_PREFIX:
+                rank = RANK_EXACT
+            if rank < best.get(entry, RANK_SUBSTRING + 1):
+                best[entry] = rank
+
+        # Substring matches rank last, only look for them when short of results
+        if len(best) < limit:
+            for index in self._substring_terms(query):
+                best.setdefault(self._term_entry[index], RANK_SUBSTRING)
+
+        return heapq.nsmallest(
+            limit, best, key=lambda x: (best[x], len(self._names[x]), x)
+        )
+
+    def _substring_terms(self, query: str) -> list[int]:
+        if len(query) < 2:
+            return []
+
+        postings = []
+        for gram in {query[i : i + 2] for i in range(len(query) - 1)}:
+            posting = self._grams.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+
+        # Verify the rarest gram's terms instead of intersecting every posting
+        candidates = min(postings, key=len)
+
+        return [x for x in candidates if query in self._terms[x]]
@@ -0,0 +1,166 @@
+import asyncio
+import dataclasses
+import importlib
+import itertools
+import json
+import logging
+import os
+import random
+from typing import Iterable, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+PLATFORMS = ("pc", "mobile", "tablet")
+
+# Client hint platform names, by fake_useragent os
+_HINT_PLATFORMS = {
+    "win10": "Windows",
+    "windows": "Windows",
+    "macos": "macOS",
+    "linux": "Linux",
+    "android": "Android",
+    "chromeos": "Chrome OS",
+}
+
+# Brand of each Chromium based browser in Sec-Ch-Ua
+_HINT_BRANDS = {
+    "chrome": "Google Chrome",
+    "edge": "Microsoft Edge",
+}
+
+CLIENT_HINT_HEADERS = ("Sec-Ch-Ua", "Sec-Ch-Ua-Mobile", "Sec-Ch-Ua-Platform")
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class UserAgentProfile:
+    user_agent: str
+    platform: str
+    browser: str = ""
+    version: float = 0
+    os: str = ""
+    percent: float = 1.0
+
+    def headers(self) -> dict[str, str]:
+        """User-Agent plus the client hints a real browser of this kind sends."""
+        headers = {"User-Agent": self.user_agent}
+
+        brand = _HINT_BRANDS.get(self.browser)
+        hint_platform = _HINT_PLATFORMS.get(self.os)
+        # Only Chromium sends client hints, and not on iOS (WebKit underneath)
+        if brand is None or hint_platform is None:
+            return headers
+
+        major = int(self.version)
+        headers["Sec-Ch-Ua"] = (
+            f'"{brand}";v="{major}", "Chromium";v="{major}", "Not A(Brand";v="99"'
+        )
+        headers["Sec-Ch-Ua-Mobile"] = "?0" if self.platform == "pc" else "?1"
+        headers["Sec-Ch-Ua-Platform"] = f'"{hint_platform}"'
+
+        return headers
+
+    @staticmethod
+    def from_dict(data: dict) -> "UserAgentProfile":
+        return UserAgentProfile(
+            user_agent=data["useragent"],
+            platform=data.get("type", "pc"),
+            browser=data.get("browser", ""),
+            version=float(data.get("version") or 0),
+            os=data.get("os", ""),
+            percent=float(data.get("percent") or 1.0),
+        )
+
+
+FALLBACK_PROFILE = UserAgentProfile(
+    user_agent=(
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+    ),
+    platform="pc",
+    browser="chrome",
+    version=122,
+    os="win10",
+)
+
+
+class UserAgentPool:
+    """User agents loaded once per process, picked by weight in microseconds.
+
+    The data comes from fake_useragent; with a path it is also kept on disk, so
+    later starts read one small file instead of importing the package.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._profiles: Optional[list[UserAgentProfile]] = None
+        self._buckets: dict[tuple[str, ...], tuple[list, list]] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._profiles is not None
+
+    def _read(self) -> list[dict]:
+        if self.path is not None and os.path.exists(self.path):
+            try:
+                with open(self.path, encoding="utf-8") as file:
+                    return json.load(file)
+            except (OSError, ValueError) as e:
+                _LOGGER.debug(
+                    "Ignoring unreadable user agent file %s: %s", self.path, e
+                )
+
+        data = importlib.import_module("fake_useragent.utils").load()
+
+        if self.path is not None:
+            try:
+                with open(self.path, "w", encoding="utf-8") as file:
+                    json.dump(data, file)
+            except OSError as e:
+                _LOGGER.debug("Could not persist user agents to %s: %s", self.path, e)
+
+        return data
+
+    def load(self):
+        try:
+            profiles = [UserAgentProfile.from_dict(x) for x in self._read()]
+        except Exception as e:
+            _LOGGER.warning("Failed to load user agents, using a fallback: %s", e)
+            profiles = []
+
+        self._profiles = profiles or [FALLBACK_PROFILE]
+        self._buckets = {}
+
+        return self
+
+    async def async_load(self):
+        if self._profiles is not None:
+            return self
+
+        async with self._lock:
+            if self._profiles is None:
+                await asyncio.to_thread(self.load)
+
+        return self
+
+    def _bucket(self, platforms: tuple[str, ...]) -> tuple[list, list]:
+        if platforms not in self._buckets:
+            candidates = [x for x in self._profiles if x.platform in platforms]
+            if len(candidates) == 0:
+                candidates = [FALLBACK_PROFILE]
+            self._buckets[platforms] = (
+                candidates,
+                list(itertools.accumulate(max(x.percent, 0.01) for x in candidates)),
+            )
+
+        return self._buckets[platforms]
+
+    def random(self, platforms: Optional[Iterable[str]] = None) -> UserAgentProfile:
+        """Weighted random profile of the given platforms (all when empty)."""
+        if self._profiles is None:
+            self.load()
+
+        key = tuple(sorted(set(platforms or PLATFORMS)))
+        candidates, weights = self._bucket(key)
+
+        return random.choices(candidates, cum_weights=weights)[0]
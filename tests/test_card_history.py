@@ -0,0 +1,128 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from custom_components.transportation.components.card_history import (
+    CardHistories,
+    CardHistory,
+)
+from custom_components.transportation.data.transport_card import (
+    CardStatus,
+    CardTransaction,
+)
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+def _tap(
+    transaction_id: str, minutes_ago: float, amount: int = 1500
+) -> CardTransaction:
+    return CardTransaction(
+        transaction_id=transaction_id,
+        used_at=NOW - timedelta(minutes=minutes_ago),
+        amount=amount,
+        location=f"Station {transaction_id}",
+    )
+
+
+def test_add_keeps_cursor_order_for_late_arrivals():
+    history = CardHistory()
+    history.add([_tap("a", 30), _tap("c", 10)])
+
+    added = history.add([_tap("b", 20)])
+
+    assert added == 1
+    assert [x["id"] for x in history.to_list()] == ["a", "b", "c"]
+    assert history.cursor == _tap("c", 10).cursor
+    assert history.last.transaction_id == "c"
+
+
+def test_add_ignores_duplicate_ids():
+    history = CardHistory()
+    history.add([_tap("a", 30), _tap("b", 20)])
+
+    added = history.add([_tap("b", 20), _tap("b", 20), _tap("c", 10)])
+
+    assert added == 1
+    assert len(history) == 3
+    assert history.use_count == 3
+    assert history.use_amount == 4500
+
+
+def test_same_second_taps_are_ordered_by_id():
+    history = CardHistory()
+
+    history.add([_tap("b", 5), _tap("a", 5)])
+
+    assert [x["id"] for x in history.to_list()] == ["a", "b"]
+
+
+def test_expire_updates_totals():
+    history = CardHistory(window=timedelta(days=1))
+    history.add(
+        [
+            _tap("old", 60 * 24 * 2, amount=1000),
+            _tap("older", 60 * 24 * 3, amount=2000),
+            _tap("new", 10, amount=1500),
+        ]
+    )
+
+    dropped = history.expire(NOW)
+
+    assert dropped == 2
+    assert len(history) == 1
+    assert (history.use_count, history.use_amount) == (1, 1500)
+    # Expired ids may come back (e.g. a refetch), they are not new then
+    assert history.add([_tap("old", 60 * 24 * 2)]) == 1
+
+
+def test_snapshot():
+    history = CardHistory()
+    history.add([_tap("a", 30), _tap("b", 10)])
+    status = CardStatus(card_number="1234", balance=5000)
+
+    snapshot = history.snapshot(status)
+
+    assert snapshot.status is status
+    assert (snapshot.use_count, snapshot.use_amount) == (2, 3000)
+    assert snapshot.last_used_at == _tap("b", 10).used_at
+    assert snapshot.last_location == "Station b"
+
+
+def test_from_list_round_trip():
+    history = CardHistory()
+    history.add([_tap("a", 30), _tap("b", 20, amount=1250)])
+
+    restored = CardHistory.from_list(history.to_list(), history.window)
+
+    assert restored.to_list() == history.to_list()
+    assert restored.cursor == history.cursor
+    assert (restored.use_count, restored.use_amount) == (2, 2750)
+    assert restored.add([_tap("b", 20)]) == 0
+
+
+class MemoryStore:
+    def __init__(self, data=None):
+        self.data = data
+        self.delayed = None
+
+    async def async_load(self):
+        return self.data
+
+    async def async_save(self, data):
+        self.data = data
+
+    def async_delay_save(self, data_func, delay):
+        self.delayed = data_func
+
+
+def test_histories_resume_from_store():
+    histories = CardHistories()
+    histories.get("1234").add([_tap("a", 30)])
+    store = MemoryStore()
+    asyncio.run(histories.async_attach(store))
+    histories.changed()
+
+    resumed = CardHistories()
+    asyncio.run(resumed.async_attach(MemoryStore(store.delayed())))
+
+    assert resumed.get("1234").to_list() == histories.get("1234").to_list()
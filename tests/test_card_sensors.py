@@ -0,0 +1,118 @@
+import asyncio
+import json
+import tempfile
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import frame
+
+from custom_components.transportation import sensor as platform
+from custom_components.transportation.consts.configs import (
+    CONF_SETUP_COUNTRY_INPUT,
+    CONF_SETUP_SERVICE_INPUT,
+)
+from custom_components.transportation.consts.country import COUNTRY_KOREA
+from custom_components.transportation.consts.defaults import DOMAIN
+from custom_components.transportation.consts.service import (
+    SERVICE_KAKAO,
+    SERVICE_TMONEY,
+)
+from custom_components.transportation.services.public_transportation.adapter.tmoney import (
+    api as tmoney,
+)
+from custom_components.transportation.utilities.safe_request import (
+    SafeRequest,
+    SafeRequestResponseData,
+    cookie_store,
+)
+
+CARD_NUMBER = "1111222233334444"
+
+ANSWERS = {
+    tmoney.LOGIN_PATH: {"data": {"accessToken": "token"}},
+    tmoney.CARDS_PATH: {"data": {"items": [{"cardNo": CARD_NUMBER}]}},
+    tmoney.CARD_PATH: {
+        "data": {"cardNo": CARD_NUMBER, "balance": "1,000", "expireDate": "20300101"}
+    },
+    tmoney.HISTORY_PATH: {
+        "data": {
+            "items": [
+                {
+                    "trdSeq": "2",
+                    "trdDtm": "20261018100000",
+                    "trdAmt": "1500",
+                    "useLocation": "Gangnam",
+                },
+                {"trdSeq": "1", "trdDtm": "20261017090000", "trdAmt": "1250"},
+            ],
+            "hasNext": False,
+        }
+    },
+}
+
+
+async def _upstream(self, url: str, **kwargs) -> SafeRequestResponseData:
+    path = url.removeprefix(tmoney.TMONEY_URL).split("?")[0]
+    body = {tmoney.RESULT_CODE: tmoney.RESULT_OK, **ANSWERS[path]}
+
+    return SafeRequestResponseData(content=json.dumps(body).encode(), status_code=200)
+
+
+def _entry(service: str) -> ConfigEntry:
+    return ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="T-money - user",
+        data={
+            CONF_SETUP_COUNTRY_INPUT: COUNTRY_KOREA,
+            CONF_SETUP_SERVICE_INPUT: service,
+            CONF_USERNAME: "user",
+            CONF_PASSWORD: "secret",
+        },
+        source="user",
+        options={},
+        unique_id=f"{service}_user",
+        discovery_keys={},
+        subentries_data=None,
+    )
+
+
+async def _setup(service: str) -> list:
+    hass = HomeAssistant(tempfile.mkdtemp())
+    frame.async_setup(hass)
+    entities = []
+    try:
+        await platform.async_setup_entry(hass, _entry(service), entities.extend)
+        if entities:
+            coordinator = entities[0].coordinator
+            unsubscribe = coordinator.async_add_listener(lambda: None, CARD_NUMBER)
+            await coordinator.async_refresh()
+            unsubscribe()
+            await coordinator.async_shutdown()
+    finally:
+        await hass.async_stop(force=True)
+
+    return entities
+
+
+def test_card_account_gets_card_sensors(monkeypatch):
+    monkeypatch.setattr(SafeRequest, "request", _upstream)
+    cookie_store().clear("tmoney:user")
+
+    entities = asyncio.run(_setup(SERVICE_TMONEY))
+
+    values = {entity.key: entity.native_value for entity in entities}
+    assert values["balance"] == 1000
+    assert values["use_count"] == 2
+    assert values["use_amount"] == 2750
+    assert values["last_location"] == "Gangnam"
+    assert values["expiration_date"].isoformat() == "2030-01-01"
+    assert {entity.unique_id for entity in entities} == {
+        f"{DOMAIN}_card_{CARD_NUMBER}_{key}" for key in values
+    }
+
+
+def test_station_entries_get_no_card_sensors():
+    assert asyncio.run(_setup(SERVICE_KAKAO)) == []
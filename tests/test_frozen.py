@@ -0,0 +1,39 @@
+from custom_components.transportation.utilities.frozen import (
+    FrozenDict,
+    FrozenList,
+    copy_tree,
+    freeze,
+)
+from custom_components.transportation.utilities.list import Lu
+
+
+def test_copy_tree_thaws_frozen_data():
+    snapshot = freeze({"items": [{"id": 1}], "meta": {"page": 1}})
+
+    copied = Lu.copy(snapshot)
+    copied["items"][0]["id"] = 2
+    copied["items"].append({"id": 3})
+    copied["meta"]["page"] = 2
+
+    assert type(copied) is dict and type(copied["items"]) is list
+    assert snapshot == {"items": [{"id": 1}], "meta": {"page": 1}}
+    assert isinstance(snapshot["items"], FrozenList)
+
+
+def test_copy_tree_rebuilds_plain_containers():
+    payload = {"items": [{"id": 1}], "pair": (1, [2])}
+
+    copied = copy_tree(payload)
+
+    assert copied == payload
+    assert copied["items"][0] is not payload["items"][0]
+    assert copied["pair"][1] is not payload["pair"][1]
+
+
+def test_freeze_shares_frozen_branches():
+    branch = freeze({"id": 1})
+
+    snapshot = freeze({"branch": branch, "new": {"id": 2}})
+
+    assert snapshot["branch"] is branch
+    assert isinstance(snapshot["new"], FrozenDict)
@@ -0,0 +1,62 @@
+import pytest
+
+from custom_components.transportation.utilities import html_extract
+from custom_components.transportation.utilities.html_extract import HtmlLayout
+
+DOCUMENT = """
+<html><body>
+  <table class="small"><tr><td>9</td><td><a href="/9">Nine</a></td></tr></table>
+  <table id="timetable" class="big wide">
+    <tr><td>1</td><td><a href="/1">One</a></td></tr>
+    <tr><td>2</td><td><a href="/2">Two</a></td></tr>
+  </table>
+</body></html>
+"""
+
+BACKENDS = [
+    "bs4",
+    pytest.param(
+        "lxml",
+        marks=pytest.mark.skipif(
+            html_extract.etree is None, reason="lxml is not installed"
+        ),
+    ),
+]
+
+ROWS = [
+    {"number": 1, "name": "One", "link": "/1"},
+    {"number": 2, "name": "Two", "link": "/2"},
+]
+
+
+def _layout(scope: str | None, backend: str) -> HtmlLayout:
+    return HtmlLayout(
+        rows="tr",
+        fields={"number": "td", "name": "a", "link": "a::attr(href)"},
+        scope=scope,
+        parsers={"number": int},
+        backend=backend,
+    )
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize(
+    "scope", [".big", "table.big", "#timetable", "table#timetable"]
+)
+def test_scoped_rows(scope, backend):
+    assert _layout(scope, backend).extract(DOCUMENT) == ROWS
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_unscoped_rows(backend):
+    rows = _layout(None, backend).extract(DOCUMENT.encode())
+
+    assert [row["number"] for row in rows] == [9, 1, 2]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_chunked_rows(backend):
+    data = DOCUMENT.encode()
+    chunks = [data[i : i + 16] for i in range(0, len(data), 16)]
+
+    assert list(_layout(".big", backend).extract_chunks(chunks)) == ROWS
@@ -0,0 +1,62 @@
+"""Startup import benchmark: the integration loads without the browser stacks.
+
+Run with ``python -m pytest tests/test_import_time.py -s`` to see the timings.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Heavyweight engine dependencies, only imported once an engine is selected
+ENGINE_MODULES = (
+    "selenium",
+    "undetected_chromedriver",
+    "webdriver_manager",
+    "cloudscraper",
+    "httpx",
+    "fake_useragent",
+)
+
+IMPORTS = (
+    "custom_components.transportation",
+    "custom_components.transportation.config_flow",
+    "custom_components.transportation.utilities.safe_request",
+)
+
+_SCRIPT = """
+import json, sys, time
+
+timings = {}
+for name in %r:
+    start = time.perf_counter()
+    __import__(name)
+    timings[name] = time.perf_counter() - start
+
+print(json.dumps({"timings": timings, "modules": sorted(sys.modules)}))
+"""
+
+
+def _import_fresh() -> dict:
+    # A fresh interpreter, so nothing imported by pytest or other tests counts
+    result = subprocess.run(
+        [sys.executable, "-c", _SCRIPT % (IMPORTS,)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_import_skips_engine_dependencies():
+    runs = [_import_fresh() for _ in range(3)]
+    best = {name: min(run["timings"][name] for run in runs) for name in IMPORTS}
+    for name, seconds in best.items():
+        print(f"import {name}: {seconds * 1000:.1f} ms")
+
+    loaded = {module.split(".")[0] for module in runs[0]["modules"]}
+    assert loaded.isdisjoint(ENGINE_MODULES), loaded & set(ENGINE_MODULES)
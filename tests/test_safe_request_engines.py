@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from custom_components.transportation.utilities.safe_request import (
+    SafeRequestEngine,
+    SafeRequestError,
+    SafeRequestMethod,
+    shared_engine,
+)
+
+HTTP_ENGINES = ["aiohttp", "requests", "httpx", "cloudscraper"]
+
+BODY = {"loginId": "user", "password": "secret", "nested": {"keep": [1, 2]}}
+
+
+async def _echo(request: web.Request) -> web.Response:
+    if request.path == "/unauthorized":
+        return web.json_response({}, status=401)
+
+    return web.json_response(
+        {
+            "method": request.method,
+            "content_type": request.content_type,
+            "body": await request.json() if request.can_read_body else None,
+        }
+    )
+
+
+async def _request(engine_name: str, path: str, method: SafeRequestMethod, data):
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", _echo)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    engine: SafeRequestEngine = shared_engine(engine_name)
+    try:
+        return await engine.request(
+            headers={"Accept": "application/json"},
+            method=method,
+            url=f"http://127.0.0.1:{port}{path}",
+            data=data,
+            proxy=None,
+            timeout=10,
+        )
+    finally:
+        await engine.close()
+        await runner.cleanup()
+
+
+@pytest.mark.parametrize("engine_name", HTTP_ENGINES)
+def test_post_body_is_sent_as_json(engine_name):
+    response = asyncio.run(
+        _request(engine_name, "/login", SafeRequestMethod.POST, BODY)
+    )
+
+    assert response.json == {
+        "method": "POST",
+        "content_type": "application/json",
+        "body": BODY,
+    }
+
+
+@pytest.mark.parametrize("engine_name", HTTP_ENGINES)
+def test_get_has_no_body(engine_name):
+    response = asyncio.run(_request(engine_name, "/cards", SafeRequestMethod.GET, None))
+
+    assert response.json["method"] == "GET"
+    assert response.json["body"] is None
+
+
+@pytest.mark.parametrize("engine_name", HTTP_ENGINES)
+def test_error_status_is_kept(engine_name):
+    with pytest.raises(SafeRequestError) as error:
+        asyncio.run(_request(engine_name, "/unauthorized", SafeRequestMethod.GET, None))
+
+    assert error.value.status_code == 401
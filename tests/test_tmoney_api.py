@@ -0,0 +1,263 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from custom_components.transportation.components.card_history import CardHistory
+from custom_components.transportation.services.public_transportation.adapter.tmoney import (
+    api as tmoney,
+)
+from custom_components.transportation.utilities.safe_request import (
+    SafeRequest,
+    SafeRequestError,
+    SafeRequestResponseData,
+    cookie_store,
+)
+
+
+def _response(body: dict, cookies: dict | None = None) -> SafeRequestResponseData:
+    return SafeRequestResponseData(
+        content=json.dumps(body).encode(), status_code=200, cookies=cookies
+    )
+
+
+@pytest.fixture
+def api():
+    client = tmoney.TmoneyApi("user", "secret")
+    cookie_store().clear(client.session_key)
+    yield client
+    cookie_store().clear(client.session_key)
+
+
+class FakeUpstream:
+    """T-money stand-in: accepts the token of the latest login only."""
+
+    def __init__(self, api: tmoney.TmoneyApi):
+        self.api = api
+        self.logins = 0
+        self.calls: list[str] = []
+
+    async def request(self, url: str, **kwargs) -> SafeRequestResponseData:
+        path = url.removeprefix(tmoney.TMONEY_URL).split("?")[0]
+        self.calls.append(path)
+        # Let concurrent callers interleave like real requests would
+        await asyncio.sleep(0)
+
+        if path == tmoney.LOGIN_PATH:
+            self.logins += 1
+            return _response(
+                {
+                    tmoney.RESULT_CODE: tmoney.RESULT_OK,
+                    "data": {"accessToken": f"token-{self.logins}"},
+                },
+                cookies={"JSESSIONID": f"session-{self.logins}"},
+            )
+
+        if cookie_store().token(self.api.session_key) != f"token-{self.logins}":
+            raise SafeRequestError("unauthorized", status_code=401)
+
+        return _response(
+            {
+                tmoney.RESULT_CODE: tmoney.RESULT_OK,
+                "data": {"cardNo": "1234", "balance": "1,500"},
+            }
+        )
+
+
+@pytest.fixture
+def upstream(api, monkeypatch):
+    fake = FakeUpstream(api)
+
+    async def request(self, url, **kwargs):
+        return await fake.request(url, **kwargs)
+
+    monkeypatch.setattr(SafeRequest, "request", request)
+
+    return fake
+
+
+def test_login_is_reused(api, upstream):
+    async def run():
+        await api.async_card("1234")
+        return await api.async_card("1234")
+
+    status = asyncio.run(run())
+
+    assert status.balance == 1500
+    assert upstream.logins == 1
+    assert upstream.calls == [tmoney.LOGIN_PATH, tmoney.CARD_PATH, tmoney.CARD_PATH]
+
+
+def test_concurrent_expired_requests_log_in_once(api, upstream):
+    cookie_store().set_token(api.session_key, "stale")
+
+    async def run():
+        return await asyncio.gather(*[api.async_card("1234") for _ in range(5)])
+
+    statuses = asyncio.run(run())
+
+    assert [status.balance for status in statuses] == [1500] * 5
+    assert upstream.logins == 1
+    assert cookie_store().token(api.session_key) == "token-1"
+
+
+def test_transport_error_keeps_session(api, monkeypatch):
+    cookie_store().set_token(api.session_key, "kept")
+    cookie_store().update_cookies(api.session_key, {"JSESSIONID": "kept"})
+
+    async def request(self, url, **kwargs):
+        raise SafeRequestError("connection reset")
+
+    monkeypatch.setattr(SafeRequest, "request", request)
+
+    with pytest.raises(tmoney.TmoneyError):
+        asyncio.run(api.async_card("1234"))
+
+    assert cookie_store().token(api.session_key) == "kept"
+    assert cookie_store().cookies(api.session_key) == {"JSESSIONID": "kept"}
+
+
+def test_failed_login_keeps_session(api, monkeypatch):
+    cookie_store().set_token(api.session_key, "kept")
+
+    async def request(self, url, **kwargs):
+        if url.startswith(f"{tmoney.TMONEY_URL}{tmoney.LOGIN_PATH}"):
+            return _response({tmoney.RESULT_CODE: "9999", "resultMessage": "wrong"})
+        raise SafeRequestError("unauthorized", status_code=401)
+
+    monkeypatch.setattr(SafeRequest, "request", request)
+
+    with pytest.raises(tmoney.TmoneyAuthError):
+        asyncio.run(api.async_card("1234"))
+
+    assert cookie_store().token(api.session_key) == "kept"
+
+
+def _item(transaction_id: str, used_at: datetime, amount: int = 1500) -> dict:
+    return {
+        "trdSeq": transaction_id,
+        "trdDtm": used_at.astimezone(tmoney.TMONEY_TIMEZONE).strftime("%Y%m%d%H%M%S"),
+        "trdAmt": str(amount),
+        "useLocation": f"Station {transaction_id}",
+        "afterBalance": "5000",
+    }
+
+
+class HistoryPages:
+    """Stubbed _call: the usage history, newest first, paged like T-money."""
+
+    def __init__(self, items: list[dict], has_next: bool | None = None):
+        self.items = items
+        self.has_next = has_next
+        self.params: list[dict] = []
+
+    async def __call__(self, path: str, params: dict) -> dict:
+        assert path == tmoney.HISTORY_PATH
+        self.params.append(params)
+        size = params["size"]
+        start = (params["page"] - 1) * size
+        page = self.items[start : start + size]
+
+        return {
+            "items": page,
+            "hasNext": (
+                self.has_next
+                if self.has_next is not None
+                else start + size < len(self.items)
+            ),
+        }
+
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=tmoney.TMONEY_TIMEZONE)
+
+
+def test_history_stops_at_cursor(api, monkeypatch):
+    taps = [NOW - timedelta(minutes=minutes) for minutes in range(0, 600, 5)]
+    pages = HistoryPages([_item(str(i), used_at) for i, used_at in enumerate(taps)])
+    monkeypatch.setattr(api, "_call", pages)
+    cursor = (taps[60], "60")
+
+    transactions = asyncio.run(
+        api.async_history("1234", since=NOW - timedelta(days=30), cursor=cursor)
+    )
+
+    assert [x.transaction_id for x in transactions] == [str(i) for i in range(61)]
+    # The page holding the cursor is the last one requested
+    assert [params["page"] for params in pages.params] == [1, 2]
+    assert pages.params[0]["fromDate"] == taps[60].strftime("%Y%m%d")
+
+
+def test_history_refetches_taps_of_the_cursor_second(api, monkeypatch):
+    second = NOW.replace(second=30)
+    pages = HistoryPages(
+        [
+            _item("new", second + timedelta(minutes=1)),
+            _item("c", second),
+            _item("b", second),
+            _item("a", second - timedelta(seconds=1)),
+        ]
+    )
+    monkeypatch.setattr(api, "_call", pages)
+
+    transactions = asyncio.run(
+        api.async_history("1234", since=NOW - timedelta(days=30), cursor=(second, "b"))
+    )
+
+    # b is the cursor itself and c shares its second, both come back
+    assert [x.transaction_id for x in transactions] == ["new", "c", "b"]
+
+
+def test_history_merge_drops_refetched_taps(api, monkeypatch):
+    second = NOW.replace(second=30)
+    history = CardHistory()
+    history.add(
+        [
+            tmoney._transaction(_item("a", second - timedelta(seconds=1))),
+            tmoney._transaction(_item("b", second)),
+        ]
+    )
+    pages = HistoryPages(
+        [
+            _item("c", second),
+            _item("b", second),
+            _item("a", second - timedelta(seconds=1)),
+        ]
+    )
+    monkeypatch.setattr(api, "_call", pages)
+
+    transactions = asyncio.run(
+        api.async_history("1234", since=NOW - timedelta(days=30), cursor=history.cursor)
+    )
+
+    assert history.add(transactions) == 1
+    assert [x["id"] for x in history.to_list()] == ["a", "b", "c"]
+
+
+def test_history_stops_after_max_pages(api, monkeypatch, caplog):
+    taps = [NOW - timedelta(seconds=seconds) for seconds in range(500)]
+    pages = HistoryPages(
+        [_item(str(i), used_at) for i, used_at in enumerate(taps)], has_next=True
+    )
+    monkeypatch.setattr(api, "_call", pages)
+
+    transactions = asyncio.run(
+        api.async_history("1234", since=NOW - timedelta(days=1), max_pages=3)
+    )
+
+    assert len(pages.params) == 3
+    assert len(transactions) == 3 * tmoney.HISTORY_PAGE_SIZE
+    assert "stopped after 3 pages" in caplog.text
+
+
+def test_history_first_sync_reads_until_last_page(api, monkeypatch):
+    taps = [NOW - timedelta(hours=hours) for hours in range(70)]
+    pages = HistoryPages([_item(str(i), used_at) for i, used_at in enumerate(taps)])
+    monkeypatch.setattr(api, "_call", pages)
+
+    transactions = asyncio.run(
+        api.async_history("1234", since=NOW - timedelta(days=30))
+    )
+
+    assert len(transactions) == 70
+    assert len(pages.params) == 2